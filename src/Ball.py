@@ -1,14 +1,20 @@
 import pygame
-import random
 import math
 from .GameObjectBase import GameObject
+from .MatchRandom import MatchRandom
+from .Renderer import Renderer
 from .Config import Config
 
 class Ball(GameObject):
     """Pong Ball Object with advanced physics"""
     
+    __slots__ = ('radius', 'base_speed', 'speed', 'color', 'initial_position',
+                 'previous_position', '_step_dt', 'max_bounce_angle', 'air_friction',
+                 'angular_friction', 'magnus_effect_strength', 'rotation_angle',
+                 'trajectory_version', 'sprite_atlas', 'rng')
+    
     def __init__(self, x: float, y: float, size: float = None, 
-                 speed: float = None, mass: float = None, color: str = None):
+                 speed: float = None, mass: float = None, color: str = None, rng: MatchRandom = None):
         # Use config values as defaults
         size = size or Config.BALL_SIZE
         speed = speed or Config.BALL_BASE_SPEED
@@ -22,6 +28,8 @@ class Ball(GameObject):
         self.speed = speed
         self.color = color
         self.initial_position = pygame.Vector2(x, y)
+        self.previous_position = pygame.Vector2(x, y)  # Start of the last step, for swept collisions
+        self._step_dt = 0.0
         self.max_bounce_angle = Config.BALL_MAX_BOUNCE_ANGLE
         
         # Advanced physics properties from config
@@ -29,6 +37,9 @@ class Ball(GameObject):
         self.angular_friction = Config.ANGULAR_FRICTION
         self.magnus_effect_strength = Config.MAGNUS_EFFECT_STRENGTH
         self.rotation_angle = 0.0  # Visual rotation for drawing
+        self.trajectory_version = 0  # Bumped on every serve, bounce, hit or speed change
+        self.sprite_atlas = None  # Optional BallSpriteAtlas, draws the ball with a single blit
+        self.rng = rng or MatchRandom()  # Serve directions, Game shares its match RNG
         
         # Initialize with random direction
         self.reset_ball()
@@ -36,15 +47,17 @@ class Ball(GameObject):
     def reset_ball(self):
         """Reset ball to center with random direction and no spin"""
         self.position = self.initial_position.copy()
+        self.previous_position = self.position.copy()
         self.angular_velocity = 0.0
         self.rotation_angle = 0.0
+        self.trajectory_version += 1
         
         # Reset speed to original base speed - this is critical!
         self.speed = self.base_speed
         
         # Random direction (left or right)
-        direction = random.choice([-1, 1])
-        angle = random.uniform(-30, 30)  # Random angle between -30 and 30 degrees
+        direction = self.rng.choice([-1, 1])
+        angle = self.rng.uniform(-30, 30)  # Random angle between -30 and 30 degrees
         angle_rad = math.radians(angle)
         
         self.velocity.x = direction * self.speed * math.cos(angle_rad)
@@ -65,7 +78,9 @@ class Ball(GameObject):
         # Update angular properties
         self._update_angular_properties(dt)
         
-        # Move the ball
+        # Move the ball, remembering where the step started for swept collisions
+        self.previous_position = self.position.copy()
+        self._step_dt = dt
         self.move(dt)
         
         # Get screen dimensions and walls from kwargs
@@ -76,16 +91,21 @@ class Ball(GameObject):
         wall_hit = False
         
         # Bounce off top and bottom walls
-        if self.position.y <= wall_thickness or self.position.y + self.height >= screen_height - wall_thickness:
+        min_y = wall_thickness
+        max_y = screen_height - wall_thickness - self.height
+        if self.position.y <= min_y or self.position.y >= max_y:
             self.velocity.y *= -1
             # Reverse some of the spin when hitting walls
             self.angular_velocity *= -Config.WALL_SPIN_REDUCTION
+            self.trajectory_version += 1
             wall_hit = True
-            # Keep ball within bounds
-            if self.position.y <= wall_thickness:
-                self.position.y = wall_thickness
+            # Reflect the distance travelled past the wall so the bounce happens
+            # at the exact contact point, then keep ball within bounds
+            if self.position.y <= min_y:
+                self.position.y = min_y + (min_y - self.position.y)
             else:
-                self.position.y = screen_height - wall_thickness - self.height
+                self.position.y = max_y - (self.position.y - max_y)
+            self.position.y = max(min_y, min(self.position.y, max_y))
         
         return wall_hit
     
@@ -125,24 +145,47 @@ class Ball(GameObject):
         elif self.rotation_angle < -2 * math.pi:
             self.rotation_angle += 2 * math.pi
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, renderer: Renderer):
         """Draw the ball as a circle with rotation indicator"""
+        if self.sprite_atlas:
+            self.sprite_atlas.draw(renderer, self)
+            return
+        
         center_x = int(self.position.x + self.radius)
         center_y = int(self.position.y + self.radius)
         
         # Draw main ball
-        pygame.draw.circle(screen, self.color, (center_x, center_y), self.radius)
+        renderer.circle(self.color, (center_x, center_y), self.radius)
         
         # Draw a small indicator to show rotation
         if abs(self.angular_velocity) > Config.SPIN_INDICATOR_MIN_THRESHOLD:  # Only show if spinning significantly
             indicator_length = self.radius * 0.6
             end_x = center_x + indicator_length * math.cos(self.rotation_angle)
             end_y = center_y + indicator_length * math.sin(self.rotation_angle)
-            pygame.draw.line(screen, (255, 255, 255), (center_x, center_y), 
-                           (int(end_x), int(end_y)), 2)
+            renderer.line((255, 255, 255), (center_x, center_y), 
+                          (int(end_x), int(end_y)), 2)
+    
+    def scaled_copy(self, scale: float) -> 'Ball':
+        """Detached copy in render pixels, including the drawn radius"""
+        clone = super().scaled_copy(scale)
+        clone.radius = max(1, round(self.radius * scale))
+        return clone
     
     def collide(self, other: 'GameObject') -> bool:
-        """Handle collision with other game objects (mainly paddles)"""
+        """Handle collision with other game objects (mainly paddles)
+        
+        The last step's motion is swept against the other object, so a fast
+        ball that would pass through a paddle within one step still hits it
+        at the exact contact point.
+        """
+        time_of_impact = self.sweep(other)
+        if time_of_impact is not None:
+            # Rewind to the contact point, bounce, then use up the rest of the step
+            self.position = self.previous_position.lerp(self.position, time_of_impact)
+            self._handle_paddle_collision(other)
+            self.position += self.velocity * (self._step_dt * (1.0 - time_of_impact))
+            return True
+        
         if not self.get_rect().colliderect(other.get_rect()):
             return False
         
@@ -150,6 +193,42 @@ class Ball(GameObject):
         self._handle_paddle_collision(other)
         return True
     
+    def sweep(self, other: 'GameObject'):
+        """Swept AABB test of the last step's motion against another object
+        
+        Args:
+            other: Object to test against, treated as static at its current position
+            
+        Returns:
+            Time of impact as a fraction of the step (0 to 1), or None if the
+            ball did not enter the object during the step
+        """
+        start = self.previous_position
+        delta = self.position - start
+        
+        # Minkowski sum: the ball's top-left corner against the other rect grown by the ball size
+        t_enter, t_exit = 0.0, 1.0
+        for origin, distance, low, high in (
+            (start.x, delta.x, other.position.x - self.width, other.position.x + other.width),
+            (start.y, delta.y, other.position.y - self.height, other.position.y + other.height),
+        ):
+            if distance == 0:
+                if origin <= low or origin >= high:
+                    return None
+                continue
+            
+            t_low = (low - origin) / distance
+            t_high = (high - origin) / distance
+            t_enter = max(t_enter, min(t_low, t_high))
+            t_exit = min(t_exit, max(t_low, t_high))
+            if t_enter >= t_exit:
+                return None
+        
+        # Overlapping from the start of the step is left to the overlap test
+        if t_enter <= 0.0:
+            return None
+        return t_enter
+    
     def _handle_paddle_collision(self, paddle):
         """Handle collision with paddle - realistic Pong physics with spin"""
         # Get collision point relative to paddle center
@@ -178,6 +257,8 @@ class Ball(GameObject):
             # Limit maximum spin
             self.angular_velocity = max(-Config.MAX_BALL_SPIN, min(Config.MAX_BALL_SPIN, self.angular_velocity))
         
+        self.trajectory_version += 1
+        
         # Move ball away from paddle to prevent sticking
         if direction > 0:  # Hit left paddle, move right
             self.position.x = paddle.position.x + paddle.width + 1
@@ -196,5 +277,6 @@ class Ball(GameObject):
         """Increase ball speed (for progressive difficulty)
         Only affects current velocity, not the base speed that's used for resets"""
         self.velocity *= factor
+        self.trajectory_version += 1
         # Update current speed for collision calculations, but don't modify base_speed
         self.speed = self.velocity.length() if self.velocity.length() > 0 else self.base_speed
\ No newline at end of file
@@ -0,0 +1,264 @@
+import math
+import numpy as np
+from .Config import Config
+
+class BallBatch:
+    """Struct-of-arrays ball engine that steps N balls at once with NumPy
+
+    Applies the same rules as Ball.update (Magnus effect, air and angular
+    friction, wall bounces with WALL_SPIN_REDUCTION) and
+    Ball._handle_paddle_collision, but on whole arrays instead of one
+    pygame.Vector2 at a time. Meant for Monte Carlo studies of spin and
+    speed growth over many rallies.
+    """
+
+    def __init__(self, count: int, x: float, y: float, size: int = None,
+                 speed: float = None, mass: float = None, rng: np.random.Generator = None):
+        """Initialize N balls at the same start position
+
+        Args:
+            count: Number of balls in the batch
+            x: Start x position (top-left, like Ball)
+            y: Start y position (top-left, like Ball)
+            size: Ball size, defaults to Config.BALL_SIZE
+            speed: Base speed, defaults to Config.BALL_BASE_SPEED
+            mass: Ball mass, defaults to Config.BALL_MASS
+            rng: NumPy random generator used for serves
+        """
+        # Use config values as defaults
+        self.size = size or Config.BALL_SIZE
+        self.radius = self.size // 2
+        self.base_speed = speed or Config.BALL_BASE_SPEED
+        self.mass = mass or Config.BALL_MASS
+        self.count = count
+        self.initial_position = np.array([x, y], dtype=np.float64)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Per-ball state
+        self.positions = np.empty((count, 2), dtype=np.float64)
+        self.previous_positions = np.empty((count, 2), dtype=np.float64)
+        self.velocities = np.zeros((count, 2), dtype=np.float64)
+        self.angular_velocities = np.zeros(count, dtype=np.float64)
+        self.rotation_angles = np.zeros(count, dtype=np.float64)
+        self.speeds = np.empty(count, dtype=np.float64)
+        self._step_dt = 0.0
+
+        self.reset_balls()
+
+    @classmethod
+    def from_balls(cls, balls: list) -> 'BallBatch':
+        """Build a batch holding a copy of the state of existing Ball objects"""
+        first = balls[0]
+        batch = cls(len(balls), first.initial_position.x, first.initial_position.y,
+                    first.width, first.base_speed, first.mass)
+        for i, ball in enumerate(balls):
+            batch.positions[i] = (ball.position.x, ball.position.y)
+            batch.previous_positions[i] = (ball.previous_position.x, ball.previous_position.y)
+            batch.velocities[i] = (ball.velocity.x, ball.velocity.y)
+            batch.angular_velocities[i] = ball.angular_velocity
+            batch.rotation_angles[i] = ball.rotation_angle
+            batch.speeds[i] = ball.speed
+        return batch
+
+    def reset_balls(self, mask: np.ndarray = None):
+        """Reset balls to center with random direction and no spin (see Ball.reset_ball)
+
+        Args:
+            mask: Optional boolean array selecting which balls to reset
+        """
+        if mask is None:
+            mask = np.ones(self.count, dtype=bool)
+        n = int(np.count_nonzero(mask))
+        if n == 0:
+            return
+
+        self.positions[mask] = self.initial_position
+        self.previous_positions[mask] = self.initial_position
+        self.angular_velocities[mask] = 0.0
+        self.rotation_angles[mask] = 0.0
+        self.speeds[mask] = self.base_speed
+
+        # Random direction (left or right) and angle between -30 and 30 degrees
+        direction = self.rng.choice([-1.0, 1.0], size=n)
+        angle_rad = np.radians(self.rng.uniform(-30, 30, size=n))
+        self.velocities[mask, 0] = direction * self.base_speed * np.cos(angle_rad)
+        self.velocities[mask, 1] = self.base_speed * np.sin(angle_rad)
+
+    def step(self, dt: float, screen_height: int = 720, wall_thickness: int = 20,
+             speed_increase_factor: float = 1.0) -> np.ndarray:
+        """Advance every ball by dt, mirroring Ball.update
+
+        Args:
+            dt: Delta time in seconds
+            screen_height: Height of the playfield
+            wall_thickness: Thickness of top/bottom walls
+            speed_increase_factor: Speed boost applied on wall hits, as Game.update does
+
+        Returns:
+            Boolean array, True for balls that hit a wall this step
+        """
+        self._apply_magnus_effect(dt)
+        self._apply_air_friction(dt)
+        self._update_angular_properties(dt)
+
+        # Move the balls, remembering where the step started for swept collisions
+        self.previous_positions[:] = self.positions
+        self._step_dt = dt
+        self.positions += self.velocities * dt
+
+        # Bounce off top and bottom walls
+        min_y = wall_thickness
+        max_y = screen_height - wall_thickness - self.size
+        y = self.positions[:, 1]
+        hit_top = y <= min_y
+        hit_bottom = ~hit_top & (y >= max_y)
+        wall_hit = hit_top | hit_bottom
+        self.velocities[wall_hit, 1] *= -1
+        self.angular_velocities[wall_hit] *= -Config.WALL_SPIN_REDUCTION
+        # Reflect the distance travelled past the wall, then keep balls within bounds
+        y[hit_top] = 2 * min_y - y[hit_top]
+        y[hit_bottom] = 2 * max_y - y[hit_bottom]
+        np.clip(y, min_y, max_y, out=y)
+
+        if speed_increase_factor != 1.0:
+            self.increase_speed(speed_increase_factor, wall_hit)
+        return wall_hit
+
+    def _apply_magnus_effect(self, dt: float):
+        """Apply Magnus force perpendicular to velocity for spinning balls"""
+        speed = np.hypot(self.velocities[:, 0], self.velocities[:, 1])
+        active = (np.abs(self.angular_velocities) > Config.MAGNUS_MIN_SPIN_THRESHOLD) & (speed > 0)
+        if not active.any():
+            return
+
+        # Perpendicular of the normalized velocity times |v| is just (-vy, vx),
+        # so the force is (-vy, vx) * spin * strength / mass
+        magnitude = self.angular_velocities * Config.MAGNUS_EFFECT_STRENGTH / self.mass
+        # apply_force divides by mass again (F = ma)
+        scale = np.where(active, magnitude / self.mass * dt, 0.0)
+        vx = self.velocities[:, 0].copy()
+        self.velocities[:, 0] -= self.velocities[:, 1] * scale
+        self.velocities[:, 1] += vx * scale
+
+    def _apply_air_friction(self, dt: float):
+        """Apply air friction to slow down the balls"""
+        self.velocities *= Config.AIR_FRICTION ** dt
+
+    def _update_angular_properties(self, dt: float):
+        """Update angular velocities and rotation angles"""
+        self.angular_velocities *= Config.ANGULAR_FRICTION ** dt
+        self.rotation_angles += self.angular_velocities * dt
+
+        # Keep rotation angle in reasonable range
+        two_pi = 2 * math.pi
+        self.rotation_angles[self.rotation_angles > two_pi] -= two_pi
+        self.rotation_angles[self.rotation_angles < -two_pi] += two_pi
+
+    def collide_paddle(self, x: float, y: float, width: int, height: int,
+                       velocity_y=0.0, max_speed: float = None,
+                       friction_coefficient: float = None) -> np.ndarray:
+        """Bounce balls off a paddle, mirroring Ball.collide with a Paddle
+
+        Paddle arguments may be scalars (one paddle shared by the batch) or
+        arrays of length N (one paddle per ball).
+
+        Returns:
+            Boolean array, True for balls that hit the paddle
+        """
+        max_speed = max_speed or Config.PADDLE_MAX_SPEED
+        if friction_coefficient is None:
+            friction_coefficient = Config.PADDLE_FRICTION_COEFFICIENT
+
+        # Swept test of the last step's motion, as in Ball.sweep
+        time_of_impact = self.sweep(x, y, width, height)
+        swept = ~np.isnan(time_of_impact)
+
+        # Same overlap test as pygame.Rect.colliderect (coordinates truncated to int)
+        bx = np.trunc(self.positions[:, 0])
+        by = np.trunc(self.positions[:, 1])
+        px = np.trunc(x)
+        py = np.trunc(y)
+        hit = swept | ((bx < px + width) & (px < bx + self.size) & (by < py + height) & (py < by + self.size))
+        if not hit.any():
+            return hit
+
+        # Rewind swept balls to their contact point
+        t = time_of_impact[swept, None]
+        self.positions[swept] = self.previous_positions[swept] + (self.positions[swept] - self.previous_positions[swept]) * t
+
+        # Relative intersection (-1 to 1, where 0 is paddle center)
+        paddle_center_y = np.broadcast_to(np.asarray(y, dtype=np.float64) + height / 2, hit.shape)[hit]
+        half_height = np.broadcast_to(np.asarray(height, dtype=np.float64) / 2, hit.shape)[hit]
+        ball_center_y = self.positions[hit, 1] + self.radius
+        relative_intersect_y = np.clip((ball_center_y - paddle_center_y) / half_height, -1, 1)
+        bounce_angle = relative_intersect_y * math.radians(Config.BALL_MAX_BOUNCE_ANGLE)
+
+        # Reverse horizontal direction
+        direction = np.where(self.velocities[hit, 0] < 0, 1.0, -1.0)
+        speed = self.speeds[hit]
+        self.velocities[hit, 0] = direction * speed * np.cos(bounce_angle)
+        self.velocities[hit, 1] = speed * np.sin(bounce_angle)
+
+        # Spin from paddle contact point and movement (see Paddle.get_impact_spin)
+        paddle_velocity_factor = np.broadcast_to(np.asarray(velocity_y, dtype=np.float64) / max_speed, hit.shape)[hit]
+        spin_intensity = relative_intersect_y * 0.7 + paddle_velocity_factor * 0.3
+        spin = spin_intensity * Config.PADDLE_MAX_IMPACT_SPIN * friction_coefficient
+        self.angular_velocities[hit] = np.clip(self.angular_velocities[hit] + spin,
+                                               -Config.MAX_BALL_SPIN, Config.MAX_BALL_SPIN)
+
+        # Move balls away from paddle to prevent sticking
+        paddle_x = np.broadcast_to(np.asarray(x, dtype=np.float64), hit.shape)[hit]
+        paddle_width = np.broadcast_to(np.asarray(width, dtype=np.float64), hit.shape)[hit]
+        self.positions[hit, 0] = np.where(direction > 0, paddle_x + paddle_width + 1,
+                                          paddle_x - self.size - 1)
+
+        # Swept balls use up the rest of the step after bouncing
+        self.positions[swept] += self.velocities[swept] * (self._step_dt * (1.0 - t))
+        return hit
+
+    def sweep(self, x: float, y: float, width: int, height: int) -> np.ndarray:
+        """Swept AABB test of the last step's motion against a rect, as in Ball.sweep
+
+        Returns:
+            Time of impact per ball as a fraction of the step, NaN where the
+            ball did not enter the rect during the step
+        """
+        start = self.previous_positions
+        delta = self.positions - start
+        # Minkowski sum: ball top-left corners against the rect grown by the ball size
+        shape = (self.count,)
+        x = np.broadcast_to(np.asarray(x, dtype=np.float64), shape)
+        y = np.broadcast_to(np.asarray(y, dtype=np.float64), shape)
+        low = np.column_stack((x - self.size, y - self.size))
+        high = np.column_stack((x + width, y + height))
+
+        # Slab test on both axes; an axis without motion either always or never overlaps
+        moving = delta != 0
+        inside = (start > low) & (start < high)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_low = (low - start) / delta
+            t_high = (high - start) / delta
+        axis_enter = np.where(moving, np.minimum(t_low, t_high), np.where(inside, -np.inf, np.inf))
+        axis_exit = np.where(moving, np.maximum(t_low, t_high), np.where(inside, np.inf, -np.inf))
+
+        t_enter = np.maximum(axis_enter.max(axis=1), 0.0)
+        t_exit = np.minimum(axis_exit.min(axis=1), 1.0)
+        # Overlapping from the start of the step is left to the overlap test
+        hit = (t_enter < t_exit) & (t_enter > 0.0)
+        return np.where(hit, t_enter, np.nan)
+
+    def off_screen(self, screen_width: int) -> np.ndarray:
+        """Return -1 for balls off the left edge, 1 for the right edge, 0 otherwise"""
+        x = self.positions[:, 0]
+        side = np.zeros(self.count, dtype=np.int8)
+        side[x + self.size < 0] = -1
+        side[x > screen_width] = 1
+        return side
+
+    def increase_speed(self, factor: float, mask: np.ndarray = None):
+        """Scale velocities by factor and refresh speeds (see Ball.increase_speed)"""
+        if mask is None:
+            mask = np.ones(self.count, dtype=bool)
+        self.velocities[mask] *= factor
+        speed = np.hypot(self.velocities[mask, 0], self.velocities[mask, 1])
+        self.speeds[mask] = np.where(speed > 0, speed, self.base_speed)
@@ -0,0 +1,79 @@
+import math
+import pygame
+from typing import List
+from .Config import Config
+from .Renderer import Renderer, SurfaceRenderer
+
+class BallSpriteAtlas:
+    """Pre-rendered ball sprites so drawing a ball is a single blit
+
+    Frame 0 is the plain ball. Frames 1..N show the spin indicator at N
+    evenly spaced rotation angles. The frames are built on first use and
+    rebuilt whenever the ball color or size they are asked to draw changes.
+    """
+
+    INDICATOR_COLOR = (255, 255, 255)
+
+    def __init__(self, rotation_steps: int = None):
+        """Initialize sprite atlas
+
+        Args:
+            rotation_steps: Number of quantized indicator angles, defaults
+                to Config.BALL_SPRITE_ROTATION_STEPS
+        """
+        self.rotation_steps = rotation_steps or Config.BALL_SPRITE_ROTATION_STEPS
+        self.frames: List[pygame.Surface] = []
+        self._key = None
+        self._center = 0
+
+    def _transparent_color(self, color) -> pygame.Color:
+        """Pick a colorkey that differs from the ball and indicator colors"""
+        used = {tuple(pygame.Color(color)), tuple(pygame.Color(self.INDICATOR_COLOR))}
+        for candidate in ((255, 0, 255), (0, 255, 0), (0, 0, 1)):
+            if tuple(pygame.Color(candidate)) not in used:
+                return pygame.Color(candidate)
+
+    def _build(self, color, radius: int):
+        """Render the plain ball and every indicator angle"""
+        # One spare pixel around the circle for the 2px indicator line
+        center = radius + 1
+        frame_size = 2 * center + 1
+        transparent = self._transparent_color(color)
+        indicator_length = radius * 0.6
+
+        frames = []
+        for frame in range(self.rotation_steps + 1):
+            surface = pygame.Surface((frame_size, frame_size))
+            surface.fill(transparent)
+            layer = SurfaceRenderer(surface)
+            layer.circle(color, (center, center), radius)
+            if frame > 0:
+                # Same indicator as Ball.draw, at this frame's quantized angle
+                angle = (frame - 1) * 2 * math.pi / self.rotation_steps
+                end_x = center + indicator_length * math.cos(angle)
+                end_y = center + indicator_length * math.sin(angle)
+                layer.line(self.INDICATOR_COLOR, (center, center), (int(end_x), int(end_y)), 2)
+
+            # Colorkey transparency (nothing is antialiased) with RLE for fast blits
+            surface.set_colorkey(transparent, pygame.RLEACCEL)
+            frames.append(surface)
+
+        self.frames = frames
+        self._center = center
+
+    def draw(self, renderer: Renderer, ball):
+        """Blit the frame matching the ball's spin and rotation angle"""
+        key = (ball.color, ball.radius)
+        if key != self._key:
+            self._build(ball.color, ball.radius)
+            self._key = key
+
+        frame = 0
+        if abs(ball.angular_velocity) > Config.SPIN_INDICATOR_MIN_THRESHOLD:
+            step = round(ball.rotation_angle / (2 * math.pi) * self.rotation_steps)
+            frame = 1 + step % self.rotation_steps
+
+        # Same integer center as Ball.draw
+        center_x = int(ball.position.x + ball.radius)
+        center_y = int(ball.position.y + ball.radius)
+        renderer.blit(self.frames[frame], (center_x - self._center, center_y - self._center))
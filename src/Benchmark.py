@@ -0,0 +1,254 @@
+"""
+Microbenchmarks
+===============
+
+Times the per-tick hot paths - Ball.update, Ball.collide, Paddle.update,
+Bot.update_ai, the GameUI score and net drawing and a full headless
+Game.update - in fixed scenarios, including stress cases such as a ball at
+maximum spin and one at a high compounded speed.
+
+Results can be saved as a baseline and later runs compared against it;
+any benchmark slower than the baseline by more than the threshold is
+flagged as a regression. Baselines are machine specific, so save one on
+the machine you compare on.
+
+Usage:
+    python -m src.Benchmark --save          # record benchmark_baseline.json
+    python -m src.Benchmark --threshold 0.1 # compare, exit 1 on regressions
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+# The UI benchmarks draw off-screen, no window is needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame import Vector2
+from .game import Game
+from .Ball import Ball
+from .Player import Player
+from .Bot import Bot
+from .GameUI import GameUI
+from .Renderer import SurfaceRenderer
+from .InterceptPredictor import InterceptPredictor
+from .Controller import BotController
+from .Config import Config
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DT = 1.0 / 120
+
+# Ball speed after ten hits at the Hard speed boost
+HIGH_SPEED = Config.BALL_BASE_SPEED * Config.SPEED_BOOST_HARD ** 10
+
+
+def _ball_update(angular_velocity: float = 0.0, speed: float = None) -> Callable[[], None]:
+    """Ball.update from mid-screen, restored before every call"""
+    ball = Ball(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
+    start = Vector2(ball.position)
+    velocity = Vector2(1, 0.5).normalize() * (speed or ball.base_speed)
+
+    def step():
+        ball.position.update(start)
+        ball.velocity.update(velocity)
+        ball.angular_velocity = angular_velocity
+        ball.update(DT, screen_height=Config.SCREEN_HEIGHT, wall_thickness=Config.WALL_THICKNESS)
+    return step
+
+
+def _ball_collide(speed: float = None) -> Callable[[], None]:
+    """Ball.collide for a ball that crossed the right paddle's face during the last step"""
+    paddle = Player("right", Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+    ball = Ball(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
+    speed = speed or ball.base_speed
+    end = Vector2(paddle.position.x + 2, paddle.position.y + paddle.height / 2 - ball.height / 2)
+    start = end - Vector2(speed * DT, 0)
+
+    def step():
+        ball.previous_position.update(start)
+        ball.position.update(end)
+        ball.velocity.update(speed, 0)
+        ball.angular_velocity = 0.0
+        ball._step_dt = DT
+        ball.collide(paddle)
+    return step
+
+
+def _paddle_update() -> Callable[[], None]:
+    """Paddle.update with input, restored before every call"""
+    paddle = Player("left", Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+    start = Vector2(paddle.position)
+    direction = Vector2(0, 1)
+
+    def step():
+        paddle.position.update(start)
+        paddle.velocity.update(0, 0)
+        paddle.update(DT, direction=direction)
+    return step
+
+
+def _bot_update_ai(physics_prediction: bool = False) -> Callable[[], None]:
+    """Bot.update_ai reacting to a ball approaching it, prediction not cached"""
+    predictor = InterceptPredictor() if physics_prediction else None
+    bot = Bot("right", Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT, difficulty="Hard", predictor=predictor)
+    ball = Ball(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
+    ball.velocity.update(ball.base_speed * 0.8, ball.base_speed * 0.6)
+    ball.angular_velocity = Config.MAX_BALL_SPIN
+    start = Vector2(bot.position)
+
+    def step():
+        bot.position.update(start)
+        bot.velocity.update(0, 0)
+        bot.reaction_timer = bot.reaction_time
+        # New trajectory every call, so the predictor does the full work
+        ball.trajectory_version += 1
+        bot.update_ai(DT, ball)
+    return step
+
+
+def _ui(draw: str) -> Callable[[], None]:
+    """A GameUI drawing call on an off-screen surface"""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    ui = GameUI(Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+    renderer = SurfaceRenderer(pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)))
+    scores = [7, 9]
+    if draw == "scores":
+        return lambda: ui.draw_scores(renderer, scores, True)
+    return lambda: ui.draw_net(renderer)
+
+
+def _game_update() -> Callable[[], None]:
+    """One headless Bot-vs-Bot Game.update tick, restarting finished matches"""
+    game = Game(headless=True)
+
+    def start():
+        game.start_match(BotController("Hard"), BotController("Medium"), seed=0)
+    start()
+
+    def step():
+        if game.winner is not None:
+            start()
+        game.update(DT)
+    return step
+
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], None]]] = {
+    "ball_update": lambda: _ball_update(),
+    "ball_update_max_spin": lambda: _ball_update(angular_velocity=Config.MAX_BALL_SPIN),
+    "ball_update_high_speed": lambda: _ball_update(speed=HIGH_SPEED),
+    "ball_collide": lambda: _ball_collide(),
+    "ball_collide_high_speed": lambda: _ball_collide(speed=HIGH_SPEED),
+    "paddle_update": _paddle_update,
+    "bot_update_ai": lambda: _bot_update_ai(),
+    "bot_update_ai_physics_prediction": lambda: _bot_update_ai(physics_prediction=True),
+    "ui_draw_scores": lambda: _ui("scores"),
+    "ui_draw_net": lambda: _ui("net"),
+    "game_update": _game_update,
+}
+
+
+def time_benchmark(step: Callable[[], None], repeat: int = 5, min_time: float = 0.05) -> float:
+    """Best time per call over several rounds, in seconds
+
+    Args:
+        step: The call to time
+        repeat: Number of timed rounds
+        min_time: Minimum duration of a round, the call count is scaled to reach it
+    """
+    # Calibrate the number of calls per round
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            step()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            step()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_benchmarks(names: List[str] = None, repeat: int = 5) -> Dict[str, float]:
+    """Run benchmarks and return nanoseconds per call by name"""
+    results = {}
+    for name in names or BENCHMARKS:
+        results[name] = time_benchmark(BENCHMARKS[name](), repeat) * 1e9
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[Dict]:
+    """Compare results against a baseline
+
+    Returns:
+        One row per benchmark with the relative change and a regression flag
+    """
+    rows = []
+    for name, ns in results.items():
+        base = baseline.get(name)
+        change = (ns - base) / base if base else None
+        rows.append({"name": name, "ns": ns, "baseline_ns": base, "change": change,
+                     "regression": change is not None and change > threshold})
+    return rows
+
+
+def format_report(rows: List[Dict]) -> str:
+    """Render the comparison as a plain text table"""
+    lines = [f"{'BENCHMARK':<34} {'NS/CALL':>10} {'BASELINE':>10} {'CHANGE':>8}"]
+    for row in rows:
+        baseline = f"{row['baseline_ns']:.0f}" if row["baseline_ns"] else "-"
+        change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(f"{row['name']:<34} {row['ns']:>10.0f} {baseline:>10} {change:>8}{flag}")
+    return "\n".join(lines)
+
+
+def load_baseline(path: str) -> Optional[Dict[str, float]]:
+    """Read a saved baseline, None if there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def main():
+    """Command line entry"""
+    parser = argparse.ArgumentParser(description="Time physics, AI and UI hot paths against a stored baseline")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"benchmarks to run (default: all): {', '.join(BENCHMARKS)}")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative slowdown flagged as a regression (default: 0.15)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per benchmark")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.names, args.repeat)
+    rows = compare(results, load_baseline(args.baseline) or {}, args.threshold)
+    print(format_report(rows))
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({"unit": "ns", "results": results}, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif any(row["regression"] for row in rows):
+        print(f"\nRegressions beyond {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,22 @@
 import pygame
 from pygame import Vector2
 from .Paddle import Paddle
+from .InterceptPredictor import InterceptPredictor
+from .MatchRandom import MatchRandom
 from .Config import Config
 
 class Bot(Paddle):
     """AI Bot class for Pong with configurable difficulty"""
+    
+    __slots__ = ('difficulty', 'side', 'screen_width', 'screen_height', 'predictor',
+                 'reaction_time', 'prediction_accuracy', 'max_ai_speed', 'paddle_center_bias',
+                 'last_ball_position', 'target_y', 'reaction_timer', 'rng')
 
     def __init__(self, side: str, screen_width: int, screen_height: int,
                  difficulty: str = "Medium", paddle_width: int = None, 
                  paddle_height: int = None, paddle_margin: int = 20, 
-                 speed: int = None, color = None, wall_thickness: int = None):
+                 speed: int = None, color = None, wall_thickness: int = None,
+                 predictor: InterceptPredictor = None, rng: MatchRandom = None):
         """Initialize bot with automatic positioning and AI settings
         
         Args:
@@ -23,6 +30,9 @@ class Bot(Paddle):
             speed: Movement speed
             color: Paddle color
             wall_thickness: Thickness of top/bottom walls
+            predictor: Optional physics-based intercept predictor; without it
+                the bot uses a linear extrapolation folded off the walls
+            rng: Source of the prediction errors, Game reseeds it per match
         """
         # Use config values as defaults
         paddle_width = paddle_width or Config.PADDLE_WIDTH
@@ -53,6 +63,8 @@ class Bot(Paddle):
         self.side = side
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.predictor = predictor
+        self.rng = rng or MatchRandom()
         
         # Configure AI behavior based on difficulty
         self._configure_ai_difficulty()
@@ -92,6 +104,7 @@ class Bot(Paddle):
             ball: Ball object to track
         """
         if ball is None:
+            self.last_input = Paddle.INPUT_SKIP
             return
         
         # Update reaction timer
@@ -99,6 +112,8 @@ class Bot(Paddle):
         
         # Only react if enough time has passed (simulates human reaction time)
         if self.reaction_timer < self.reaction_time:
+            # The paddle isn't updated at all this tick
+            self.last_input = Paddle.INPUT_SKIP
             return
         
         ball_pos = Vector2(ball.position.x, ball.position.y)
@@ -112,25 +127,30 @@ class Bot(Paddle):
             ball_moving_towards_us = True
         
         if ball_moving_towards_us:
-            # Predict where the ball will be when it reaches our x position
-            paddle_center_x = self.position.x + self.width / 2
-            time_to_reach = abs(ball_pos.x - paddle_center_x) / abs(ball_vel.x) if ball_vel.x != 0 else 0
+            if self.predictor:
+                # Integrated once per trajectory event, cached in between
+                predicted_y = self.predictor.predict(ball, self, self.screen_height)
+            else:
+                # Predict where the ball will be when it reaches our x position
+                paddle_center_x = self.position.x + self.width / 2
+                time_to_reach = abs(ball_pos.x - paddle_center_x) / abs(ball_vel.x) if ball_vel.x != 0 else 0
+                predicted_y = ball_pos.y + ball_vel.y * time_to_reach
             
             # Predict ball position with some inaccuracy based on difficulty
-            predicted_y = ball_pos.y + ball_vel.y * time_to_reach
             
             # Add some randomness based on prediction accuracy
             if self.prediction_accuracy < 1.0:
                 error_range = (1.0 - self.prediction_accuracy) * 100
-                error = (hash(int(ball_pos.x + ball_pos.y)) % int(error_range * 2)) - error_range
+                error = self.rng.randrange(int(error_range * 2)) - error_range
                 predicted_y += error
             
-            # Account for wall bounces (simplified)
-            while predicted_y < Config.WALL_THICKNESS or predicted_y > self.screen_height - Config.WALL_THICKNESS:
-                if predicted_y < Config.WALL_THICKNESS:
-                    predicted_y = Config.WALL_THICKNESS + (Config.WALL_THICKNESS - predicted_y)
-                elif predicted_y > self.screen_height - Config.WALL_THICKNESS:
-                    predicted_y = (self.screen_height - Config.WALL_THICKNESS) - (predicted_y - (self.screen_height - Config.WALL_THICKNESS))
+            # Account for wall bounces (simplified), the predictor already simulated them
+            if not self.predictor:
+                while predicted_y < Config.WALL_THICKNESS or predicted_y > self.screen_height - Config.WALL_THICKNESS:
+                    if predicted_y < Config.WALL_THICKNESS:
+                        predicted_y = Config.WALL_THICKNESS + (Config.WALL_THICKNESS - predicted_y)
+                    elif predicted_y > self.screen_height - Config.WALL_THICKNESS:
+                        predicted_y = (self.screen_height - Config.WALL_THICKNESS) - (predicted_y - (self.screen_height - Config.WALL_THICKNESS))
             
             self.target_y = predicted_y
         else:
@@ -155,6 +175,22 @@ class Bot(Paddle):
             intensity = min(1.0, abs(y_diff) / 50.0)  # Normalize to 0-1
             direction.y *= intensity
         
+        self.steer(dt, direction)
+        
+        # Reset reaction timer periodically to simulate human-like periodic reactions
+        if self.reaction_timer > self.reaction_time * 2:
+            self.reaction_timer = 0.0
+        
+        # Store ball position for next frame (in place, no new vector per frame)
+        self.last_ball_position.update(ball_pos)
+    
+    def steer(self, dt: float, direction: Vector2):
+        """Move the paddle with the AI speed limitation
+        
+        Args:
+            dt: Delta time in seconds
+            direction: Movement direction, zero for no input
+        """
         # Apply movement with AI speed limitation
         if direction.length() > 0:
             # Temporarily adjust max speed for AI
@@ -169,13 +205,13 @@ class Bot(Paddle):
         else:
             # No movement input - let deceleration handle it
             self.update(dt)
-        
-        # Reset reaction timer periodically to simulate human-like periodic reactions
-        if self.reaction_timer > self.reaction_time * 2:
-            self.reaction_timer = 0.0
-        
-        # Store ball position for next frame
-        self.last_ball_position = ball_pos.copy()
+    
+    def apply_input(self, dt: float, code: int):
+        """Advance one tick from an input code, with the AI speed limitation"""
+        if code == Paddle.INPUT_SKIP:
+            self.last_input = Paddle.INPUT_SKIP
+            return
+        self.steer(dt, self._input_direction(code))
     
     def set_difficulty(self, difficulty: str):
         """Change the bot's difficulty level
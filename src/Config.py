@@ -37,6 +37,7 @@ class Config:
     PADDLE_DECELERATION = 600.0  # Deceleration force when no input (was incorrectly set to 0.85)
     PADDLE_MAX_SPEED = 600.0  # Maximum paddle speed
     PADDLE_FRICTION_COEFFICIENT = 0.15  # How much spin paddle imparts to ball
+    PADDLE_MAX_IMPACT_SPIN = 15.0  # Maximum spin (rad/s) a paddle hit can impart before friction
     
     # Speed Boost Configuration (Difficulty Levels)
     SPEED_BOOST_EASY = 1.10    # 10% speed increase per collision
@@ -48,11 +49,41 @@ class Config:
     SPIN_TRANSFER_EFFICIENCY = 1.0  # How efficiently paddle transfers spin to ball
     WALL_SPIN_REDUCTION = 0.7  # How much spin is reduced on wall bounce
     
+    # Bot Prediction Configuration
+    BOT_PREDICTION_HORIZON = 3.0  # Longest flight (seconds) the predictor will integrate
+    
+    # Headless Simulation Configuration
+    MATCH_MEMORY_BUDGET = 5120  # Max bytes per in-progress headless match (measured ~4.0 KB), see src/MemoryBudget.py
+    SPATIAL_HASH_CELL_SIZE = 128  # Broad phase grid cell size in pixels (see src/EntityRegistry.py)
+    BROAD_PHASE_MIN_PAIRS = 16  # Ball x collider pairs below which every pair is simply tested
+    REPLAY_KEYFRAME_INTERVAL = 600  # Ticks between full-state replay keyframes (5 s at 120 Hz)
+    OBSERVATION_SIZE = (84, 84)  # Pixel observation frame size (see src/PixelObserver.py)
+    
+    # Online Play Configuration (src/Online.py)
+    NET_SNAPSHOT_RATE = 30  # Server state packets per second to each client
+    NET_INPUT_RATE = 60  # Client input packets per second
+    NET_INPUT_REDUNDANCY = 8  # Recent inputs repeated in every input packet to ride out packet loss
+    NET_INPUT_BUFFER = 4  # Queued inputs above this are applied in one tick to catch up
+    NET_TIMEOUT = 10.0  # Seconds without packets before a session is dropped
+    
+    # Frame Profiler Configuration (F3 toggles the HUD)
+    PROFILER_WINDOW = 240  # Recent frames the HUD percentiles are taken over
+    PROFILER_HUD_REFRESH = 0.25  # Seconds between HUD text updates
+    PROFILER_DROP_FACTOR = 1.5  # Frame intervals longer than this many frame budgets count as dropped
+    
     # Game Configuration
     WINNING_SCORE = 11
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
     WALL_THICKNESS = 20
+    RENDER_SCALE = 1.0  # Internal render resolution as a fraction of the window, e.g. 0.5 on weak hardware
+    RENDER_BACKEND = "surface"  # "surface" (software), "texture" (SDL2 GPU textures) or "texture_software", see src/Renderer.py
+    
+    # Simulation Timing Configuration
+    PHYSICS_RATE = 120  # Fixed physics steps per second, independent of the render rate
+    MAX_FRAME_TIME = 0.25  # Longest frame (seconds) fed to the physics after a hitch
+    MENU_IDLE_TIMEOUT = 0.5  # Longest block (seconds) waiting for input on menu and finish screens
+    STARTUP_BUDGET = 1.0  # Max seconds from process start to the first frame or headless tick, see src/StartupTime.py
     
     # Visual Configuration
     BALL_COLOR = (255, 0, 0)  # Red
@@ -61,6 +92,8 @@ class Config:
     BACKGROUND_COLOR = (255, 255, 255)  # Black
     TEXT_COLOR = (255, 255, 255)  # White
     SPIN_INDICATOR_MIN_THRESHOLD = 0.5  # Minimum spin to show visual indicator
+    BALL_SPRITE_ROTATION_STEPS = 64  # Pre-rendered spin indicator angles in the ball sprite atlas
+    TEXT_CACHE_SIZE = 128  # Maximum number of rendered text surfaces kept by GameUI
     
     @classmethod
     def get_speed_boost_factor(cls, difficulty: str) -> float:
@@ -80,17 +113,21 @@ class Config:
         return f"{difficulty} (+{percentage}% speed/hit)"
     
     @classmethod
-    def get_bot_difficulty_display_text(cls, difficulty: str) -> str:
-        """Get display text for bot difficulty including both speed and accuracy"""
-        boost_factor = cls.get_speed_boost_factor(difficulty)
-        speed_percentage = int((boost_factor - 1.0) * 100)
-        
+    def get_bot_accuracy(cls, difficulty: str) -> int:
+        """Get the advertised bot accuracy percentage for a difficulty level"""
         # Bot accuracy percentages based on difficulty
         accuracy_map = {
             "Easy": 60,
             "Medium": 80, 
             "Hard": 95
         }
-        accuracy = accuracy_map.get(difficulty, 80)
+        return accuracy_map.get(difficulty, 80)
+    
+    @classmethod
+    def get_bot_difficulty_display_text(cls, difficulty: str) -> str:
+        """Get display text for bot difficulty including both speed and accuracy"""
+        boost_factor = cls.get_speed_boost_factor(difficulty)
+        speed_percentage = int((boost_factor - 1.0) * 100)
+        accuracy = cls.get_bot_accuracy(difficulty)
         
         return f"{difficulty} (+{speed_percentage}% speed/hit, {accuracy}% bot accuracy)"
@@ -0,0 +1,96 @@
+import pygame
+from abc import ABC, abstractmethod
+from typing import Callable
+from pygame import Vector2
+from .Paddle import Paddle
+from .Player import Player
+from .Bot import Bot
+from .InterceptPredictor import InterceptPredictor
+from .Config import Config
+
+class Controller(ABC):
+    """Source of input for one paddle, polled once per simulation tick"""
+
+    @abstractmethod
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        """Build the paddle this controller knows how to drive
+
+        Args:
+            side: "left" or "right" - which side of the screen
+            screen_width: Width of the game screen
+            screen_height: Height of the game screen
+        """
+        pass
+
+    @abstractmethod
+    def control(self, paddle: Paddle, ball, dt: float):
+        """Advance the paddle by one tick using this controller's input
+
+        Args:
+            paddle: The paddle created by create_paddle
+            ball: Ball object currently in play
+            dt: Delta time in seconds
+        """
+        pass
+
+
+class KeyboardController(Controller):
+    """Human input - reads key states and feeds them to Player.keyListen"""
+
+    def __init__(self, key_source: Callable[[], pygame.key.ScancodeWrapper] = None):
+        """Initialize keyboard controller
+
+        Args:
+            key_source: Callable returning the pressed key states, defaults to
+                pygame.key.get_pressed. Headless runs can pass their own source.
+        """
+        self.key_source = key_source or pygame.key.get_pressed
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        return Player(side, screen_width, screen_height, color=Config.PADDLE_COLOR)
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        paddle.keyListen(self.key_source(), dt)
+
+
+class BotController(Controller):
+    """AI input - lets Bot.update_ai track the ball"""
+
+    def __init__(self, difficulty: str = "Medium", physics_prediction: bool = False):
+        """Initialize bot controller
+
+        Args:
+            difficulty: "Easy", "Medium", or "Hard"
+            physics_prediction: Give the bot an InterceptPredictor instead of
+                the linear wall-folding prediction
+        """
+        self.difficulty = difficulty
+        self.physics_prediction = physics_prediction
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        predictor = InterceptPredictor() if self.physics_prediction else None
+        return Bot(side, screen_width, screen_height, difficulty=self.difficulty,
+                   color=Config.PADDLE_COLOR, predictor=predictor)
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        paddle.update_ai(dt, ball)
+
+
+class ScriptedController(Controller):
+    """Scripted input - a policy returns the vertical direction for each tick"""
+
+    def __init__(self, policy: Callable[[Paddle, object, float], float]):
+        """Initialize scripted controller
+
+        Args:
+            policy: Callable taking (paddle, ball, dt) and returning the
+                vertical direction in [-1, 1] (negative is up, 0 is no input)
+        """
+        self.policy = policy
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        return Player(side, screen_width, screen_height, color=Config.PADDLE_COLOR)
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        direction_y = max(-1.0, min(1.0, self.policy(paddle, ball, dt)))
+        paddle.update(dt, direction=Vector2(0, direction_y))
@@ -0,0 +1,91 @@
+import pygame
+from typing import Iterable, List, Optional
+from .Renderer import SurfaceRenderer
+
+class DirtyRectRenderer:
+    """Gameplay renderer that only redraws the screen regions that changed
+
+    The background, net, walls and score text are kept in a background
+    surface. Each frame the previous areas of the ball and paddles are
+    restored from it, the objects are drawn at their new positions and only
+    the union of old and new areas is pushed with pygame.display.update.
+    Works on the software backend only (Game's SurfaceRenderer).
+    """
+
+    # Extra pixels around each object rect (covers the spin indicator line width)
+    RECT_PADDING = 4
+
+    def __init__(self):
+        self.background: Optional[pygame.Surface] = None
+        self._previous_rects: List[pygame.Rect] = []
+        self._score_rects: List[pygame.Rect] = []
+        self._score_key = None
+        self._playfield_surface: Optional[pygame.Surface] = None
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (e.g. after a menu was shown)"""
+        self.background = None
+
+    def _build_background(self, game, playfield_surface: pygame.Surface, scores, is_single_player: bool):
+        """Take the static playfield layer and add the score text on a copy"""
+        self._playfield_surface = playfield_surface
+
+        self.background = playfield_surface.copy()
+        self._score_rects = game.ui.draw_scores(SurfaceRenderer(self.background), scores, is_single_player)
+        self._score_key = (tuple(scores), is_single_player)
+        self._previous_rects = []
+
+    def _update_scores(self, game, scores, is_single_player: bool) -> List[pygame.Rect]:
+        """Redraw the score text into the background if it changed"""
+        score_key = (tuple(scores), is_single_player)
+        if score_key == self._score_key:
+            return []
+
+        # Clear the old text from the background, then draw the new one
+        old_rects = self._score_rects
+        for rect in old_rects:
+            self.background.blit(self._playfield_surface, rect, rect)
+        self._score_rects = game.ui.draw_scores(SurfaceRenderer(self.background), scores, is_single_player)
+        self._score_key = score_key
+        return old_rects + self._score_rects
+
+    def draw_game(self, game, objects: Iterable, scores, is_single_player: bool) -> Optional[List[pygame.Rect]]:
+        """Draw the gameplay screen
+
+        Args:
+            game: Game providing the renderer, UI and playfield layer
+            objects: Moving objects to draw (the live ones or a snapshot's)
+            scores: Scores to show
+            is_single_player: Score labels for single-player mode
+
+        Returns:
+            The changed screen areas to pass to pygame.display.update, or
+            None when the whole screen was redrawn and should be flipped
+        """
+        renderer = game.renderer
+        screen = renderer.surface
+        # A rebuilt playfield layer (resize or Config change) means a full redraw
+        playfield_surface = game.playfield.get_surface(renderer, game.render_walls())
+        full_redraw = self.background is None or playfield_surface is not self._playfield_surface
+        if full_redraw:
+            self._build_background(game, playfield_surface, scores, is_single_player)
+            screen.blit(self.background, (0, 0))
+            dirty = []
+        else:
+            dirty = self._update_scores(game, scores, is_single_player)
+            dirty.extend(self._previous_rects)
+
+        # Restore the areas under last frame's objects and changed score text
+        for rect in dirty:
+            screen.blit(self.background, rect, rect)
+
+        # Draw moving objects at their new positions
+        current_rects = []
+        for obj in objects:
+            obj.draw(renderer)
+            current_rects.append(obj.get_rect().inflate(self.RECT_PADDING, self.RECT_PADDING))
+        self._previous_rects = current_rects
+
+        if full_redraw:
+            return None
+        return dirty + current_rects
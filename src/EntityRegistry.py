@@ -0,0 +1,110 @@
+from typing import Iterator, List, Optional, Tuple
+from .GameObjectBase import GameObject
+from .SpatialHash import SpatialHash
+from .Config import Config
+
+class EntityRegistry:
+    """Balls and colliders (paddles, obstacles) of an arena with a broad phase
+
+    Colliders are inserted into a SpatialHash once per step and each ball
+    only runs the narrow phase (Ball.collide) against colliders near the
+    box its last step swept, so collision checks grow with the number of
+    entities rather than with balls x colliders.
+
+    The first two colliders are the match paddles (see set_paddles); more
+    paddles or obstacles can be added with add_collider. Colliders are
+    tested in the order they were added, as a plain loop over them would.
+    With only a few possible pairs (the classic one ball and two paddles)
+    the grid costs more than it saves, and every collider is a candidate.
+    """
+
+    def __init__(self, cell_size: float = None):
+        """Initialize registry
+
+        Args:
+            cell_size: Broad phase grid cell size, defaults to Config.SPATIAL_HASH_CELL_SIZE
+        """
+        self.balls: List[GameObject] = []
+        # (collider, side) - side is 0/1 for paddles that score returns, None for obstacles
+        self.colliders: List[Tuple[GameObject, Optional[int]]] = [(None, 0), (None, 1)]
+        # Built on first use, classic matches never need it
+        self.grid: Optional[SpatialHash] = None
+        self.cell_size = cell_size or Config.SPATIAL_HASH_CELL_SIZE
+        self._use_grid = False
+
+    def add_ball(self, ball: GameObject):
+        self.balls.append(ball)
+
+    def remove_ball(self, ball: GameObject):
+        self.balls.remove(ball)
+
+    def set_paddles(self, left: GameObject, right: GameObject):
+        """Set the match paddles, tested before any other collider"""
+        self.colliders[0] = (left, 0)
+        self.colliders[1] = (right, 1)
+
+    def add_collider(self, collider: GameObject, side: Optional[int] = None):
+        """Add an extra paddle or obstacle
+
+        Args:
+            collider: Object balls bounce off
+            side: 0 or 1 to count hits as returns by that side (extra
+                paddles), None for obstacles
+        """
+        self.colliders.append((collider, side))
+
+    def remove_collider(self, collider: GameObject):
+        for index, (other, _) in enumerate(self.colliders):
+            if other is collider and index >= 2:
+                del self.colliders[index]
+                return
+        raise ValueError("Not an extra collider of this registry")
+
+    def objects(self) -> Iterator[GameObject]:
+        """Every registered object in draw order: colliders, then balls"""
+        for collider, _ in self.colliders:
+            if collider is not None:
+                yield collider
+        yield from self.balls
+
+    def update_broad_phase(self):
+        """Re-insert the colliders at their current positions (call after they moved)"""
+        self._use_grid = len(self.balls) * len(self.colliders) > Config.BROAD_PHASE_MIN_PAIRS
+        if not self._use_grid:
+            return
+        grid = self.grid
+        if grid is None:
+            grid = self.grid = SpatialHash(self.cell_size)
+        grid.clear()
+        for index, (collider, _) in enumerate(self.colliders):
+            if collider is None:
+                continue
+            x, y = collider.position
+            grid.insert(index, x, y, x + collider.width, y + collider.height)
+
+    def _candidates(self, ball) -> List[int]:
+        """Colliders near the box swept by the ball's last step"""
+        if not self._use_grid:
+            return [index for index, (collider, _) in enumerate(self.colliders) if collider is not None]
+        start = ball.previous_position
+        end = ball.position
+        return self.grid.query(min(start.x, end.x), min(start.y, end.y),
+                               max(start.x, end.x) + ball.width, max(start.y, end.y) + ball.height)
+
+    def collisions(self, ball) -> Iterator[Tuple[GameObject, Optional[int]]]:
+        """Collide a ball with the nearby colliders
+
+        Runs Ball.collide against each broad phase candidate and yields
+        (collider, side) for every hit. A hit moves the ball, so candidates
+        are looked up again for the colliders after the one that was hit.
+        """
+        candidates = self._candidates(ball)
+        position = 0
+        while position < len(candidates):
+            index = candidates[position]
+            position += 1
+            collider, side = self.colliders[index]
+            if ball.collide(collider):
+                yield collider, side
+                candidates = [i for i in self._candidates(ball) if i > index]
+                position = 0
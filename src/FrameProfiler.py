@@ -0,0 +1,220 @@
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional
+import pygame
+from .Config import Config
+from .Renderer import Renderer
+
+class FrameProfiler:
+    """Per-phase frame timing with histograms, an on-screen HUD and export
+
+    The game loop calls begin_frame/end_frame around each frame and lap()
+    after each phase; lap() charges the time since the previous lap (or
+    restart()) to that phase. Phase times are summed over the frame, so
+    several physics steps in one frame count as one sample per phase.
+
+    Game only creates a profiler when asked to (F3 or profile_output), and
+    every hook is behind a None check, so profiling costs nothing when off.
+    """
+
+    # Phase indices, passed to lap()
+    EVENTS = 0
+    WALLS = 1
+    LEFT_PADDLE = 2  # Controller: keyboard read + keyListen, Bot.update_ai or a script
+    RIGHT_PADDLE = 3
+    BALL = 4  # Ball.update
+    COLLISIONS = 5  # _handle_ball_collisions
+    SCORING = 6  # _check_ball_off_screen
+    RECORDING = 7  # Replay recorder
+    DRAW = 8  # Game.draw up to the display update
+    PRESENT = 9  # display.flip / display.update
+    PHASES = ("events", "walls", "left_paddle", "right_paddle", "ball", "collisions",
+              "scoring", "recording", "draw", "present")
+    FRAME = "frame"  # Work time of the whole frame, excluding the frame cap sleep
+
+    # Log-spaced histogram buckets from 1 us to 1 s
+    BUCKET_MIN = 1e-6
+    BUCKETS_PER_DECADE = 20
+    BUCKET_COUNT = 6 * BUCKETS_PER_DECADE
+
+    HUD_COLOR = (0, 255, 0)
+    HUD_BACKGROUND = (0, 0, 0)
+    HUD_POSITION = (10, 10)
+
+    def __init__(self, target_fps: int = 120):
+        """Initialize profiler
+
+        Args:
+            target_fps: Frame rate target, a frame interval longer than
+                Config.PROFILER_DROP_FACTOR frame budgets counts as dropped
+        """
+        self.frame_budget = 1.0 / target_fps
+        self.histograms: Dict[str, List[int]] = {name: [0] * self.BUCKET_COUNT
+                                                 for name in self.PHASES + (self.FRAME,)}
+        self.totals: Dict[str, float] = {name: 0.0 for name in self.histograms}
+        self.maximums: Dict[str, float] = {name: 0.0 for name in self.histograms}
+        self.frames = 0
+        self.dropped_frames = 0
+        self.hud_visible = False
+
+        self._phase_times = [0.0] * len(self.PHASES)
+        self._frame_start = 0.0
+        self._previous_frame_start: Optional[float] = None
+        self._lap_start = 0.0
+        # Recent frame work times for the HUD percentiles
+        self._recent = deque(maxlen=Config.PROFILER_WINDOW)
+        self._hud_font: Optional[pygame.font.Font] = None
+        self._hud_surface: Optional[pygame.Surface] = None
+        self._hud_updated = 0.0
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        now = time.perf_counter()
+        if self._previous_frame_start is not None:
+            if now - self._previous_frame_start > self.frame_budget * Config.PROFILER_DROP_FACTOR:
+                self.dropped_frames += 1
+        self._previous_frame_start = now
+        self._frame_start = now
+        self._lap_start = now
+
+    def restart(self):
+        """Start the next lap now, without charging the elapsed time to a phase"""
+        self._lap_start = time.perf_counter()
+
+    def lap(self, phase: int):
+        """Charge the time since the previous lap to a phase"""
+        now = time.perf_counter()
+        self._phase_times[phase] += now - self._lap_start
+        self._lap_start = now
+
+    def discard_frame(self):
+        """Forget an unfinished frame, e.g. while the game idles in a menu
+        
+        Its phase times are dropped and the gap until the next frame is not
+        counted as a dropped frame.
+        """
+        for phase in range(len(self._phase_times)):
+            self._phase_times[phase] = 0.0
+        self._previous_frame_start = None
+
+    def end_frame(self):
+        """Add the frame's phase times to the histograms"""
+        frame_time = time.perf_counter() - self._frame_start
+        self.frames += 1
+        self._recent.append(frame_time)
+        self._record(self.FRAME, frame_time)
+        for phase, elapsed in enumerate(self._phase_times):
+            self._record(self.PHASES[phase], elapsed)
+            self._phase_times[phase] = 0.0
+
+    def _record(self, name: str, seconds: float):
+        """Add one sample to a histogram"""
+        if seconds > self.BUCKET_MIN:
+            bucket = min(int(math.log10(seconds / self.BUCKET_MIN) * self.BUCKETS_PER_DECADE), self.BUCKET_COUNT - 1)
+        else:
+            bucket = 0
+        self.histograms[name][bucket] += 1
+        self.totals[name] += seconds
+        if seconds > self.maximums[name]:
+            self.maximums[name] = seconds
+
+    def _bucket_upper(self, bucket: int) -> float:
+        """Upper edge of a histogram bucket in seconds"""
+        return self.BUCKET_MIN * 10 ** ((bucket + 1) / self.BUCKETS_PER_DECADE)
+
+    def percentile(self, name: str, q: float) -> float:
+        """Estimate a percentile from a histogram
+
+        Args:
+            name: Phase name or FRAME
+            q: Percentile in [0, 1]
+
+        Returns:
+            Upper edge of the bucket containing the percentile, in seconds
+        """
+        counts = self.histograms[name]
+        total = sum(counts)
+        if total == 0:
+            return 0.0
+        threshold = q * total
+        cumulative = 0
+        for bucket, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(self._bucket_upper(bucket), self.maximums[name])
+        return self.maximums[name]
+
+    def summary(self) -> List[Dict]:
+        """Per-phase statistics in milliseconds, whole frame first"""
+        rows = []
+        for name in (self.FRAME,) + self.PHASES:
+            samples = sum(self.histograms[name])
+            rows.append({
+                "phase": name,
+                "frames": samples,
+                "mean_ms": self.totals[name] / samples * 1000 if samples else 0.0,
+                "p50_ms": self.percentile(name, 0.5) * 1000,
+                "p90_ms": self.percentile(name, 0.9) * 1000,
+                "p99_ms": self.percentile(name, 0.99) * 1000,
+                "max_ms": self.maximums[name] * 1000,
+            })
+        return rows
+
+    def export_csv(self, path: str):
+        """Write the per-phase summary as CSV"""
+        import csv  # Only needed on export, kept off the game's import time
+        rows = self.summary()
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def export_json(self, path: str):
+        """Write the summary plus the raw histograms as JSON"""
+        data = {
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "target_frame_ms": self.frame_budget * 1000,
+            "summary": self.summary(),
+            "bucket_upper_ms": [self._bucket_upper(b) * 1000 for b in range(self.BUCKET_COUNT)],
+            "histograms": self.histograms,
+        }
+        with open(path, "w") as f:
+            import json  # Only needed on export, kept off the game's import time
+            json.dump(data, f, indent=2)
+
+    def export(self, path: str):
+        """Export as JSON or CSV depending on the file extension"""
+        if path.lower().endswith(".json"):
+            self.export_json(path)
+        else:
+            self.export_csv(path)
+
+    def draw_hud(self, renderer: Renderer) -> pygame.Rect:
+        """Draw the overlay with recent p50/p99 frame time and dropped frames
+
+        The text is re-rendered a few times per second on an opaque
+        background, so it also overwrites itself cleanly in dirty-rect mode.
+
+        Returns:
+            The frame area covered by the overlay
+        """
+        now = time.perf_counter()
+        if self._hud_surface is None or now - self._hud_updated >= Config.PROFILER_HUD_REFRESH:
+            if self._hud_font is None:
+                self._hud_font = pygame.font.Font(None, 24)
+            recent = sorted(self._recent)
+            p50 = recent[len(recent) // 2] * 1000 if recent else 0.0
+            p99 = recent[min(len(recent) - 1, int(len(recent) * 0.99))] * 1000 if recent else 0.0
+            text = f"frame p50 {p50:5.2f} ms  p99 {p99:5.2f} ms  dropped {self.dropped_frames}"
+            surface = self._hud_font.render(text, True, self.HUD_COLOR, self.HUD_BACKGROUND)
+            if self._hud_surface is not None and self._hud_surface.get_width() > surface.get_width():
+                # Never shrink, so a shorter text still covers the previous one
+                padded = pygame.Surface(self._hud_surface.get_size())
+                padded.fill(self.HUD_BACKGROUND)
+                padded.blit(surface, (0, 0))
+                surface = padded
+            self._hud_surface = surface
+            self._hud_updated = now
+        return renderer.blit(self._hud_surface, self.HUD_POSITION)
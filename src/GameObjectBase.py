@@ -1,7 +1,14 @@
+import copy
 import pygame
 from abc import ABC, abstractmethod
+from .Renderer import Renderer
 
 class GameObject(ABC):
+    # Slotted (no per-instance __dict__) to keep many concurrent matches compact;
+    # subclasses declare their own extra attributes in __slots__ too
+    __slots__ = ('position', 'width', 'height', 'velocity', 'mass',
+                 'angular_velocity', 'friction_coefficient')
+    
     def __init__(self, x: float, y: float, width: float, height: float, mass: float = 1.0):
         """Initialize game object with position, size, and physics properties"""
         self.position = pygame.Vector2(x, y)
@@ -23,14 +30,42 @@ class GameObject(ABC):
         pass
 
     @abstractmethod
-    def draw(self, screen: pygame.Surface):
+    def draw(self, renderer: Renderer):
         """Draw the game object
         
         Args:
-            screen: The pygame surface to draw on
+            renderer: The Renderer backend to draw with
         """
         pass
 
+    def detached_copy(self, position: pygame.Vector2 = None) -> 'GameObject':
+        """Shallow copy with its own position and velocity vectors
+        
+        The copy can be drawn on another thread while this object keeps
+        moving (see SimulationThread).
+        
+        Args:
+            position: Position of the copy, defaults to this object's position
+        """
+        clone = copy.copy(self)
+        clone.position = pygame.Vector2(position if position is not None else self.position)
+        clone.velocity = pygame.Vector2(self.velocity)
+        return clone
+
+    def scaled_copy(self, scale: float) -> 'GameObject':
+        """Detached copy with position and size in render pixels
+        
+        Drawing the copy draws this object on a surface rendered at a
+        fraction of the logical resolution (see Game's render_scale).
+        
+        Args:
+            scale: Render pixels per logical unit
+        """
+        clone = self.detached_copy(self.position * scale)
+        clone.width = self.width * scale
+        clone.height = self.height * scale
+        return clone
+
     def get_rect(self) -> pygame.Rect:
         """Return the pygame collision rect object"""
         return pygame.Rect(self.position.x, self.position.y, self.width, self.height)
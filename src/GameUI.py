@@ -1,13 +1,28 @@
 import pygame
-from typing import Tuple, List
+from collections import OrderedDict
+from typing import Callable, Iterator, Tuple, List, Sequence
 from .Config import Config
+from .Renderer import Renderer, SurfaceRenderer
 
 class GameUI:
     """Utility class for handling all UI rendering and text display"""
     
-    def __init__(self, screen_width: int, screen_height: int):
+    # Net dash geometry
+    NET_DASH_HEIGHT = 15
+    NET_DASH_GAP = 10
+    NET_DASH_WIDTH = 3
+    
+    def __init__(self, screen_width: int, screen_height: int, scale: float = 1.0):
+        """Initialize UI
+        
+        Args:
+            screen_width, screen_height: Size of the surface drawn on
+            scale: Render pixels per logical pixel; fonts and fixed offsets
+                are scaled by it (see Game's render_scale)
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.scale = scale
         
         # Colors
         self.dark_grey = (64, 64, 64)
@@ -16,175 +31,257 @@ class GameUI:
         self.blue = (0, 0, 255)
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        self.font_large = pygame.font.Font(None, self._px(72))
+        self.font_medium = pygame.font.Font(None, self._px(48))
+        self.font_small = pygame.font.Font(None, self._px(36))
+        
+        # Rendered text surfaces keyed by (text, font, color), least recently used first
+        self._text_cache: OrderedDict = OrderedDict()
+        # Precomposed menu screens keyed by name -> (inputs, surface)
+        self._screen_cache = {}
+    
+    def _px(self, pixels: int) -> int:
+        """A layout distance in logical pixels at the render scale"""
+        return max(1, round(pixels * self.scale))
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render antialiased text, reusing the surface if it was rendered before"""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._text_cache.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        self._text_cache[key] = surface
+        if len(self._text_cache) > Config.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surface
+    
+    def warm_up(self, winning_score: int, winners: Sequence[str]) -> Iterator[None]:
+        """Render the text of every screen ahead of use, one screen per step
+        
+        The first render of a string costs far more than a cached blit, so
+        walking this while the game waits for input keeps those stalls off
+        the frames where a screen first appears.
+        
+        Args:
+            winning_score: Highest score shown in gameplay
+            winners: Winner names the finish screen may show
+        """
+        scratch = pygame.Surface((self.screen_width, self.screen_height))
+        for is_single_player in (True, False):
+            for selected_difficulty in range(3):
+                self._compose_mode_selection_screen(scratch, is_single_player, selected_difficulty)
+                yield
+        for winner in winners:
+            for selected_difficulty in range(3):
+                is_single_player = winner in ("Player", "Bot")
+                self._compose_finish_screen(scratch, winner, [winning_score, 0], selected_difficulty, is_single_player)
+                yield
+        for is_single_player in (True, False):
+            self.draw_scores(SurfaceRenderer(scratch), [0, 0], is_single_player)
+        for score in range(winning_score + 1):
+            self._render_text(self.font_large, str(score), self.blue)
+        yield
+    
+    def _draw_cached_screen(self, renderer: Renderer, name: str, inputs: tuple,
+                            compose: Callable[[pygame.Surface], None]):
+        """Blit a precomposed full screen, rebuilding it only when its inputs change"""
+        cached = self._screen_cache.get(name)
+        if cached is None or cached[0] != inputs or cached[1].get_size() != renderer.get_size():
+            surface = renderer.create_surface(renderer.get_size())
+            compose(surface)
+            cached = (inputs, surface)
+            self._screen_cache[name] = cached
+        renderer.blit(cached[1], (0, 0))
     
-    def draw_start_screen(self, screen: pygame.Surface, winning_score: int):
+    def _difficulty_options(self, is_single_player: bool) -> List[Tuple[str, int]]:
+        """Difficulty menu lines with their index, based on game mode"""
+        # Use appropriate difficulty display text based on game mode
+        if is_single_player:
+            return [
+                (f"1. {Config.get_bot_difficulty_display_text('Easy')}", 0),
+                (f"2. {Config.get_bot_difficulty_display_text('Medium')}", 1),
+                (f"3. {Config.get_bot_difficulty_display_text('Hard')}", 2)
+            ]
+        return [
+            (f"1. {Config.get_difficulty_display_text('Easy')}", 0),
+            (f"2. {Config.get_difficulty_display_text('Medium')}", 1),
+            (f"3. {Config.get_difficulty_display_text('Hard')}", 2)
+        ]
+    
+    def draw_start_screen(self, renderer: Renderer, winning_score: int):
         """Draw the starting screen with title and mode selection"""
+        self._draw_cached_screen(renderer, "start", (winning_score,),
+                                 lambda surface: self._compose_start_screen(surface, winning_score))
+    
+    def _compose_start_screen(self, screen: pygame.Surface, winning_score: int):
+        """Render the starting screen onto a surface"""
         screen.fill(self.white)
         
         # Title
-        title = self.font_large.render("PONG", True, self.black)
+        title = self._render_text(self.font_large, "PONG", self.black)
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 4))
         screen.blit(title, title_rect)
         
         # Game mode selection
-        mode_title = self.font_medium.render("SELECT GAME MODE:", True, self.black)
-        mode_rect = mode_title.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 40))
+        mode_title = self._render_text(self.font_medium, "SELECT GAME MODE:", self.black)
+        mode_rect = mode_title.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - self._px(40)))
         screen.blit(mode_title, mode_rect)
         
         # Mode options
-        single_player = self.font_small.render("1. Single Player (vs AI)", True, self.black)
-        single_rect = single_player.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
+        single_player = self._render_text(self.font_small, "1. Single Player (vs AI)", self.black)
+        single_rect = single_player.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + self._px(20)))
         screen.blit(single_player, single_rect)
         
-        two_player = self.font_small.render("2. Two Player (vs Human)", True, self.black)
-        two_rect = two_player.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 60))
+        two_player = self._render_text(self.font_small, "2. Two Player (vs Human)", self.black)
+        two_rect = two_player.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + self._px(60)))
         screen.blit(two_player, two_rect)
         
         # Instructions
-        instruction = self.font_small.render("Press 1 or 2 to select mode", True, self.dark_grey)
-        instruction_rect = instruction.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 120))
+        instruction = self._render_text(self.font_small, "Press 1 or 2 to select mode", self.dark_grey)
+        instruction_rect = instruction.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + self._px(120)))
         screen.blit(instruction, instruction_rect)
 
     
-    def draw_finish_screen(self, screen: pygame.Surface, winner: str, scores: List[int], selected_difficulty: int, is_single_player: bool = False):
+    def draw_finish_screen(self, renderer: Renderer, winner: str, scores: List[int], selected_difficulty: int, is_single_player: bool = False):
         """Draw the finish screen with winner announcement, final score, and difficulty selection"""
+        inputs = (winner, tuple(scores), selected_difficulty, is_single_player,
+                  tuple(self._difficulty_options(is_single_player)))
+        self._draw_cached_screen(renderer, "finish", inputs,
+                                 lambda surface: self._compose_finish_screen(surface, winner, scores, selected_difficulty, is_single_player))
+    
+    def _compose_finish_screen(self, screen: pygame.Surface, winner: str, scores: List[int], selected_difficulty: int, is_single_player: bool):
+        """Render the finish screen onto a surface"""
         screen.fill(self.white)
         
         # Winner announcement
-        winner_text = self.font_large.render(f"{winner} Wins!", True, self.black)
+        winner_text = self._render_text(self.font_large, f"{winner} Wins!", self.black)
         winner_rect = winner_text.get_rect(center=(self.screen_width // 2, self.screen_height // 4))
         screen.blit(winner_text, winner_rect)
         
         # Final score
-        score_text = self.font_medium.render(f"Final Score: {scores[0]} - {scores[1]}", True, self.dark_grey)
+        score_text = self._render_text(self.font_medium, f"Final Score: {scores[0]} - {scores[1]}", self.dark_grey)
         score_rect = score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
         screen.blit(score_text, score_rect)
         
         # Difficulty selection for next game
-        difficulty_title = self.font_medium.render("SELECT DIFFICULTY FOR NEXT GAME:", True, self.black)
+        difficulty_title = self._render_text(self.font_medium, "SELECT DIFFICULTY FOR NEXT GAME:", self.black)
         difficulty_rect = difficulty_title.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
         screen.blit(difficulty_title, difficulty_rect)
         
-        # Use appropriate difficulty display text based on game mode
-        if is_single_player:
-            difficulties = [
-                (f"1. {Config.get_bot_difficulty_display_text('Easy')}", 0),
-                (f"2. {Config.get_bot_difficulty_display_text('Medium')}", 1),
-                (f"3. {Config.get_bot_difficulty_display_text('Hard')}", 2)
-            ]
-        else:
-            difficulties = [
-                (f"1. {Config.get_difficulty_display_text('Easy')}", 0),
-                (f"2. {Config.get_difficulty_display_text('Medium')}", 1),
-                (f"3. {Config.get_difficulty_display_text('Hard')}", 2)
-            ]
+        difficulties = self._difficulty_options(is_single_player)
         
-        y_offset = self.screen_height // 2 + 50
+        y_offset = self.screen_height // 2 + self._px(50)
         for i, (text, index) in enumerate(difficulties):
             color = self.blue if index == selected_difficulty else self.black
-            diff_text = self.font_small.render(text, True, color)
+            diff_text = self._render_text(self.font_small, text, color)
             diff_rect = diff_text.get_rect(center=(self.screen_width // 2, y_offset))
             screen.blit(diff_text, diff_rect)
-            y_offset += 35
+            y_offset += self._px(35)
         
         # Instructions
-        y_offset += 20
-        restart_text = self.font_small.render("Use 1/2/3 to select difficulty", True, self.dark_grey)
+        y_offset += self._px(20)
+        restart_text = self._render_text(self.font_small, "Use 1/2/3 to select difficulty", self.dark_grey)
         restart_rect = restart_text.get_rect(center=(self.screen_width // 2, y_offset))
         screen.blit(restart_text, restart_rect)
         
-        play_text = self.font_small.render("Press SPACE to play again", True, self.black)
-        play_rect = play_text.get_rect(center=(self.screen_width // 2, y_offset + 35))
+        play_text = self._render_text(self.font_small, "Press SPACE to play again", self.black)
+        play_rect = play_text.get_rect(center=(self.screen_width // 2, y_offset + self._px(35)))
         screen.blit(play_text, play_rect)
         
-        quit_text = self.font_small.render("Press ESC to quit", True, self.black)
-        quit_rect = quit_text.get_rect(center=(self.screen_width // 2, y_offset + 70))
+        quit_text = self._render_text(self.font_small, "Press ESC to quit", self.black)
+        quit_rect = quit_text.get_rect(center=(self.screen_width // 2, y_offset + self._px(70)))
         screen.blit(quit_text, quit_rect)
     
-    def draw_scores(self, screen: pygame.Surface, scores: List[int], is_single_player: bool = False):
-        """Draw the current scores during gameplay"""
+    def draw_scores(self, renderer: Renderer, scores: List[int], is_single_player: bool = False) -> List[pygame.Rect]:
+        """Draw the current scores during gameplay
+        
+        Returns:
+            The frame areas covered by the score text
+        """
         # Left player score
         left_label = "PLAYER" if is_single_player else "LEFT"
-        left_score = self.font_large.render(str(scores[0]), True, self.blue)
-        left_rect = left_score.get_rect(center=(self.screen_width // 4, 60))
-        screen.blit(left_score, left_rect)
+        left_score = self._render_text(self.font_large, str(scores[0]), self.blue)
+        left_rect = left_score.get_rect(center=(self.screen_width // 4, self._px(60)))
+        renderer.blit(left_score, left_rect)
         
         # Left player label
-        left_label_text = self.font_small.render(left_label, True, self.dark_grey)
-        left_label_rect = left_label_text.get_rect(center=(self.screen_width // 4, 90))
-        screen.blit(left_label_text, left_label_rect)
+        left_label_text = self._render_text(self.font_small, left_label, self.dark_grey)
+        left_label_rect = left_label_text.get_rect(center=(self.screen_width // 4, self._px(90)))
+        renderer.blit(left_label_text, left_label_rect)
         
         # Right player score
         right_label = "BOT" if is_single_player else "RIGHT"
-        right_score = self.font_large.render(str(scores[1]), True, self.blue)
-        right_rect = right_score.get_rect(center=(3 * self.screen_width // 4, 60))
-        screen.blit(right_score, right_rect)
+        right_score = self._render_text(self.font_large, str(scores[1]), self.blue)
+        right_rect = right_score.get_rect(center=(3 * self.screen_width // 4, self._px(60)))
+        renderer.blit(right_score, right_rect)
         
         # Right player label
-        right_label_text = self.font_small.render(right_label, True, self.dark_grey)
-        right_label_rect = right_label_text.get_rect(center=(3 * self.screen_width // 4, 90))
-        screen.blit(right_label_text, right_label_rect)
+        right_label_text = self._render_text(self.font_small, right_label, self.dark_grey)
+        right_label_rect = right_label_text.get_rect(center=(3 * self.screen_width // 4, self._px(90)))
+        renderer.blit(right_label_text, right_label_rect)
+        
+        return [left_rect, left_label_rect, right_rect, right_label_rect]
+    
+    def get_net_rect(self) -> pygame.Rect:
+        """Return the screen column covered by the net"""
+        middle_x = self.screen_width // 2
+        dash_width = self._px(self.NET_DASH_WIDTH)
+        return pygame.Rect(middle_x - dash_width // 2, 0, dash_width, self.screen_height)
     
-    def draw_net(self, screen: pygame.Surface):
+    def draw_net(self, renderer: Renderer):
         """Draw a dotted line in the middle of the screen to represent the net"""
         middle_x = self.screen_width // 2
-        dash_height = 15
-        dash_gap = 10
-        dash_width = 3
+        dash_height = self._px(self.NET_DASH_HEIGHT)
+        dash_gap = self._px(self.NET_DASH_GAP)
+        dash_width = self._px(self.NET_DASH_WIDTH)
+        wall_thickness = self._px(Config.WALL_THICKNESS)
         
         y = 0
         while y < self.screen_height:
             # Draw dash if it doesn't overlap with walls
-            if y > 20 and y + dash_height < self.screen_height - 20:
-                pygame.draw.rect(screen, self.dark_grey, 
-                               (middle_x - dash_width // 2, y, dash_width, dash_height))
+            if y > wall_thickness and y + dash_height < self.screen_height - wall_thickness:
+                renderer.fill(self.dark_grey, (middle_x - dash_width // 2, y, dash_width, dash_height))
             y += dash_height + dash_gap
     
-    def draw_mode_selection_screen(self, screen: pygame.Surface, is_single_player: bool, selected_difficulty: int):
+    def draw_mode_selection_screen(self, renderer: Renderer, is_single_player: bool, selected_difficulty: int):
         """Draw the mode selection screen with difficulty settings"""
+        inputs = (is_single_player, selected_difficulty, tuple(self._difficulty_options(is_single_player)))
+        self._draw_cached_screen(renderer, "mode_selection", inputs,
+                                 lambda surface: self._compose_mode_selection_screen(surface, is_single_player, selected_difficulty))
+    
+    def _compose_mode_selection_screen(self, screen: pygame.Surface, is_single_player: bool, selected_difficulty: int):
+        """Render the mode selection screen onto a surface"""
         screen.fill(self.white)
         
         # Title
         mode_text = "SINGLE PLAYER" if is_single_player else "TWO PLAYER"
-        title = self.font_large.render(mode_text, True, self.black)
+        title = self._render_text(self.font_large, mode_text, self.black)
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 6))
         screen.blit(title, title_rect)
         
         # Difficulty selection (for both single and two player modes)
         if is_single_player:
-            difficulty_title = self.font_medium.render("SELECT AI DIFFICULTY:", True, self.black)
+            difficulty_title = self._render_text(self.font_medium, "SELECT AI DIFFICULTY:", self.black)
         else:
-            difficulty_title = self.font_medium.render("SELECT DIFFICULTY:", True, self.black)
+            difficulty_title = self._render_text(self.font_medium, "SELECT DIFFICULTY:", self.black)
         
         difficulty_rect = difficulty_title.get_rect(center=(self.screen_width // 2, self.screen_height // 4))
         screen.blit(difficulty_title, difficulty_rect)
         
-        # Use appropriate difficulty display text based on game mode
-        if is_single_player:
-            difficulties = [
-                (f"1. {Config.get_bot_difficulty_display_text('Easy')}", 0),
-                (f"2. {Config.get_bot_difficulty_display_text('Medium')}", 1),
-                (f"3. {Config.get_bot_difficulty_display_text('Hard')}", 2)
-            ]
-        else:
-            difficulties = [
-                (f"1. {Config.get_difficulty_display_text('Easy')}", 0),
-                (f"2. {Config.get_difficulty_display_text('Medium')}", 1),
-                (f"3. {Config.get_difficulty_display_text('Hard')}", 2)
-            ]
+        difficulties = self._difficulty_options(is_single_player)
         
         y_offset = self.screen_height // 3 
         for i, (text, index) in enumerate(difficulties):
             color = self.blue if index == selected_difficulty else self.black
             # Use slightly larger font for difficulty options to make them more prominent
             font_to_use = self.font_medium if index == selected_difficulty else self.font_small
-            diff_text = font_to_use.render(text, True, color)
+            diff_text = self._render_text(font_to_use, text, color)
             diff_rect = diff_text.get_rect(center=(self.screen_width // 2, y_offset))
             screen.blit(diff_text, diff_rect)
-            y_offset += 45  # Increased spacing for better visibility
+            y_offset += self._px(45)  # Increased spacing for better visibility
         
         # Game mode specific rules
         if is_single_player:
@@ -209,23 +306,23 @@ class GameUI:
             ]
         
         # Draw rules
-        y_offset = self.screen_height // 2 + 40
+        y_offset = self.screen_height // 2 + self._px(40)
         for rule in rules:
             if rule.endswith("RULES:"):
-                text = self.font_medium.render(rule, True, self.black)
+                text = self._render_text(self.font_medium, rule, self.black)
             else:
-                text = self.font_small.render(rule, True, self.black)
+                text = self._render_text(self.font_small, rule, self.black)
             
             text_rect = text.get_rect(center=(self.screen_width // 2, y_offset))
             screen.blit(text, text_rect)
-            y_offset += 35 if rule.endswith("RULES:") else 30
+            y_offset += self._px(35 if rule.endswith("RULES:") else 30)
         
         # Instructions
-        y_offset += 20
-        start_text = self.font_small.render("Press SPACE to start", True, self.dark_grey)
+        y_offset += self._px(20)
+        start_text = self._render_text(self.font_small, "Press SPACE to start", self.dark_grey)
         start_rect = start_text.get_rect(center=(self.screen_width // 2, y_offset))
         screen.blit(start_text, start_rect)
         
-        back_text = self.font_small.render("Press ESC to go back", True, self.dark_grey)
-        back_rect = back_text.get_rect(center=(self.screen_width // 2, y_offset + 35))
+        back_text = self._render_text(self.font_small, "Press ESC to go back", self.dark_grey)
+        back_rect = back_text.get_rect(center=(self.screen_width // 2, y_offset + self._px(35)))
         screen.blit(back_text, back_rect)
@@ -0,0 +1,138 @@
+import math
+from .Config import Config
+
+class InterceptPredictor:
+    """Event-driven intercept prediction for Bot
+
+    Steps the ball forward with the same per-tick model as Ball.update
+    (Magnus effect, air friction, wall bounces) plus the speed boost that
+    Game.update applies after every wall hit, until it reaches the paddle.
+    The result is cached until the ball's trajectory_version changes, i.e.
+    until the next serve, wall bounce, paddle hit or speed change, so the
+    integration runs once per event instead of once per frame.
+
+    Without spin there is no Magnus force and the flight between events is
+    a geometric series, so the predictor jumps straight to the tick before
+    the next wall or paddle crossing. Only spinning stretches are stepped
+    tick by tick, in plain float math rather than through Ball.update.
+    """
+
+    def __init__(self, step: float = None, horizon: float = None, speed_increase_factor: float = 1.0):
+        """Initialize predictor
+
+        Args:
+            step: Simulation tick in seconds, defaults to 1 / Config.PHYSICS_RATE
+                (Game.start_match sets the match's physics_dt)
+            horizon: Longest flight time to predict, defaults to Config.BOT_PREDICTION_HORIZON
+            speed_increase_factor: Speed boost after each wall hit, set by
+                Game.start_match to the match's difficulty
+        """
+        self.step = step or 1.0 / Config.PHYSICS_RATE
+        self.horizon = horizon or Config.BOT_PREDICTION_HORIZON
+        self.speed_increase_factor = speed_increase_factor
+        self._cache_key = None
+        self._cached_y = 0.0
+
+    def predict(self, ball, paddle, screen_height: int, wall_thickness: int = None) -> float:
+        """Predict the ball center y when it reaches the paddle's face
+
+        Args:
+            ball: Ball moving towards the paddle
+            paddle: Paddle that will intercept
+            screen_height: Height of the game screen
+            wall_thickness: Thickness of top/bottom walls
+
+        Returns:
+            Predicted y of the ball center at the paddle's x position, wall
+            bounces included
+        """
+        wall_thickness = wall_thickness or Config.WALL_THICKNESS
+        key = (id(ball), ball.trajectory_version, paddle.position.x)
+        if key != self._cache_key:
+            self._cached_y = self._integrate(ball, paddle, screen_height, wall_thickness)
+            self._cache_key = key
+        return self._cached_y
+
+    def invalidate(self):
+        """Drop the cached prediction"""
+        self._cache_key = None
+
+    def _integrate(self, ball, paddle, screen_height: int, wall_thickness: int) -> float:
+        """Run the ball model forward until it crosses the paddle's face"""
+        dt = self.step
+        air = ball.air_friction ** dt  # Velocity factor per tick
+        spin_decay = ball.angular_friction ** dt
+        # Magnus turns the velocity by i * spin * magnus per tick (see Ball._apply_magnus_effect)
+        magnus = ball.magnus_effect_strength * dt / (ball.mass * ball.mass)
+        threshold = Config.MAGNUS_MIN_SPIN_THRESHOLD
+        boost = self.speed_increase_factor
+        min_y = wall_thickness
+        max_y = screen_height - wall_thickness - ball.height
+
+        x, y = ball.position.x, ball.position.y
+        velocity = complex(ball.velocity.x, ball.velocity.y)
+        spin = ball.angular_velocity
+        moving_right = velocity.real > 0
+        # Left edge of the ball when it touches the paddle's face
+        face_x = paddle.position.x - ball.width if moving_right else paddle.position.x + paddle.width
+
+        ticks = math.ceil(self.horizon / dt)
+        while ticks > 0:
+            if abs(spin) <= threshold:
+                # Straight flight: skip to the tick before the next event
+                skip = min(self._ticks_to_reach(face_x - x, velocity.real, air, dt),
+                           self._ticks_to_reach((max_y if velocity.imag > 0 else min_y) - y, velocity.imag, air, dt),
+                           ticks) - 1
+                if skip > 0:
+                    distance = self._flight(skip, air, dt)
+                    x += velocity.real * distance
+                    y += velocity.imag * distance
+                    velocity *= air ** skip
+                    spin *= spin_decay ** skip
+                    ticks -= skip
+
+            # One tick in Ball.update order: Magnus, air friction, spin decay, move, walls
+            if abs(spin) > threshold and velocity:
+                velocity *= complex(1.0, spin * magnus)
+            velocity *= air
+            spin *= spin_decay
+            x += velocity.real * dt
+            y += velocity.imag * dt
+            if y <= min_y or y >= max_y:
+                velocity = velocity.conjugate()
+                spin *= -Config.WALL_SPIN_REDUCTION
+                y = min_y + (min_y - y) if y <= min_y else max_y - (y - max_y)
+                y = max(min_y, min(y, max_y))
+                # Game.update speeds the ball up after the bounce
+                velocity *= boost
+            ticks -= 1
+
+            if x >= face_x if moving_right else x <= face_x:
+                break
+
+        return y + ball.radius
+
+    @staticmethod
+    def _flight(ticks: int, air: float, dt: float) -> float:
+        """Distance per unit of initial velocity covered in a number of straight ticks"""
+        if air == 1.0:
+            return ticks * dt
+        # Each tick moves velocity * air ** k * dt, k = 1..ticks
+        return dt * air * (1.0 - air ** ticks) / (1.0 - air)
+
+    @staticmethod
+    def _ticks_to_reach(distance: float, velocity: float, air: float, dt: float) -> int:
+        """First straight tick at which a velocity component covers a distance (can be huge)"""
+        if velocity == 0:
+            return 1 << 30
+        if distance * velocity <= 0:
+            # Already at or past it
+            return 1
+        steps = distance / (velocity * dt)
+        if air == 1.0:
+            return math.ceil(steps)
+        remaining = 1.0 - steps * (1.0 - air) / air
+        if remaining <= 0:
+            # Friction stops the ball first
+            return 1 << 30
+        return max(1, math.ceil(math.log(remaining) / math.log(air)))
@@ -0,0 +1,64 @@
+import random
+from typing import Sequence
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+class MatchRandom:
+    """Small seedable random number generator for one match (SplitMix64)
+
+    A random.Random carries ~2.5 KB of Mersenne Twister state, more than
+    half of a whole headless match (see Config.MATCH_MEMORY_BUDGET); this
+    one is a single 64-bit counter. The sequence depends only on the seed
+    and stream, never on the process, platform or Python version.
+
+    Independent streams of one seed let each consumer (serves, each bot)
+    draw without shifting the numbers the others see.
+    """
+
+    __slots__ = ('state',)
+
+    def __init__(self, seed: int = None, stream: int = 0):
+        """Initialize generator
+
+        Args:
+            seed: 64-bit seed, a random one is picked if omitted
+            stream: Number of an independent sequence for the same seed
+        """
+        self.seed(seed, stream)
+
+    def seed(self, seed: int = None, stream: int = 0):
+        """Restart the sequence of a seed and stream"""
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.state = _mix((seed + stream * GOLDEN_GAMMA) & MASK64)
+
+    def next64(self) -> int:
+        """Next 64 random bits"""
+        self.state = (self.state + GOLDEN_GAMMA) & MASK64
+        return _mix(self.state)
+
+    def random(self) -> float:
+        """Float in [0, 1)"""
+        return (self.next64() >> 11) * (1.0 / (1 << 53))
+
+    def uniform(self, a: float, b: float) -> float:
+        """Float between a and b"""
+        return a + (b - a) * self.random()
+
+    def randrange(self, stop: int) -> int:
+        """Integer in [0, stop)"""
+        if stop <= 0:
+            raise ValueError("Empty range for randrange()")
+        return self.next64() * stop >> 64
+
+    def choice(self, seq: Sequence):
+        """Random element of a non-empty sequence"""
+        return seq[self.randrange(len(seq))]
+
+
+def _mix(z: int) -> int:
+    """SplitMix64 output function"""
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+    return z ^ (z >> 31)
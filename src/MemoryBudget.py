@@ -0,0 +1,99 @@
+"""
+Per-Match Memory Budget
+=======================
+
+Measures how much memory each additional in-progress headless match costs
+and checks it against Config.MATCH_MEMORY_BUDGET. The game objects and Game
+itself use __slots__, so a Bot-vs-Bot match stays around 4 KB and a single
+worker can hold 10k+ concurrent matches in a few tens of MB.
+
+One-time costs (imports, caches filled by the first matches) are not part of
+the per-match cost, so a few warm-up matches are played and dropped first.
+Then two batches of matches are kept alive one after the other and the cost
+of each batch is divided by its size, i.e. the marginal cost per match. All
+matches use fixed seeds, so a run measures the same matches every time. The
+two batches must agree within TOLERANCE, and the cost plus that tolerance
+must fit the budget, so a run can't pass or fail by a lucky measurement.
+
+Usage:
+    python -m src.MemoryBudget --matches 500
+Exits with status 1 if the measured cost exceeds the budget, or if the two
+batches disagree by more than the tolerance.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Tuple
+from .game import Game
+from .Controller import BotController
+from .Config import Config
+
+# Relative difference allowed between the two measured batches
+TOLERANCE = 0.01
+
+# Matches played and dropped before measuring
+WARMUP_MATCHES = 100
+
+
+def _play_match(seed: int, ticks: int) -> Game:
+    """A headless Bot-vs-Bot match after its first ticks"""
+    game = Game(headless=True)
+    game.start_match(BotController("Hard"), BotController("Hard"), seed=seed)
+    for _ in range(ticks):
+        game.update(game.physics_dt)
+    return game
+
+
+def measure_match_memory(matches: int = 500, ticks: int = 120) -> Tuple[float, float]:
+    """Return the marginal traced bytes per live headless Bot-vs-Bot match
+
+    Args:
+        matches: Number of matches in each of the two measured batches
+        ticks: Simulation steps played in each match before measuring
+
+    Returns:
+        Bytes per match of the first and of the second batch
+    """
+    # Warm-up matches use seeds the measured ones don't
+    warmup = [_play_match(-1 - seed, ticks) for seed in range(WARMUP_MATCHES)]
+    del warmup
+    # Allocated up front so holding the matches doesn't grow a list mid-batch
+    games = [None] * (2 * matches)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        marks = [tracemalloc.get_traced_memory()[0]]
+        for batch in range(2):
+            for seed in range(batch * matches, (batch + 1) * matches):
+                games[seed] = _play_match(seed, ticks)
+            gc.collect()
+            marks.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    return (marks[1] - marks[0]) / matches, (marks[2] - marks[1]) / matches
+
+
+def main():
+    """Command line entry"""
+    parser = argparse.ArgumentParser(description="Check per-match memory against Config.MATCH_MEMORY_BUDGET")
+    parser.add_argument("--matches", type=int, default=500, help="matches in each measured batch")
+    args = parser.parse_args()
+
+    first, second = measure_match_memory(args.matches)
+    per_match = max(first, second)
+    spread = abs(first - second) / per_match
+    budget = Config.MATCH_MEMORY_BUDGET
+    print(f"{per_match:.0f} bytes per match (batches {first:.0f} / {second:.0f}, tolerance {TOLERANCE:.0%}, "
+          f"budget {budget} bytes, {per_match * 10_000 / 2**20:.1f} MiB per 10k matches)")
+    if spread > TOLERANCE:
+        print(f"Batches differ by {spread:.1%}, measure more matches")
+        sys.exit(1)
+    if per_match * (1 + TOLERANCE) > budget:
+        print("Over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+"""
+Online Two-Player Mode
+======================
+
+An authoritative asyncio UDP server runs the Game simulation for every
+match; clients only send their paddle inputs and draw the state the server
+sends back.
+
+Clients predict their own paddle: each local input is applied immediately
+and kept until the server acknowledges it. When a server state arrives the
+paddle is reset to the server's position and the unacknowledged inputs are
+applied again on top (reconciliation), so input feels instant at 50-150 ms
+RTT while the server stays in charge. The ball and the opponent's paddle
+are dead-reckoned between state packets and corrected by each one.
+
+Packets (little endian):
+    JOIN     type u8, match id u32                      client -> server
+    WELCOME  type u8, side u8 (0 = left, 1 = right)     server -> client
+    INPUT    type u8, newest input seq u32, count u8, then count
+             Paddle.INPUT_* codes packed four per byte, oldest first
+    STATE    type u8, server tick u32, last applied input seq of the
+             receiving client u32 (0xFFFFFFFF before the first), GameState
+             u8, scores u8 u8, ball x/y/vx/vy/spin f32, left and right
+             paddle y/vy f32
+
+Every input packet repeats the last Config.NET_INPUT_REDUNDANCY inputs, so
+lost packets are covered by the next ones. At the default rates a match
+costs about 1.5 KB/s of state and 0.5 KB/s of input per client (plus UDP/IP
+headers), so bandwidth allows thousands of concurrent sessions; the
+simulation itself (one Game.update per match per tick) is what limits how
+many matches one server process can run.
+
+NetworkConditions adds latency, jitter and loss to everything an endpoint
+sends, so the whole mode can be tested over loopback.
+
+Usage:
+    python -m src.Online server --port 9999
+    python -m src.Online client --host 127.0.0.1 --port 9999 --match 1
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import pygame
+from .game import Game, GameState
+from .Paddle import Paddle
+from .Player import Player
+from .Controller import Controller, KeyboardController
+from .Config import Config
+
+JOIN = 0
+WELCOME = 1
+INPUT = 2
+STATE = 3
+
+JOIN_PACKET = struct.Struct("<BI")
+WELCOME_PACKET = struct.Struct("<BB")
+INPUT_HEADER = struct.Struct("<BIB")
+STATE_PACKET = struct.Struct("<BIIBBB5f4f")
+
+NO_ACK = 0xFFFFFFFF
+GAME_STATES = list(GameState)
+
+Address = Tuple[str, int]
+
+
+def pack_inputs(newest_seq: int, codes: List[int]) -> bytes:
+    """Build an INPUT packet from the most recent input codes, oldest first"""
+    packed = bytearray((len(codes) + 3) // 4)
+    for i, code in enumerate(codes):
+        packed[i // 4] |= code << (2 * (i % 4))
+    return INPUT_HEADER.pack(INPUT, newest_seq, len(codes)) + packed
+
+
+def unpack_inputs(data: bytes) -> Tuple[int, List[int]]:
+    """Parse an INPUT packet into (newest seq, codes oldest first)"""
+    _, newest_seq, count = INPUT_HEADER.unpack_from(data)
+    packed = data[INPUT_HEADER.size:]
+    return newest_seq, [(packed[i // 4] >> (2 * (i % 4))) & 0x03 for i in range(count)]
+
+
+class NetworkConditions:
+    """Simulated latency, jitter and packet loss applied when sending"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, loss: float = 0.0, seed: int = None):
+        """Initialize network conditions
+
+        Args:
+            latency: One-way delay in seconds added to every packet
+            jitter: Extra random delay of up to this many seconds
+            loss: Probability of dropping a packet
+            seed: Seed for the loss and jitter randomness
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+
+    def send(self, transport: asyncio.DatagramTransport, data: bytes, addr: Optional[Address]):
+        """Send a datagram through the simulated network"""
+        if self.loss and self.rng.random() < self.loss:
+            return
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay <= 0:
+            transport.sendto(data, addr)
+        else:
+            asyncio.get_running_loop().call_later(delay, transport.sendto, data, addr)
+
+
+class _Endpoint(asyncio.DatagramProtocol):
+    """Shared transport handling and traffic counters"""
+
+    def __init__(self, conditions: NetworkConditions = None):
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.conditions = conditions
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        self.transport = transport
+
+    def _send(self, data: bytes, addr: Optional[Address] = None):
+        if self.transport is None:
+            return
+        self.bytes_sent += len(data)
+        if self.conditions is not None:
+            self.conditions.send(self.transport, data, addr)
+        else:
+            self.transport.sendto(data, addr)
+
+
+class RemoteController(Controller):
+    """Server side input for one client's paddle, fed from INPUT packets
+
+    Inputs are applied one per tick in sequence order. Lost inputs the
+    redundancy could not recover count as no input; if inputs pile up
+    beyond Config.NET_INPUT_BUFFER the extra ones are applied at once so
+    the paddle catches up instead of lagging further behind.
+    """
+
+    def __init__(self):
+        self.queue: Deque[int] = deque()
+        self.received = -1  # Newest input seq received
+        self.applied = NO_ACK  # Newest input seq applied, sent back as the ack
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        return Player(side, screen_width, screen_height, color=Config.PADDLE_COLOR)
+
+    def receive(self, newest_seq: int, codes: List[int]):
+        """Queue the inputs of a packet that were not received yet"""
+        first_seq = newest_seq - len(codes) + 1
+        for seq, code in enumerate(codes, first_seq):
+            if seq <= self.received:
+                continue
+            # Inputs lost beyond the redundancy window
+            self.queue.extend([Paddle.INPUT_NONE] * (seq - self.received - 1))
+            self.queue.append(code)
+            self.received = seq
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        if not self.queue:
+            # Waiting for input, the paddle holds still
+            paddle.apply_input(dt, Paddle.INPUT_SKIP)
+            return
+        for _ in range(1 + max(0, len(self.queue) - Config.NET_INPUT_BUFFER)):
+            paddle.apply_input(dt, self.queue.popleft())
+            self.applied = (self.applied + 1) & NO_ACK
+
+
+class ServerMatch:
+    """One match on the server and the addresses of its two clients"""
+
+    def __init__(self, match_id: int):
+        self.match_id = match_id
+        self.game = Game(headless=True)
+        self.controllers = [RemoteController(), RemoteController()]
+        self.addresses: List[Optional[Address]] = [None, None]
+        self.last_heard = [0.0, 0.0]
+        self.started = False
+        self.tick = 0
+
+    def state_packet(self, side: int) -> bytes:
+        """Current state as seen by one client"""
+        game = self.game
+        ball = game.ball
+        return STATE_PACKET.pack(
+            STATE, self.tick, self.controllers[side].applied, GAME_STATES.index(game.state),
+            game.scores[0], game.scores[1],
+            ball.position.x, ball.position.y, ball.velocity.x, ball.velocity.y, ball.angular_velocity,
+            game.playerLeft.position.y, game.playerLeft.velocity.y,
+            game.playerRight.position.y, game.playerRight.velocity.y)
+
+
+class OnlineServer(_Endpoint):
+    """Authoritative server running every match's Game simulation"""
+
+    def __init__(self, conditions: NetworkConditions = None, physics_rate: int = None,
+                 selected_difficulty: int = 1):
+        """Initialize server
+
+        Args:
+            conditions: Optional simulated network conditions for outgoing packets
+            physics_rate: Simulation ticks per second, defaults to Config.PHYSICS_RATE
+            selected_difficulty: Speed boost level of every match
+        """
+        super().__init__(conditions)
+        self.physics_rate = physics_rate or Config.PHYSICS_RATE
+        self.dt = 1.0 / self.physics_rate
+        self.snapshot_interval = max(1, round(self.physics_rate / Config.NET_SNAPSHOT_RATE))
+        self.selected_difficulty = selected_difficulty
+        self.matches: Dict[int, ServerMatch] = {}
+        self.clients: Dict[Address, Tuple[ServerMatch, int]] = {}
+        self.ticks = 0
+        self.tick_task: Optional[asyncio.Task] = None
+
+    def datagram_received(self, data: bytes, addr: Address):
+        self.bytes_received += len(data)
+        if not data:
+            return
+        now = asyncio.get_running_loop().time()
+        if data[0] == JOIN and len(data) == JOIN_PACKET.size:
+            self._join(JOIN_PACKET.unpack(data)[1], addr, now)
+        elif data[0] == INPUT and addr in self.clients:
+            match, side = self.clients[addr]
+            match.last_heard[side] = now
+            match.controllers[side].receive(*unpack_inputs(data))
+
+    def _join(self, match_id: int, addr: Address, now: float):
+        """Seat a client in a match, starting it once both sides are taken"""
+        if addr in self.clients:
+            # Repeated join (our WELCOME was lost)
+            match, side = self.clients[addr]
+        else:
+            match = self.matches.setdefault(match_id, ServerMatch(match_id))
+            if None not in match.addresses:
+                return  # Match is full
+            side = match.addresses.index(None)
+            match.addresses[side] = addr
+            self.clients[addr] = (match, side)
+        match.last_heard[side] = now
+        self._send(WELCOME_PACKET.pack(WELCOME, side), addr)
+
+        if not match.started and None not in match.addresses:
+            match.game.start_match(match.controllers[0], match.controllers[1], self.selected_difficulty)
+            match.started = True
+
+    def step(self):
+        """Advance every running match by one tick and send due state packets"""
+        self.ticks += 1
+        send_states = self.ticks % self.snapshot_interval == 0
+        now = asyncio.get_running_loop().time()
+        for match in list(self.matches.values()):
+            if any(addr is not None and now - heard > Config.NET_TIMEOUT
+                   for addr, heard in zip(match.addresses, match.last_heard)):
+                self._close(match)
+                continue
+            if not match.started:
+                continue
+            match.game.update(self.dt)
+            match.tick += 1
+            if send_states:
+                for side, addr in enumerate(match.addresses):
+                    self._send(match.state_packet(side), addr)
+
+    def _close(self, match: ServerMatch):
+        """Forget a match and its clients"""
+        for addr in match.addresses:
+            self.clients.pop(addr, None)
+        self.matches.pop(match.match_id, None)
+
+    async def run(self):
+        """Tick all matches at the physics rate until cancelled"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            now = loop.time()
+            # Catch up on missed ticks, but don't spiral after a long stall
+            for _ in range(int(Config.MAX_FRAME_TIME * self.physics_rate)):
+                if next_tick > now:
+                    break
+                self.step()
+                next_tick += self.dt
+            else:
+                next_tick = now
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+class _SnapshotController(Controller):
+    """The opponent's paddle on a client - moved only by server states"""
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        return Player(side, screen_width, screen_height, color=Config.PADDLE_COLOR)
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        pass
+
+
+class OnlineClient(_Endpoint):
+    """Client for one side of an online match
+
+    The local paddle is driven by a Controller (the keyboard by default)
+    and predicted locally; everything else follows the server.
+    """
+
+    # Seconds between JOIN retries until the server answers
+    JOIN_RETRY = 0.5
+
+    def __init__(self, match_id: int, controller: Controller = None, headless: bool = False,
+                 conditions: NetworkConditions = None, physics_rate: int = None):
+        """Initialize client
+
+        Args:
+            match_id: Match to join, the first two clients joining an id play each other
+            controller: Input for the local paddle, defaults to the keyboard.
+                It should drive a Player, which is what the server simulates.
+            headless: Don't open a window (tests and bots)
+            conditions: Optional simulated network conditions for outgoing packets
+            physics_rate: Local prediction rate, must match the server's
+        """
+        super().__init__(conditions)
+        self.match_id = match_id
+        self.controller = controller or KeyboardController()
+        self.game = Game(headless=headless, physics_rate=physics_rate)
+        self.side: Optional[int] = None
+        self.started = False
+        self.finished = False
+        self.seq = 0  # Seq of the next local input
+        self.pending: Deque[Tuple[int, int]] = deque()  # (seq, code) not yet acknowledged
+        self.recent: Deque[int] = deque(maxlen=Config.NET_INPUT_REDUNDANCY)
+        self.input_interval = max(1, round(self.game.physics_rate / Config.NET_INPUT_RATE))
+        self.last_state_tick = -1
+        self.corrections: List[float] = []  # Own paddle prediction error at each state, in pixels
+
+    @property
+    def local_paddle(self) -> Paddle:
+        return self.game.playerLeft if self.side == 0 else self.game.playerRight
+
+    @property
+    def remote_paddle(self) -> Paddle:
+        return self.game.playerRight if self.side == 0 else self.game.playerLeft
+
+    def datagram_received(self, data: bytes, addr: Address):
+        self.bytes_received += len(data)
+        if not data:
+            return
+        if data[0] == WELCOME and len(data) == WELCOME_PACKET.size and self.side is None:
+            self.side = WELCOME_PACKET.unpack(data)[1]
+        elif data[0] == STATE and len(data) == STATE_PACKET.size and self.side is not None:
+            self._apply_state(STATE_PACKET.unpack(data))
+
+    def _start(self):
+        """Set up the local game once the server starts sending states"""
+        local, remote = self.controller, _SnapshotController()
+        left, right = (local, remote) if self.side == 0 else (remote, local)
+        self.game.start_match(left, right)
+        self.started = True
+
+    def _apply_state(self, state: tuple):
+        """Take the server state and reconcile the predicted local paddle"""
+        (_, tick, ack, game_state, left_score, right_score, ball_x, ball_y, ball_vx, ball_vy, spin,
+         left_y, left_vy, right_y, right_vy) = state
+        if tick <= self.last_state_tick:
+            return  # Reordered, a newer state was already applied
+        self.last_state_tick = tick
+        if not self.started:
+            self._start()
+
+        game = self.game
+        game.scores = [left_score, right_score]
+        game.state = GAME_STATES[game_state]
+        if game.state == GameState.FINISH_SCREEN:
+            game.winner = "Left Player" if left_score > right_score else "Right Player"
+            self.finished = True
+
+        ball = game.ball
+        ball.position.update(ball_x, ball_y)
+        ball.previous_position.update(ball_x, ball_y)
+        ball.velocity.update(ball_vx, ball_vy)
+        ball.angular_velocity = spin
+
+        own_y, own_vy = (left_y, left_vy) if self.side == 0 else (right_y, right_vy)
+        remote_y, remote_vy = (right_y, right_vy) if self.side == 0 else (left_y, left_vy)
+        self.remote_paddle.position.y = remote_y
+        self.remote_paddle.velocity.y = remote_vy
+
+        # Reconciliation: server position, then the inputs it hasn't applied yet
+        paddle = self.local_paddle
+        predicted_y = paddle.position.y
+        while self.pending and ack != NO_ACK and self.pending[0][0] <= ack:
+            self.pending.popleft()
+        paddle.position.y = own_y
+        paddle.velocity.y = own_vy
+        for _, code in self.pending:
+            paddle.apply_input(game.physics_dt, code)
+        self.corrections.append(abs(paddle.position.y - predicted_y))
+
+    def tick(self):
+        """One local step: predict the own paddle and dead-reckon the rest"""
+        if not self.started or self.finished:
+            return
+        game = self.game
+        dt = game.physics_dt
+        paddle = self.local_paddle
+
+        self.controller.control(paddle, game.ball, dt)
+        code = paddle.last_input
+        self.pending.append((self.seq, code))
+        self.recent.append(code)
+        if self.seq % self.input_interval == 0:
+            self._send(pack_inputs(self.seq, list(self.recent)))
+        self.seq += 1
+
+        remote = self.remote_paddle
+        remote.move(dt)
+        remote._clamp_to_screen()
+        game.ball.update(dt, screen_height=game.height, wall_thickness=Config.WALL_THICKNESS)
+        game.ball.collide(paddle)
+        game.ball.collide(remote)
+
+    async def join(self):
+        """Ask the server for a seat until it answers"""
+        while self.side is None:
+            self._send(JOIN_PACKET.pack(JOIN, self.match_id))
+            await asyncio.sleep(self.JOIN_RETRY)
+
+    async def run(self, max_ticks: int = None):
+        """Join, then predict, send and draw at the physics rate until the match ends
+
+        Args:
+            max_ticks: Optional limit on local ticks (tests)
+        """
+        await self.join()
+        loop = asyncio.get_running_loop()
+        game = self.game
+        next_tick = loop.time()
+        ticks = 0
+        while game.running and not self.finished:
+            if not game.headless:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        game.running = False
+            now = loop.time()
+            while next_tick <= now:
+                self.tick()
+                next_tick += game.physics_dt
+                if self.started:
+                    ticks += 1
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            if not game.headless and self.started:
+                game.draw()
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+        if not game.headless and self.finished:
+            game.draw()
+
+
+async def serve(host: str, port: int, conditions: NetworkConditions = None) -> OnlineServer:
+    """Start a server on a UDP port and run its tick loop in the background"""
+    loop = asyncio.get_running_loop()
+    _, server = await loop.create_datagram_endpoint(lambda: OnlineServer(conditions), local_addr=(host, port))
+    server.tick_task = asyncio.ensure_future(server.run())
+    return server
+
+
+async def connect(host: str, port: int, match_id: int, controller: Controller = None, headless: bool = False,
+                  conditions: NetworkConditions = None) -> OnlineClient:
+    """Create a client connected to a server"""
+    loop = asyncio.get_running_loop()
+    _, client = await loop.create_datagram_endpoint(
+        lambda: OnlineClient(match_id, controller, headless, conditions), remote_addr=(host, port))
+    return client
+
+
+def main():
+    """Command line entry"""
+    parser = argparse.ArgumentParser(description="Online two-player Pong over UDP")
+    parser.add_argument("mode", choices=["server", "client"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9999)
+    parser.add_argument("--match", type=int, default=1, help="match id to join (client)")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated one-way latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="simulated extra random latency in seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="simulated packet loss probability")
+    args = parser.parse_args()
+
+    conditions = None
+    if args.latency or args.jitter or args.loss:
+        conditions = NetworkConditions(args.latency, args.jitter, args.loss)
+
+    async def run_server():
+        await serve(args.host, args.port, conditions)
+        await asyncio.Event().wait()
+
+    async def run_client():
+        client = await connect(args.host, args.port, args.match, conditions=conditions)
+        await client.run()
+        pygame.quit()
+
+    asyncio.run(run_server() if args.mode == "server" else run_client())
+
+
+if __name__ == "__main__":
+    main()
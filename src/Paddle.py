@@ -2,10 +2,20 @@ import pygame
 import math
 from typing import Any, Tuple
 from .GameObjectBase import GameObject
+from .Renderer import Renderer
 from .Config import Config
 
 class Paddle(GameObject):
     """Paddle object for Pong game with physics"""
+    
+    __slots__ = ('color', 'max_speed', 'acceleration', 'deceleration', 'screen_bounds', 'is_moving',
+                 'last_input')
+    
+    # Effective input of the last tick (see last_input), used by replays
+    INPUT_NONE = 0  # Updated without input (decelerating)
+    INPUT_UP = 1
+    INPUT_DOWN = 2
+    INPUT_SKIP = 3  # Not updated at all (e.g. bot waiting on its reaction time)
 
     def __init__(self, x: float, y: float, width: float = None, height: float = None, 
                  speed: float = None, mass: float = None, color: Any = None):
@@ -24,6 +34,7 @@ class Paddle(GameObject):
         self.screen_bounds: Tuple[int, int] = (0, 0)
         self.friction_coefficient = Config.PADDLE_FRICTION_COEFFICIENT  # Friction that affects ball spin
         self.is_moving = False
+        self.last_input = Paddle.INPUT_SKIP
 
     def set_screen_bounds(self, width: int, height: int, wall_thickness: int = 20):
         """Set screen boundaries for paddle movement"""
@@ -43,7 +54,10 @@ class Paddle(GameObject):
             acceleration_force = direction.normalize() * self.acceleration
             self.apply_force(acceleration_force * self.mass, dt)
             self.is_moving = True
+            # Only the direction matters, the input magnitude is normalized away
+            self.last_input = Paddle.INPUT_UP if direction.y < 0 else Paddle.INPUT_DOWN
         else:
+            self.last_input = Paddle.INPUT_NONE
             # Apply deceleration when no input
             if self.velocity.length() > 0:
                 decel_direction = -self.velocity.normalize()
@@ -63,6 +77,27 @@ class Paddle(GameObject):
         self.move(dt)
         self._clamp_to_screen()
 
+    def apply_input(self, dt: float, code: int):
+        """Advance one tick from a logged or transmitted input code
+        
+        Args:
+            dt: Delta time in seconds
+            code: One of the Paddle.INPUT_* codes
+        """
+        if code == Paddle.INPUT_SKIP:
+            self.last_input = Paddle.INPUT_SKIP
+            return
+        self.update(dt, direction=self._input_direction(code))
+
+    @staticmethod
+    def _input_direction(code: int) -> pygame.Vector2:
+        """Unit movement direction for an input code"""
+        if code == Paddle.INPUT_UP:
+            return pygame.Vector2(0, -1)
+        if code == Paddle.INPUT_DOWN:
+            return pygame.Vector2(0, 1)
+        return pygame.Vector2(0, 0)
+
     def _clamp_to_screen(self):
         """Keep paddle within screen boundaries"""
         if self.screen_bounds != (0, 0):
@@ -93,13 +128,13 @@ class Paddle(GameObject):
         
         # Combine contact point and paddle movement for spin
         spin_intensity = (relative_contact * 0.7 + paddle_velocity_factor * 0.3)
-        max_spin = 15.0  # Maximum radians per second
+        max_spin = Config.PADDLE_MAX_IMPACT_SPIN  # Maximum radians per second
         
         return spin_intensity * max_spin * self.friction_coefficient
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, renderer: Renderer):
         """Draw the paddle at current position"""
-        pygame.draw.rect(screen, self.color, self.get_rect())
+        renderer.fill(self.color, self.get_rect())
 
     def collide(self, other: 'GameObject') -> bool:
         """Check collision with other game object"""
@@ -0,0 +1,64 @@
+import math
+import numpy as np
+import pygame
+from .Ball import Ball
+from .Config import Config
+
+class PixelObserver:
+    """Low resolution grayscale frames of a game's playfield as NumPy arrays
+
+    Draws the walls, paddles and balls (no GameUI text, net or effects)
+    straight into a small 8-bit off-screen surface and returns a
+    pygame.surfarray view of it. The view shares the surface memory, so
+    each observe() returns the same array updated in place, without a copy
+    or a full-resolution render. Copy the array to keep a frame.
+
+    Works with headless games, no display is needed.
+    """
+
+    # Gray levels, chosen so the ball stands out from the paddles
+    BACKGROUND = 0
+    WALL = 96
+    PADDLE = 160
+    BALL = 255
+
+    def __init__(self, game, size: tuple = None):
+        """Initialize observer
+
+        Args:
+            game: Game (headless or not) whose playfield is observed
+            size: (width, height) of the frames, defaults to Config.OBSERVATION_SIZE
+        """
+        self.game = game
+        width, height = size or Config.OBSERVATION_SIZE
+        self.surface = pygame.Surface((width, height), depth=8)
+        self.surface.set_palette([(level, level, level) for level in range(256)])
+        self.scale_x = width / game.width
+        self.scale_y = height / game.height
+        # Transposed to rows x columns (height, width), still a view of the pixels
+        self.frame: np.ndarray = pygame.surfarray.pixels2d(self.surface).T
+
+    def _rect(self, obj) -> tuple:
+        """Screen rect of an object scaled down, at least one pixel in size"""
+        x = int(obj.position.x * self.scale_x)
+        y = int(obj.position.y * self.scale_y)
+        width = max(1, math.ceil(obj.width * self.scale_x))
+        height = max(1, math.ceil(obj.height * self.scale_y))
+        return x, y, width, height
+
+    def observe(self) -> np.ndarray:
+        """Render the current playfield
+
+        Returns:
+            uint8 array of shape (height, width), the same array every call
+        """
+        surface = self.surface
+        game = self.game
+        # Clearing through the view is much cheaper than a full-surface fill
+        self.frame.fill(PixelObserver.BACKGROUND)
+        surface.fill(PixelObserver.WALL, self._rect(game.topWall))
+        surface.fill(PixelObserver.WALL, self._rect(game.bottomWall))
+        for obj in game.entities.objects():
+            level = PixelObserver.BALL if isinstance(obj, Ball) else PixelObserver.PADDLE
+            surface.fill(level, self._rect(obj))
+        return self.frame
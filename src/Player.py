@@ -5,6 +5,8 @@ from .Config import Config
 
 class Player(Paddle):
     """Player class with automatic positioning and setup"""
+    
+    __slots__ = ('order',)
 
     def __init__(self, side: str, screen_width: int, screen_height: int, 
                  paddle_width: int = None, paddle_height: int = None, 
@@ -0,0 +1,60 @@
+import pygame
+from typing import List, Optional, Sequence
+from .Config import Config
+from .Renderer import Renderer, SurfaceRenderer
+
+class PlayfieldLayer:
+    """Pre-rendered static playfield: background fill, net and walls
+
+    The layer is composed once. Drawing it is a background fill plus one blit
+    per non-background strip (each wall and the net column), which is cheaper
+    than a full-screen blit since most of the playfield is plain background.
+    The layer is rebuilt automatically when anything it depends on changes:
+    the screen size, the Config colors or WALL_THICKNESS, or the walls' rects
+    and colors.
+    """
+
+    def __init__(self, ui):
+        """Initialize playfield layer
+
+        Args:
+            ui: GameUI used to draw the net
+        """
+        self.ui = ui
+        self.surface: Optional[pygame.Surface] = None
+        self._detail_rects: List[pygame.Rect] = []
+        self._inputs = None
+
+    def _current_inputs(self, size, walls: Sequence) -> tuple:
+        """Everything the composed surface depends on"""
+        return (size, Config.BACKGROUND_COLOR, Config.WALL_COLOR, Config.WALL_THICKNESS,
+                self.ui.dark_grey, tuple((tuple(wall.get_rect()), wall.color) for wall in walls))
+
+    def get_surface(self, renderer: Renderer, walls: Sequence) -> pygame.Surface:
+        """Return the composed playfield, rebuilding it if its inputs changed
+
+        Args:
+            renderer: Renderer the layer will be blitted with (sets size and pixel format)
+            walls: Static Wall objects to bake into the layer
+        """
+        inputs = self._current_inputs(renderer.get_size(), walls)
+        if self.surface is None or inputs != self._inputs:
+            surface = renderer.create_surface(renderer.get_size())
+            surface.fill(Config.BACKGROUND_COLOR)
+            layer = SurfaceRenderer(surface)
+            self.ui.draw_net(layer)
+            for wall in walls:
+                wall.draw(layer)
+            self.surface = surface
+            self._inputs = inputs
+            
+            # Areas that differ from the plain background fill
+            self._detail_rects = [wall.get_rect() for wall in walls] + [self.ui.get_net_rect()]
+        return self.surface
+
+    def draw(self, renderer: Renderer, walls: Sequence):
+        """Draw the playfield onto the frame"""
+        surface = self.get_surface(renderer, walls)
+        renderer.fill(Config.BACKGROUND_COLOR)
+        for rect in self._detail_rects:
+            renderer.blit(surface, rect, rect)
@@ -0,0 +1,297 @@
+import math
+import weakref
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional, Tuple
+import pygame
+
+class Renderer(ABC):
+    """Drawing backend for Game, GameUI and the game objects
+
+    Everything that ends up on screen is drawn through these calls, in
+    render pixels (logical pixels times scale, see GameObject.scaled_copy),
+    so game objects and simulation code never call pygame.draw themselves.
+    Layers composed once (menu screens, the playfield, text, ball sprites)
+    are plain pygame Surfaces drawn with blit(); a surface must not change
+    after it was first blitted, since backends may keep a copy of it.
+    """
+
+    __slots__ = ()
+
+    # Render pixels per logical pixel
+    scale = 1.0
+
+    @abstractmethod
+    def get_size(self) -> Tuple[int, int]:
+        """Size of the frame in render pixels"""
+        pass
+
+    @abstractmethod
+    def fill(self, color, rect=None):
+        """Fill a rect, or the whole frame when rect is None"""
+        pass
+
+    @abstractmethod
+    def blit(self, surface: pygame.Surface, dest, area=None) -> pygame.Rect:
+        """Draw a surface (or its area) with its top left corner at dest
+
+        Returns:
+            The frame area drawn to
+        """
+        pass
+
+    @abstractmethod
+    def circle(self, color, center, radius: int):
+        """Draw a filled circle"""
+        pass
+
+    @abstractmethod
+    def line(self, color, start, end, width: int = 1):
+        """Draw a line"""
+        pass
+
+    @abstractmethod
+    def present(self, dirty_rects: Optional[Iterable[pygame.Rect]] = None):
+        """Show the frame
+
+        Args:
+            dirty_rects: Changed frame areas, None when all of it may have changed
+        """
+        pass
+
+    def create_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Off-screen surface for a layer that is composed once and then blitted"""
+        return pygame.Surface(size)
+
+
+class NullRenderer(Renderer):
+    """Backend that draws nothing, for headless simulations"""
+
+    __slots__ = ()
+
+    def get_size(self) -> Tuple[int, int]:
+        return (0, 0)
+
+    def fill(self, color, rect=None):
+        pass
+
+    def blit(self, surface: pygame.Surface, dest, area=None) -> pygame.Rect:
+        return pygame.Rect(0, 0, 0, 0)
+
+    def circle(self, color, center, radius: int):
+        pass
+
+    def line(self, color, start, end, width: int = 1):
+        pass
+
+    def present(self, dirty_rects: Optional[Iterable[pygame.Rect]] = None):
+        pass
+
+
+# Stateless, so all headless games share one and it costs them nothing
+NULL_RENDERER = NullRenderer()
+
+
+class SurfaceRenderer(Renderer):
+    """Software backend: pygame.draw and blits onto a Surface
+
+    When the surface is smaller than the window (a render scale below 1.0)
+    present() upscales the frame, or only its changed areas, to the window
+    with pygame.transform.scale.
+    """
+
+    __slots__ = ('surface', 'window', 'scale')
+
+    def __init__(self, surface: pygame.Surface, window: pygame.Surface = None, scale: float = 1.0):
+        """Initialize software renderer
+
+        Args:
+            surface: Surface drawn on (the display surface, or an off-screen
+                surface at the render resolution)
+            window: Display surface to present to, None for off-screen
+                drawing where present() does nothing
+            scale: Render pixels per logical pixel
+        """
+        self.surface = surface
+        self.window = window
+        self.scale = scale
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.surface.get_size()
+
+    def fill(self, color, rect=None):
+        self.surface.fill(color, rect)
+
+    def blit(self, surface: pygame.Surface, dest, area=None) -> pygame.Rect:
+        return self.surface.blit(surface, dest, area)
+
+    def circle(self, color, center, radius: int):
+        pygame.draw.circle(self.surface, color, center, radius)
+
+    def line(self, color, start, end, width: int = 1):
+        pygame.draw.line(self.surface, color, start, end, width)
+
+    def create_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        # Same pixel format as the frame, so blits need no conversion
+        return pygame.Surface(size, 0, self.surface)
+
+    def present(self, dirty_rects: Optional[Iterable[pygame.Rect]] = None):
+        window = self.window
+        if window is None:
+            return
+        if self.surface is not window:
+            if dirty_rects is None:
+                pygame.transform.scale(self.surface, window.get_size(), window)
+            else:
+                dirty_rects = [self._upscale_rect(rect) for rect in dirty_rects]
+
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
+    def _upscale_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """Upscale one area of the frame to the window
+
+        Returns:
+            The window area it covers (pixel exact when 1 / scale is an integer)
+        """
+        rect = rect.clip(self.surface.get_rect())
+        if not rect:
+            return rect
+        scale_x = self.window.get_width() / self.surface.get_width()
+        scale_y = self.window.get_height() / self.surface.get_height()
+        left, top = int(rect.left * scale_x), int(rect.top * scale_y)
+        target = pygame.Rect(left, top, math.ceil(rect.right * scale_x) - left, math.ceil(rect.bottom * scale_y) - top)
+        target = target.clip(self.window.get_rect())
+        pygame.transform.scale(self.surface.subsurface(rect), target.size, self.window.subsurface(target))
+        return target
+
+
+class TextureRenderer(Renderer):
+    """SDL2 Renderer/Texture backend (pygame._sdl2.video)
+
+    Every surface blitted is uploaded once and its texture kept for as long
+    as the surface is alive, so static layers (menu screens, the playfield,
+    text, ball sprites) stay resident and each frame is only texture copies
+    and rect fills. Circles are cached textures too, lines are drawn by SDL.
+
+    With a scale below 1.0 the frame is drawn into a smaller target texture
+    that present() stretches over the window. Runs on the GPU, or on SDL's
+    software renderer (accelerated=False, or as SDL's fallback when no GPU
+    renderer is available), which is how it is tested without a GPU.
+    """
+
+    __slots__ = ('window', 'renderer', 'target', 'scale', '_size', '_textures', '_circles')
+
+    def __init__(self, size: Tuple[int, int], scale: float = 1.0, accelerated: bool = None, title: str = "Pong"):
+        """Open a window with an SDL renderer
+
+        Args:
+            size: Window size in pixels
+            scale: Render pixels per logical pixel
+            accelerated: True to require a GPU renderer, False for SDL's
+                software renderer, None to let SDL pick (GPU when available)
+            title: Window title
+        """
+        # Experimental pygame module, only imported when this backend is used
+        from pygame._sdl2.video import Renderer as SDLRenderer, Texture, Window
+
+        self.window = Window(title, size)
+        self.renderer = SDLRenderer(self.window, accelerated=-1 if accelerated is None else int(accelerated),
+                                    target_texture=scale != 1.0)
+        self.scale = scale
+        self.target = None
+        self._size = size
+        if scale != 1.0:
+            self._size = (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+            self.target = Texture(self.renderer, self._size, target=True)
+            self.renderer.target = self.target
+        # Uploaded surfaces, dropped together with the surface
+        self._textures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._circles: Dict[tuple, pygame.Surface] = {}
+
+    def get_size(self) -> Tuple[int, int]:
+        return self._size
+
+    def _texture(self, surface: pygame.Surface):
+        """The resident texture of a surface, uploaded on first use"""
+        texture = self._textures.get(surface)
+        if texture is None:
+            from pygame._sdl2.video import Texture
+            texture = Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(rect)
+
+    def blit(self, surface: pygame.Surface, dest, area=None) -> pygame.Rect:
+        area = surface.get_rect() if area is None else pygame.Rect(area)
+        rect = pygame.Rect(dest[0], dest[1], area.width, area.height)
+        self._texture(surface).draw(srcrect=area, dstrect=rect)
+        return rect.clip(pygame.Rect((0, 0), self._size))
+
+    def circle(self, color, center, radius: int):
+        key = (tuple(pygame.Color(color)), radius)
+        surface = self._circles.get(key)
+        if surface is None:
+            # Drawn once in software, then kept as a texture like any other layer
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            self._circles[key] = surface
+        self.blit(surface, (center[0] - radius, center[1] - radius))
+
+    def line(self, color, start, end, width: int = 1):
+        renderer = self.renderer
+        renderer.draw_color = pygame.Color(color)
+        # Thick lines as parallel 1 pixel lines across the minor axis, like pygame.draw.line
+        steep = abs(end[1] - start[1]) > abs(end[0] - start[0])
+        for offset in range(-(width // 2), width - width // 2):
+            dx, dy = (offset, 0) if steep else (0, offset)
+            renderer.draw_line((start[0] + dx, start[1] + dy), (end[0] + dx, end[1] + dy))
+
+    def present(self, dirty_rects: Optional[Iterable[pygame.Rect]] = None):
+        # The whole frame is presented, there is nothing to gain from dirty rects
+        renderer = self.renderer
+        if self.target is not None:
+            renderer.target = None
+            self.target.draw(dstrect=pygame.Rect((0, 0), self.window.size))
+            renderer.present()
+            renderer.target = self.target
+        else:
+            renderer.present()
+
+
+# Backend names accepted by create_renderer and Config.RENDER_BACKEND
+RENDER_BACKENDS = ("surface", "texture", "texture_software")
+
+
+def create_renderer(backend: str, size: Tuple[int, int], scale: float = 1.0) -> Renderer:
+    """Open the game window with a render backend
+
+    Args:
+        backend: "surface" (software blits onto the display surface),
+            "texture" (SDL2 textures, on the GPU when there is one) or
+            "texture_software" (SDL2 textures on SDL's software renderer)
+        size: Window size in pixels
+        scale: Internal render resolution as a fraction of the window
+
+    Returns:
+        The renderer, drawing at size times scale
+    """
+    if backend == "surface":
+        window = pygame.display.set_mode(size)
+        pygame.display.set_caption("Pong")
+        surface = window
+        if scale != 1.0:
+            # Everything draws here, present() upscales it to the window
+            render_size = (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+            surface = pygame.Surface(render_size, 0, window)
+        return SurfaceRenderer(surface, window, scale)
+    if backend in ("texture", "texture_software"):
+        return TextureRenderer(size, scale, accelerated=None if backend == "texture" else False)
+    raise ValueError(f"Render backend must be one of {', '.join(RENDER_BACKENDS)}")
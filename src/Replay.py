@@ -0,0 +1,473 @@
+"""
+Match Replays
+=============
+
+A replay is the RNG seed plus a per-tick input log, which is all that is
+needed to re-run a match exactly through Game.update. Periodic full-state
+keyframes and a trailing index let playback jump to any tick and only
+simulate the few ticks since the previous keyframe.
+
+Binary layout (little endian):
+    header    b"PREP", version u8, seed u64, dt f64, speed difficulty u8,
+              left side u8, right side u8  (0 = player, 1-3 = Easy/Medium/Hard bot)
+    ticks     one byte per tick:
+                  bits 0-1  left paddle input (Paddle.INPUT_*)
+                  bits 2-3  right paddle input
+                  bit 4     left bot target follows as i16 pixels
+                  bit 5     right bot target follows as i16 pixels
+              bit 7 set: the tick byte repeats, followed by a varint repeat count
+    keyframe  0x41 followed by the full match state after that many ticks
+              (see KEYFRAME), every Config.REPLAY_KEYFRAME_INTERVAL ticks
+    end       0x40, final scores (u8, u8), keyframe count u32 and one
+              (tick u32, offset u32) index entry per keyframe
+    footer    offset of the end marker u32, b"PIDX"
+
+Paddle inputs are the effective input each paddle applied that tick, so a
+match recorded from the keyboard, a bot or a script replays the same way.
+Bot targets are rounded to whole pixels, only written when that changes and
+kept for review; the replay itself is driven by the inputs alone.
+
+Ball serves are the only draws from the match RNG (bots draw from their own
+streams of the seed, see Game.start_match), so a keyframe does not need the
+RNG state: seeking reseeds and redraws the serves played so far.
+"""
+
+import struct
+from bisect import bisect_right
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from .game import Game, GameState
+from .Paddle import Paddle
+from .Player import Player
+from .Bot import Bot
+from .Controller import Controller
+from .Config import Config
+
+MAGIC = b"PREP"
+VERSION = 3
+HEADER = struct.Struct("<4sBQdBBB")
+TARGET = struct.Struct("<h")
+SCORES = struct.Struct("<BB")
+INDEX_COUNT = struct.Struct("<I")
+INDEX_ENTRY = struct.Struct("<II")
+FOOTER = struct.Struct("<I4s")
+FOOTER_MAGIC = b"PIDX"
+
+# tick, game state, scores, paddle hits, current rally, rally count,
+# ball position/velocity/spin/rotation/speed,
+# left and right paddle position/velocity/is_moving
+KEYFRAME = struct.Struct("<IBBBHHHB7d4d?4d?")
+RALLY_LENGTH = struct.Struct("<H")
+
+LEFT_TARGET_FLAG = 0x10
+RIGHT_TARGET_FLAG = 0x20
+END_MARKER = 0x40
+KEYFRAME_MARKER = 0x41
+REPEAT_FLAG = 0x80
+
+BOT_DIFFICULTIES = ["Easy", "Medium", "Hard"]
+GAME_STATES = list(GameState)
+
+
+def _side_code(paddle: Paddle) -> int:
+    """Header code for the paddle type on one side"""
+    if isinstance(paddle, Bot):
+        return 1 + BOT_DIFFICULTIES.index(paddle.difficulty)
+    return 0
+
+
+def _write_varint(buffer: bytearray, value: int):
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _pack_keyframe(tick: int, game) -> bytes:
+    """Serialize the match state the simulation depends on"""
+    ball = game.ball
+    left = game.playerLeft
+    right = game.right_paddle
+    keyframe = KEYFRAME.pack(
+        tick, GAME_STATES.index(game.state), game.scores[0], game.scores[1],
+        game.paddle_hits[0], game.paddle_hits[1], game.current_rally, len(game.rally_lengths),
+        ball.position.x, ball.position.y, ball.velocity.x, ball.velocity.y,
+        ball.angular_velocity, ball.rotation_angle, ball.speed,
+        left.position.x, left.position.y, left.velocity.x, left.velocity.y, left.is_moving,
+        right.position.x, right.position.y, right.velocity.x, right.velocity.y, right.is_moving)
+    return keyframe + b"".join(RALLY_LENGTH.pack(length) for length in game.rally_lengths)
+
+
+def _apply_keyframe(data: bytes, offset: int, game) -> int:
+    """Restore a keyframe into a game started from the same header
+
+    Returns:
+        The tick the keyframe was taken at
+    """
+    (tick, state, left_score, right_score, left_hits, right_hits, current_rally, rally_count,
+     ball_x, ball_y, ball_vx, ball_vy, spin, rotation, speed,
+     left_x, left_y, left_vx, left_vy, left_moving,
+     right_x, right_y, right_vx, right_vy, right_moving) = KEYFRAME.unpack_from(data, offset)
+    offset += KEYFRAME.size
+
+    # Redraw the serves played so far so the RNG continues exactly as recorded
+    for _ in range(left_score + right_score):
+        game.ball.reset_ball()
+
+    game.state = GAME_STATES[state]
+    game.scores = [left_score, right_score]
+    game.paddle_hits = [left_hits, right_hits]
+    game.current_rally = current_rally
+    game.rally_lengths = [RALLY_LENGTH.unpack_from(data, offset + i * RALLY_LENGTH.size)[0]
+                          for i in range(rally_count)]
+
+    ball = game.ball
+    ball.position.update(ball_x, ball_y)
+    ball.previous_position.update(ball_x, ball_y)
+    ball.velocity.update(ball_vx, ball_vy)
+    ball.angular_velocity = spin
+    ball.rotation_angle = rotation
+    ball.speed = speed
+    ball.trajectory_version += 1
+
+    for paddle, x, y, vx, vy, moving in ((game.playerLeft, left_x, left_y, left_vx, left_vy, left_moving),
+                                         (game.right_paddle, right_x, right_y, right_vx, right_vy, right_moving)):
+        paddle.position.update(x, y)
+        paddle.velocity.update(vx, vy)
+        paddle.is_moving = moving
+    return tick
+
+
+def _skip_keyframe(data: bytes, offset: int) -> int:
+    """Offset just past the keyframe starting at offset"""
+    rally_count = KEYFRAME.unpack_from(data, offset)[7]
+    return offset + KEYFRAME.size + rally_count * RALLY_LENGTH.size
+
+
+class ReplayRecorder:
+    """Streams a match to a binary file while it is played
+
+    Attach it with Game.recorder before start_match; Game then calls
+    begin_match, record_tick after every update and the recorder writes the
+    end marker and keyframe index itself when the match finishes. Replays
+    need a fixed step, which the windowed loop and run_headless both use.
+    """
+
+    # Bytes buffered before writing to the stream
+    FLUSH_SIZE = 4096
+
+    def __init__(self, stream: BinaryIO, keyframe_interval: int = None):
+        """Initialize recorder
+
+        Args:
+            stream: Binary file-like object to write to
+            keyframe_interval: Ticks between keyframes, defaults to
+                Config.REPLAY_KEYFRAME_INTERVAL
+        """
+        self.stream = stream
+        self.keyframe_interval = keyframe_interval or Config.REPLAY_KEYFRAME_INTERVAL
+        self._buffer = bytearray()
+        self._flushed = 0
+        self._run_byte: Optional[int] = None
+        self._run_length = 0
+        self._last_targets = [None, None]
+        self._header = None
+        self._ticks = 0
+        self._index: List[Tuple[int, int]] = []
+        self.recording = False
+
+    def begin_match(self, game, seed: int):
+        """Start recording a match that was just started"""
+        # The header is written with the first tick, once the step size is known
+        self._header = (seed, game.selected_difficulty, _side_code(game.playerLeft), _side_code(game.right_paddle))
+        self._run_byte = None
+        self._run_length = 0
+        self._last_targets = [None, None]
+        self._ticks = 0
+        self._index = []
+        self.recording = True
+
+    def record_tick(self, game, dt: float):
+        """Append the inputs applied during the tick Game.update just ran
+
+        Args:
+            game: The game being recorded
+            dt: Step size of the tick, must stay fixed for the whole match
+        """
+        if not self.recording:
+            return
+        if self._header is not None:
+            # Offsets in the index are relative to the start of the replay
+            self._flushed = -len(self._buffer)
+            seed, selected_difficulty, left, right = self._header
+            self._buffer += HEADER.pack(MAGIC, VERSION, seed, dt, selected_difficulty, left, right)
+            self._header = None
+
+        tick = game.playerLeft.last_input | (game.right_paddle.last_input << 2)
+        targets = []
+        for side, paddle in enumerate((game.playerLeft, game.right_paddle)):
+            if not isinstance(paddle, Bot):
+                continue
+            target = round(paddle.target_y)
+            if target != self._last_targets[side]:
+                self._last_targets[side] = target
+                tick |= LEFT_TARGET_FLAG if side == 0 else RIGHT_TARGET_FLAG
+                targets.append(target)
+
+        if targets:
+            # Ticks with target payloads are never merged into runs
+            self._end_run()
+            self._buffer.append(tick)
+            for target in targets:
+                self._buffer += TARGET.pack(target)
+        elif tick == self._run_byte:
+            self._run_length += 1
+        else:
+            self._end_run()
+            self._run_byte = tick
+            self._run_length = 1
+        self._ticks += 1
+
+        if game.winner is not None:
+            self.finish(game)
+            return
+        if self._ticks % self.keyframe_interval == 0:
+            self._write_keyframe(game)
+        if len(self._buffer) >= self.FLUSH_SIZE:
+            self.flush()
+
+    def _end_run(self):
+        """Write out the pending run of identical tick bytes"""
+        if self._run_length == 1:
+            self._buffer.append(self._run_byte)
+        elif self._run_length > 1:
+            self._buffer.append(self._run_byte | REPEAT_FLAG)
+            _write_varint(self._buffer, self._run_length)
+        self._run_byte = None
+        self._run_length = 0
+
+    def _offset(self) -> int:
+        """Replay offset of the next byte written"""
+        return self._flushed + len(self._buffer)
+
+    def _write_keyframe(self, game):
+        """Write the full match state after the current tick and index it"""
+        self._end_run()
+        self._index.append((self._ticks, self._offset()))
+        self._buffer.append(KEYFRAME_MARKER)
+        self._buffer += _pack_keyframe(self._ticks, game)
+
+    def finish(self, game):
+        """Write the end marker with the final scores and the keyframe index"""
+        if not self.recording:
+            return
+        self._end_run()
+        end_offset = self._offset()
+        self._buffer.append(END_MARKER)
+        self._buffer += SCORES.pack(*game.scores)
+        self._buffer += INDEX_COUNT.pack(len(self._index))
+        for tick, offset in self._index:
+            self._buffer += INDEX_ENTRY.pack(tick, offset)
+        self._buffer += FOOTER.pack(end_offset, FOOTER_MAGIC)
+        self.recording = False
+        self.flush()
+
+    def flush(self):
+        """Write buffered bytes to the stream"""
+        self.stream.write(self._buffer)
+        self._flushed += len(self._buffer)
+        self._buffer.clear()
+
+
+class Replay:
+    """A recorded match that can be played from the start or from any tick
+
+    Recordings cut short (no end marker) have no index; they still play
+    and seek, but seeking simulates from the first tick.
+    """
+
+    def __init__(self, data: bytes):
+        """Parse the header and keyframe index
+
+        Args:
+            data: Complete replay bytes as written by ReplayRecorder
+        """
+        magic, version, seed, dt, selected_difficulty, left, right = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a replay file or unsupported version")
+
+        self.data = data
+        self.seed = seed
+        self.dt = dt
+        self.selected_difficulty = selected_difficulty
+        self.sides = (left, right)
+        self.final_scores: Optional[Tuple[int, int]] = None
+        self.keyframe_ticks: List[int] = []
+        self._keyframe_offsets: List[int] = []
+
+        footer_offset = len(data) - FOOTER.size
+        if footer_offset > HEADER.size and FOOTER.unpack_from(data, footer_offset)[1] == FOOTER_MAGIC:
+            end_offset = FOOTER.unpack_from(data, footer_offset)[0]
+            self.final_scores = SCORES.unpack_from(data, end_offset + 1)
+            index_offset = end_offset + 1 + SCORES.size
+            count = INDEX_COUNT.unpack_from(data, index_offset)[0]
+            for i in range(count):
+                tick, offset = INDEX_ENTRY.unpack_from(data, index_offset + INDEX_COUNT.size + i * INDEX_ENTRY.size)
+                self.keyframe_ticks.append(tick)
+                self._keyframe_offsets.append(offset)
+
+    @classmethod
+    def read(cls, stream: BinaryIO) -> 'Replay':
+        """Load a replay written by ReplayRecorder"""
+        return cls(stream.read())
+
+    def iter_ticks(self, offset: int = HEADER.size) -> Iterator[Tuple[int, Tuple[Optional[int], Optional[int]]]]:
+        """Decode the input log from a byte offset
+
+        Yields:
+            (tick byte, (left target, right target)) per tick, a target is
+            None unless the bot's logged target changed on that tick
+        """
+        data = self.data
+        no_targets = (None, None)
+        while offset < len(data):
+            byte = data[offset]
+            offset += 1
+            if byte == END_MARKER:
+                return
+            if byte == KEYFRAME_MARKER:
+                offset = _skip_keyframe(data, offset)
+                continue
+            if byte & REPEAT_FLAG:
+                count, offset = _read_varint(data, offset)
+                for _ in range(count):
+                    yield byte & 0x0F, no_targets
+                continue
+
+            targets = [None, None]
+            for side, flag in ((0, LEFT_TARGET_FLAG), (1, RIGHT_TARGET_FLAG)):
+                if byte & flag:
+                    targets[side] = TARGET.unpack_from(data, offset)[0]
+                    offset += TARGET.size
+            yield byte & 0x0F, tuple(targets)
+
+    def seek(self, tick: int = 0, game: Game = None) -> 'ReplayPlayback':
+        """Set up playback at a tick
+
+        Starts from the last keyframe at or before the tick, so only the
+        ticks since that keyframe are simulated.
+
+        Args:
+            tick: Number of ticks into the match
+            game: Headless Game to play into, a new one is created if omitted
+
+        Returns:
+            Playback positioned at the tick (or at the end of the replay)
+        """
+        game = game or Game(headless=True)
+        left = ReplayController(self.sides[0])
+        right = ReplayController(self.sides[1])
+        game.start_match(left, right, self.selected_difficulty, seed=self.seed)
+
+        start_tick = 0
+        offset = HEADER.size
+        keyframe = bisect_right(self.keyframe_ticks, tick) - 1
+        if keyframe >= 0:
+            offset = self._keyframe_offsets[keyframe]
+            start_tick = _apply_keyframe(self.data, offset + 1, game)
+            offset = _skip_keyframe(self.data, offset + 1)
+
+        playback = ReplayPlayback(self, game, left, right, self.iter_ticks(offset), start_tick)
+        playback.step(tick - start_tick)
+        return playback
+
+    def play(self, game: Game = None) -> Game:
+        """Re-run the whole match through Game.update
+
+        Args:
+            game: Headless Game to play into, a new one is created if omitted
+
+        Returns:
+            The game after the last recorded tick
+        """
+        playback = self.seek(0, game)
+        playback.step()
+        return playback.game
+
+
+class ReplayPlayback:
+    """A game being driven from a replay, created by Replay.seek"""
+
+    def __init__(self, replay: Replay, game: Game, left: 'ReplayController', right: 'ReplayController',
+                 ticks: Iterator, tick: int):
+        self.replay = replay
+        self.game = game
+        self.left = left
+        self.right = right
+        self.tick = tick  # Ticks played so far
+        self._ticks = ticks
+
+    def step(self, count: int = None) -> int:
+        """Play recorded ticks
+
+        Args:
+            count: Ticks to play, all remaining ticks if omitted
+
+        Returns:
+            Number of ticks actually played
+        """
+        if count is not None and count <= 0:
+            return 0
+
+        played = 0
+        for tick_byte, (left_target, right_target) in self._ticks:
+            self.left.set_input(tick_byte & 0x03, left_target)
+            self.right.set_input(tick_byte >> 2, right_target)
+            self.game.update(self.replay.dt)
+            played += 1
+            if played == count:
+                break
+        self.tick += played
+        return played
+
+
+class ReplayController(Controller):
+    """Drives one paddle with the input ReplayPlayback sets for each tick"""
+
+    def __init__(self, side_code: int):
+        """Initialize replay controller
+
+        Args:
+            side_code: Paddle type from the replay header
+        """
+        self.side_code = side_code
+        self.code = Paddle.INPUT_SKIP
+        self.target = None
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        if self.side_code == 0:
+            return Player(side, screen_width, screen_height, color=Config.PADDLE_COLOR)
+        return Bot(side, screen_width, screen_height, difficulty=BOT_DIFFICULTIES[self.side_code - 1],
+                   color=Config.PADDLE_COLOR)
+
+    def set_input(self, code: int, target: Optional[int]):
+        """Set the recorded input (and logged bot target) for the next tick"""
+        self.code = code
+        self.target = target
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        if self.target is not None:
+            paddle.target_y = self.target
+        # Bots move with their AI speed limit, players with the normal one
+        paddle.apply_input(dt, self.code)
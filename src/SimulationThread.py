@@ -0,0 +1,125 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from .Config import Config
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """Everything the gameplay screen shows after one physics step
+
+    Objects are detached copies (GameObject.detached_copy), so a snapshot
+    never changes after it was published and can be drawn while the
+    simulation keeps running.
+    """
+    time: float  # time.perf_counter() when the step finished
+    objects: tuple  # Paddles, obstacles and balls in draw order
+    scores: Tuple[int, int]
+    is_single_player: bool
+
+    @classmethod
+    def capture(cls, game) -> 'GameSnapshot':
+        """Snapshot the current state of a game"""
+        return cls(time.perf_counter(), tuple(obj.detached_copy() for obj in game.entities.objects()),
+                   tuple(game.scores), game.is_single_player)
+
+
+class SnapshotBuffer:
+    """Double buffer of the two latest snapshots, one writer and any readers
+
+    Publishing replaces a single (previous, latest) tuple reference, which is
+    atomic with or without the GIL, so neither side ever blocks or sees a
+    half-written pair.
+    """
+
+    def __init__(self):
+        self._pair: Optional[Tuple[GameSnapshot, GameSnapshot]] = None
+
+    def reset(self, snapshot: GameSnapshot):
+        """Start over from a single snapshot (e.g. a new match)"""
+        self._pair = (snapshot, snapshot)
+
+    def publish(self, snapshot: GameSnapshot):
+        """Make a snapshot the latest, keeping the one before it for interpolation"""
+        pair = self._pair
+        self._pair = (pair[1] if pair else snapshot, snapshot)
+
+    def read(self) -> Optional[Tuple[GameSnapshot, GameSnapshot]]:
+        """The (previous, latest) snapshots, None before the first publish"""
+        return self._pair
+
+
+class SimulationThread:
+    """Runs Game.update at the fixed physics rate on its own thread
+
+    After each step the thread publishes a GameSnapshot to a SnapshotBuffer
+    and the main thread renders the latest one, so slow frames (flip, text
+    rendering) no longer delay physics steps. Steps are scheduled on an
+    absolute clock and keep their cadence through render hitches; only a
+    backlog longer than Config.MAX_FRAME_TIME (e.g. the process was
+    suspended) is dropped instead of replayed in a burst.
+
+    Game state shared with input handling is guarded by lock. On a
+    free-threaded Python build the simulation runs on a second core.
+    """
+
+    def __init__(self, game):
+        """Initialize simulation thread
+
+        Args:
+            game: Game to step, its physics_dt sets the rate
+        """
+        self.game = game
+        self.lock = threading.Lock()
+        self.buffer = SnapshotBuffer()
+        self.ticks = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+
+    def start(self):
+        """Start stepping in the background"""
+        self._thread.start()
+
+    def stop(self):
+        """Stop the thread and wait for it to finish"""
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+
+    def wake(self):
+        """Resume stepping right away after a match was started"""
+        self._wake.set()
+
+    def reset(self):
+        """Publish the current state as the only snapshot (call with lock held)"""
+        self.buffer.reset(GameSnapshot.capture(self.game))
+
+    def _run(self):
+        """Thread body"""
+        from .game import GameState
+
+        game = self.game
+        dt = game.physics_dt
+        next_step = time.perf_counter()
+        while not self._stop.is_set():
+            with self.lock:
+                playing = game.state == GameState.PLAYING
+                if playing:
+                    game.update(dt)
+                    self.ticks += 1
+                    self.buffer.publish(GameSnapshot.capture(game))
+
+            if not playing:
+                # Nothing to simulate on menus, sleep until a match starts
+                self._wake.wait(Config.MENU_IDLE_TIMEOUT)
+                self._wake.clear()
+                next_step = time.perf_counter()
+                continue
+
+            next_step += dt
+            delay = next_step - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif -delay > Config.MAX_FRAME_TIME:
+                next_step = time.perf_counter()
@@ -0,0 +1,59 @@
+import math
+from typing import Dict, List, Tuple
+
+class SpatialHash:
+    """Uniform grid broad phase keyed by integer cell coordinates
+
+    Items are stored by integer id with an axis-aligned box. A query returns
+    every item whose box shares a cell with the query box, so the cost of
+    finding collision candidates depends on how crowded a region is rather
+    than on the total number of items.
+    """
+
+    def __init__(self, cell_size: float):
+        """Initialize spatial hash
+
+        Args:
+            cell_size: Edge length of a grid cell in pixels, ideally around
+                the size of the larger objects
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def clear(self):
+        """Remove every item"""
+        self._cells.clear()
+
+    def _cell_range(self, left: float, top: float, right: float, bottom: float):
+        """Inclusive cell coordinates covered by a box"""
+        size = self.cell_size
+        return (math.floor(left / size), math.floor(top / size),
+                math.floor(right / size), math.floor(bottom / size))
+
+    def insert(self, item: int, left: float, top: float, right: float, bottom: float):
+        """Add an item covering the box from (left, top) to (right, bottom)"""
+        x0, y0, x1, y1 = self._cell_range(left, top, right, bottom)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> List[int]:
+        """Items sharing a cell with the box, in ascending id order"""
+        x0, y0, x1, y1 = self._cell_range(left, top, right, bottom)
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            # Common case of a small box inside one cell
+            return sorted(cells.get((x0, y0), ()))
+
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
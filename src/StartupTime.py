@@ -0,0 +1,109 @@
+"""
+Startup Time
+============
+
+Measures how long a fresh process takes to become useful: for the game,
+from interpreter start to the first presented frame; for headless workers
+(--headless), to the first simulated match tick. Each run is a new Python
+process, so import and initialization costs are counted in full, and the
+median over several runs is checked against Config.STARTUP_BUDGET.
+
+The window is opened with the SDL dummy video driver unless --window is
+given, so the check also runs on machines without a display.
+
+Usage:
+    python -m src.StartupTime --runs 5
+    python -m src.StartupTime --headless
+Exits with status 1 if the median exceeds the budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict
+from .Config import Config
+
+# Runs in the child process, printing its phase timings once ready
+_WINDOW_CHILD = """
+import json, time
+start = time.perf_counter()
+from src.game import Game
+imported = time.perf_counter()
+game = Game()
+created = time.perf_counter()
+game.draw()
+ready = time.perf_counter()
+print(json.dumps({"import": imported - start, "init": created - imported, "first_frame": ready - created}), flush=True)
+"""
+
+_HEADLESS_CHILD = """
+import json, time
+start = time.perf_counter()
+from src.game import Game
+from src.Controller import BotController
+imported = time.perf_counter()
+game = Game(headless=True)
+game.start_match(BotController("Hard"), BotController("Hard"), seed=0)
+created = time.perf_counter()
+game.update(game.physics_dt)
+ready = time.perf_counter()
+print(json.dumps({"import": imported - start, "init": created - imported, "first_tick": ready - created}), flush=True)
+"""
+
+
+def measure_startup(headless: bool = False, window: bool = False) -> Dict[str, float]:
+    """Start one fresh process and time it until the first frame (or tick)
+
+    Args:
+        headless: Time a headless worker up to its first match tick
+        window: Use the real video driver instead of the dummy one
+
+    Returns:
+        Seconds per phase as reported by the child, plus "total" from
+        process start until the child reported it was ready
+    """
+    env = dict(os.environ)
+    if not window:
+        env["SDL_VIDEODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    start = time.perf_counter()
+    with subprocess.Popen([sys.executable, "-c", _HEADLESS_CHILD if headless else _WINDOW_CHILD],
+                          cwd=root, env=env, stdout=subprocess.PIPE, text=True) as child:
+        line = child.stdout.readline()
+        total = time.perf_counter() - start
+    if child.returncode != 0 or not line:
+        raise RuntimeError(f"Startup child exited with status {child.returncode}")
+
+    phases = json.loads(line)
+    phases["total"] = total
+    return phases
+
+
+def main():
+    """Command line entry"""
+    parser = argparse.ArgumentParser(description="Check process startup time against Config.STARTUP_BUDGET")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes to time")
+    parser.add_argument("--headless", action="store_true", help="time a headless worker up to its first tick")
+    parser.add_argument("--window", action="store_true", help="open a real window instead of the dummy driver")
+    args = parser.parse_args()
+
+    runs = [measure_startup(args.headless, args.window) for _ in range(args.runs)]
+    budget = Config.STARTUP_BUDGET
+    for phase in runs[0]:
+        median = statistics.median(run[phase] for run in runs)
+        print(f"{phase:<12} {median * 1000:8.1f} ms")
+    total = statistics.median(run["total"] for run in runs)
+    print(f"median of {args.runs} runs, budget {budget * 1000:.0f} ms")
+    if total > budget:
+        print("Over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Bot Tournament Runner
+=====================
+
+Plays many headless Bot-vs-Bot (and scripted-opponent) matches in parallel
+across all cores and reports how each difficulty level actually performs.
+
+Every pairing of the "Easy"/"Medium"/"Hard" bots (plus a scripted ball
+tracker on the left) is played at every speed boost level. The report lists
+win rates, rally lengths and the intercept accuracy each bot achieves
+(returns / balls it had to return), next to the accuracy advertised by
+Config.get_bot_difficulty_display_text.
+
+Usage:
+    python -m src.Tournament --matches 100 --workers 8
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from itertools import product
+from typing import Dict, List, Tuple
+from .game import Game
+from .Controller import Controller, BotController, ScriptedController
+from .Config import Config
+
+BOT_DIFFICULTIES = ["Easy", "Medium", "Hard"]
+TRACKER = "Tracker"  # Scripted opponent that follows the ball
+
+
+@dataclass
+class MatchResult:
+    """Outcome and rally statistics of one simulated match"""
+    left: str
+    right: str
+    speed: str
+    seed: int
+    scores: Tuple[int, int]
+    paddle_hits: Tuple[int, int]
+    rally_lengths: List[int]
+    ticks: int
+
+
+def track_ball(paddle, ball, dt: float) -> float:
+    """Scripted policy - move the paddle center towards the ball center"""
+    offset = (ball.position.y + ball.radius) - (paddle.position.y + paddle.height / 2)
+    return max(-1.0, min(1.0, offset / 50.0))
+
+
+def make_controller(name: str, physics_prediction: bool = False) -> Controller:
+    """Create the controller for a contestant name"""
+    if name == TRACKER:
+        return ScriptedController(track_ball)
+    return BotController(name, physics_prediction)
+
+
+def play_match(left: str, right: str, speed: str, seed: int, physics_prediction: bool = False,
+               dt: float = 1.0 / 120, max_ticks: int = 1_000_000) -> MatchResult:
+    """Play one headless match to the winning score
+
+    Args:
+        left: Contestant on the left ("Easy", "Medium", "Hard" or "Tracker")
+        right: Bot difficulty on the right
+        speed: Difficulty name selecting the ball speed boost
+        seed: Seed for the match randomness
+        physics_prediction: Bots use the InterceptPredictor
+        dt: Fixed simulation step in seconds
+        max_ticks: Safety limit on simulation steps
+    """
+    game = Game(headless=True)
+    game.start_match(make_controller(left, physics_prediction), make_controller(right, physics_prediction),
+                     selected_difficulty=game.difficulty_names.index(speed), seed=seed)
+
+    ticks = 0
+    while game.winner is None and ticks < max_ticks:
+        game.update(dt)
+        ticks += 1
+
+    return MatchResult(left, right, speed, seed, tuple(game.scores),
+                       tuple(game.paddle_hits), list(game.rally_lengths), ticks)
+
+
+def _play_match_task(task: Tuple[str, str, str, int, bool]) -> MatchResult:
+    """Process pool entry point (must be a module level function to pickle)"""
+    return play_match(*task)
+
+
+def build_tasks(matches: int, seed: int, physics_prediction: bool = False) -> List[Tuple[str, str, str, int, bool]]:
+    """Build one task per match for every pairing and speed boost level"""
+    tasks = []
+    contestants = BOT_DIFFICULTIES + [TRACKER]
+    for left, right, speed in product(contestants, BOT_DIFFICULTIES, BOT_DIFFICULTIES):
+        for _ in range(matches):
+            tasks.append((left, right, speed, seed + len(tasks), physics_prediction))
+    return tasks
+
+
+def run_tournament(matches: int = 20, workers: int = None, seed: int = 0,
+                   physics_prediction: bool = False) -> List[MatchResult]:
+    """Play all pairings in parallel and return the individual match results
+
+    Args:
+        matches: Matches per pairing and speed level
+        workers: Worker processes, defaults to all cores
+        seed: Base seed, match i uses seed + i
+        physics_prediction: Bots use the InterceptPredictor
+    """
+    tasks = build_tasks(matches, seed, physics_prediction)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [_play_match_task(task) for task in tasks]
+
+    # Matches are independent and similar in cost, so large chunks keep
+    # inter-process overhead low and scaling close to linear
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_play_match_task, tasks, chunksize=chunksize))
+
+
+def summarize(results: List[MatchResult]) -> Dict:
+    """Aggregate match results into per-pairing and per-difficulty statistics"""
+    pairings: Dict[Tuple[str, str, str], Dict] = {}
+    sides: Dict[str, Dict[str, int]] = {}
+
+    for result in results:
+        key = (result.left, result.right, result.speed)
+        entry = pairings.setdefault(key, {"matches": 0, "left_wins": 0, "rallies": 0, "hits": 0})
+        entry["matches"] += 1
+        entry["left_wins"] += result.scores[0] > result.scores[1]
+        entry["rallies"] += len(result.rally_lengths)
+        entry["hits"] += sum(result.rally_lengths)
+
+        # A side had to return every ball it hit plus every point it conceded
+        for name, hits, conceded in ((result.left, result.paddle_hits[0], result.scores[1]),
+                                     (result.right, result.paddle_hits[1], result.scores[0])):
+            stats = sides.setdefault(name, {"returns": 0, "chances": 0})
+            stats["returns"] += hits
+            stats["chances"] += hits + conceded
+
+    report = {"pairings": [], "accuracy": []}
+    for (left, right, speed), entry in sorted(pairings.items()):
+        report["pairings"].append({
+            "left": left,
+            "right": right,
+            "speed": speed,
+            "matches": entry["matches"],
+            "left_win_rate": entry["left_wins"] / entry["matches"],
+            "mean_rally_length": entry["hits"] / entry["rallies"] if entry["rallies"] else 0.0,
+        })
+    for name, stats in sorted(sides.items()):
+        report["accuracy"].append({
+            "contestant": name,
+            "measured": stats["returns"] / stats["chances"] if stats["chances"] else 0.0,
+            "advertised": Config.get_bot_accuracy(name) / 100 if name in BOT_DIFFICULTIES else None,
+        })
+    return report
+
+
+def format_report(report: Dict) -> str:
+    """Render the summary as a plain text table"""
+    lines = [f"{'LEFT':<8} {'RIGHT':<8} {'SPEED':<8} {'MATCHES':>7} {'LEFT WIN':>9} {'RALLY':>7}"]
+    for row in report["pairings"]:
+        lines.append(f"{row['left']:<8} {row['right']:<8} {row['speed']:<8} {row['matches']:>7} "
+                     f"{row['left_win_rate']:>8.1%} {row['mean_rally_length']:>7.2f}")
+
+    lines.append("")
+    lines.append(f"{'CONTESTANT':<10} {'MEASURED':>9} {'ADVERTISED':>11}")
+    for row in report["accuracy"]:
+        advertised = f"{row['advertised']:.0%}" if row["advertised"] is not None else "-"
+        lines.append(f"{row['contestant']:<10} {row['measured']:>8.1%} {advertised:>11}")
+    return "\n".join(lines)
+
+
+def main():
+    """Command line entry"""
+    parser = argparse.ArgumentParser(description="Play parallel Bot tournaments and report difficulty calibration")
+    parser.add_argument("--matches", type=int, default=20, help="matches per pairing and speed level")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--physics-prediction", action="store_true",
+                        help="bots predict intercepts by integrating the ball physics")
+    parser.add_argument("--json", metavar="PATH", help="also write the raw results and summary as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_tournament(args.matches, args.workers, args.seed, args.physics_prediction)
+    elapsed = time.perf_counter() - start
+
+    report = summarize(results)
+    print(format_report(report))
+    print(f"\n{len(results)} matches in {elapsed:.1f}s")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"summary": report, "matches": [asdict(r) for r in results]}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+from typing import Dict, Tuple
+import numpy as np
+from .BallBatch import BallBatch
+from .Paddle import Paddle
+from .Bot import Bot
+from .Config import Config
+
+class VecEnv:
+    """Batch of independent headless matches stepped together, Gym style
+
+    The left paddle of every match is driven by the agent with one
+    Paddle.INPUT_* code per match and step. The right paddle is either a
+    bot of the given difficulty or, with opponent=None, a second agent
+    (actions then have shape (num_envs, 2)).
+
+    Balls are a BallBatch and paddles and bots are struct-of-arrays
+    versions of Paddle.update and Bot.update_ai (linear prediction), in the
+    same order as Game.update. No pygame objects are created per match, so
+    one step costs a fixed number of NumPy calls whatever the batch size.
+
+    Matches that end are reset during the same step; their last scores are
+    returned in the info dict under "final_scores".
+    """
+
+    # Columns of the observation array
+    OBSERVATION_FIELDS = ("ball_x", "ball_y", "ball_vx", "ball_vy", "ball_spin",
+                          "left_y", "left_vy", "right_y", "right_vy",
+                          "left_score", "right_score")
+
+    def __init__(self, num_envs: int, opponent: str = "Medium", selected_difficulty: int = 1,
+                 winning_score: int = None, width: int = None, height: int = None,
+                 dt: float = None, seed: int = None):
+        """Initialize the batch
+
+        Args:
+            num_envs: Number of matches
+            opponent: "Easy", "Medium" or "Hard" bot on the right, None to
+                control both paddles
+            selected_difficulty: Index of the ball speed boost, as in Game.difficulty_levels
+            winning_score: Points to win a match, defaults to Config.WINNING_SCORE
+            width: Screen width, defaults to Config.SCREEN_WIDTH
+            height: Screen height, defaults to Config.SCREEN_HEIGHT
+            dt: Simulated seconds per step, defaults to one physics tick
+            seed: Seed for the serves and bot errors
+        """
+        self.num_envs = num_envs
+        self.width = width or Config.SCREEN_WIDTH
+        self.height = height or Config.SCREEN_HEIGHT
+        self.dt = dt or 1.0 / Config.PHYSICS_RATE
+        self.winning_score = winning_score or Config.WINNING_SCORE
+        self.speed_increase_factor = [Config.SPEED_BOOST_EASY, Config.SPEED_BOOST_MEDIUM,
+                                      Config.SPEED_BOOST_HARD][selected_difficulty]
+        self.opponent = opponent
+
+        # Paddle geometry, laid out as Player and Bot do
+        margin = 20
+        self.paddle_width = Config.PADDLE_WIDTH
+        self.paddle_height = Config.PADDLE_HEIGHT
+        self.paddle_x = (margin, self.width - margin - self.paddle_width)
+        self.paddle_start_y = (self.height - self.paddle_height) // 2
+        self.paddle_min_y = Config.WALL_THICKNESS
+        self.paddle_max_y = self.height - Config.WALL_THICKNESS - self.paddle_height
+        # Bots only ever accelerate up to their AI speed, so it is their speed limit
+        self.max_speed = np.full(2, float(Config.PADDLE_MAX_SPEED))
+        if opponent is not None:
+            self._configure_bot(opponent)
+
+        self.balls = BallBatch(num_envs, self.width // 2, self.height // 2, rng=np.random.default_rng(seed))
+        self.paddle_y = np.empty((num_envs, 2), dtype=np.float64)
+        self.paddle_vy = np.empty((num_envs, 2), dtype=np.float64)
+        self.scores = np.empty((num_envs, 2), dtype=np.int64)
+        self.paddle_hits = np.zeros((num_envs, 2), dtype=np.int64)
+        self.reaction_timer = np.empty(num_envs, dtype=np.float64)
+        self.target_y = np.empty(num_envs, dtype=np.float64)
+        self._reset_matches(np.ones(num_envs, dtype=bool))
+
+    def _configure_bot(self, difficulty: str):
+        """Bot settings of a difficulty, read from a Bot so they can't drift from it"""
+        bot = Bot("right", self.width, self.height, difficulty=difficulty)
+        if bot.difficulty != difficulty:
+            # Bot falls back to Medium for unknown names
+            raise ValueError("Opponent must be 'Easy', 'Medium', 'Hard' or None")
+        self.reaction_time = bot.reaction_time
+        self.prediction_accuracy = bot.prediction_accuracy
+        self.paddle_center_bias = bot.paddle_center_bias
+        self.max_speed[1] = bot.max_ai_speed
+        # Same arithmetic as Bot.update_ai so the error range matches
+        self.error_range = (1.0 - self.prediction_accuracy) * 100
+        self.error_modulus = int(self.error_range * 2)
+
+    def _reset_matches(self, mask: np.ndarray):
+        """Start new matches in the selected envs (see Game.start_match)"""
+        self.scores[mask] = 0
+        self.paddle_hits[mask] = 0
+        self.paddle_y[mask] = self.paddle_start_y
+        self.paddle_vy[mask] = 0.0
+        self.reaction_timer[mask] = 0.0
+        self.target_y[mask] = self.paddle_start_y + self.paddle_height / 2
+        self.balls.reset_balls(mask)
+
+    def reset(self, seed: int = None) -> np.ndarray:
+        """Start new matches in every env
+
+        Args:
+            seed: Optional new seed for the serves and bot errors
+
+        Returns:
+            Observations, shape (num_envs, len(OBSERVATION_FIELDS))
+        """
+        if seed is not None:
+            self.balls.rng = np.random.default_rng(seed)
+        self._reset_matches(np.ones(self.num_envs, dtype=bool))
+        return self.observe()
+
+    def observe(self) -> np.ndarray:
+        """Current state of every match as float32 rows of OBSERVATION_FIELDS"""
+        balls = self.balls
+        return np.column_stack((
+            balls.positions, balls.velocities, balls.angular_velocities,
+            self.paddle_y[:, 0], self.paddle_vy[:, 0], self.paddle_y[:, 1], self.paddle_vy[:, 1],
+            self.scores,
+        )).astype(np.float32)
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Advance every match by one tick
+
+        Args:
+            actions: Paddle.INPUT_NONE/UP/DOWN per match for the left paddle,
+                shape (num_envs,), or (num_envs, 2) for both paddles when
+                there is no bot opponent
+
+        Returns:
+            (observations, rewards, dones, info). Rewards are +1 when the
+            left side scored and -1 when the right side did, dones flag
+            matches that were won this step (and have been reset).
+        """
+        actions = np.asarray(actions)
+        if self.opponent is None:
+            inputs = actions.reshape(self.num_envs, 2)
+        else:
+            inputs = np.empty((self.num_envs, 2), dtype=np.int64)
+            inputs[:, 0] = actions
+            inputs[:, 1] = self._bot_inputs()
+        self._move_paddles(inputs)
+
+        # Ball flight with the wall speed boost, then paddle returns
+        balls = self.balls
+        balls.step(self.dt, self.height, Config.WALL_THICKNESS, self.speed_increase_factor)
+        for side in (0, 1):
+            hit = balls.collide_paddle(self.paddle_x[side], self.paddle_y[:, side], self.paddle_width,
+                                       self.paddle_height, self.paddle_vy[:, side])
+            balls.increase_speed(self.speed_increase_factor, hit)
+            self.paddle_hits[:, side] += hit
+
+        # Scoring, see Game._check_ball_off_screen: ball off the right edge is a point for the left
+        rewards = balls.off_screen(self.width).astype(np.float32)
+        self.scores[:, 0] += rewards > 0
+        self.scores[:, 1] += rewards < 0
+        dones = (self.scores >= self.winning_score).any(axis=1)
+        final_scores = self.scores.copy()
+        balls.reset_balls((rewards != 0) & ~dones)
+        if dones.any():
+            self._reset_matches(dones)
+        return self.observe(), rewards, dones, {"final_scores": final_scores}
+
+    def _move_paddles(self, inputs: np.ndarray):
+        """Paddle.update for every paddle from Paddle.INPUT_* codes, shape (num_envs, 2)"""
+        dt = self.dt
+        velocity = self.paddle_vy
+        direction = np.where(inputs == Paddle.INPUT_UP, -1.0, np.where(inputs == Paddle.INPUT_DOWN, 1.0, 0.0))
+
+        # Accelerate with input, otherwise decelerate and stop below 10 pixels per second
+        decelerated = velocity - np.sign(velocity) * (Config.PADDLE_DECELERATION * dt)
+        decelerated[np.abs(decelerated) < 10] = 0.0
+        new_velocity = np.where(direction != 0, velocity + direction * (Config.PADDLE_ACCELERATION * dt), decelerated)
+        np.clip(new_velocity, -self.max_speed, self.max_speed, out=new_velocity)
+
+        # Move and clamp to the walls, stopping at a boundary
+        new_y = self.paddle_y + new_velocity * dt
+        clamped = np.clip(new_y, self.paddle_min_y, self.paddle_max_y)
+        new_velocity[clamped != new_y] = 0.0
+
+        # Skipped paddles (bots waiting on their reaction time) are not updated at all
+        update = inputs != Paddle.INPUT_SKIP
+        self.paddle_y = np.where(update, clamped, self.paddle_y)
+        self.paddle_vy = np.where(update, new_velocity, velocity)
+
+    def _bot_inputs(self) -> np.ndarray:
+        """Bot.update_ai for the right paddles, as input codes"""
+        self.reaction_timer += self.dt
+        react = self.reaction_timer >= self.reaction_time
+
+        balls = self.balls
+        ball_x = balls.positions[:, 0]
+        ball_y = balls.positions[:, 1]
+        ball_vx = balls.velocities[:, 0]
+        current_center_y = self.paddle_y[:, 1] + self.paddle_height / 2
+
+        # Linear prediction where the ball reaches the paddle
+        paddle_center_x = self.paddle_x[1] + self.paddle_width / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            time_to_reach = np.where(ball_vx != 0, np.abs(ball_x - paddle_center_x) / np.abs(ball_vx), 0.0)
+        predicted_y = ball_y + balls.velocities[:, 1] * time_to_reach
+        if self.prediction_accuracy < 1.0:
+            predicted_y += balls.rng.integers(self.error_modulus, size=self.num_envs) - self.error_range
+
+        # Fold the prediction off the walls, all bounces at once
+        low = Config.WALL_THICKNESS
+        span = self.height - 2 * Config.WALL_THICKNESS
+        folded = np.mod(predicted_y - low, 2 * span)
+        predicted_y = low + np.where(folded > span, 2 * span - folded, folded)
+
+        # Track the ball coming in, otherwise drift back towards the center
+        centering = current_center_y + (self.height / 2 - current_center_y) * self.paddle_center_bias
+        target_y = np.where(ball_vx > 0, predicted_y, centering)
+        self.target_y = np.where(react, target_y, self.target_y)
+
+        # Movement with a 5 pixel deadzone; the input magnitude is normalized away
+        y_diff = self.target_y - current_center_y
+        codes = np.where(y_diff > 5, Paddle.INPUT_DOWN, np.where(y_diff < -5, Paddle.INPUT_UP, Paddle.INPUT_NONE))
+        codes[~react] = Paddle.INPUT_SKIP
+
+        # Periodic reaction reset
+        self.reaction_timer[self.reaction_timer > self.reaction_time * 2] = 0.0
+        return codes
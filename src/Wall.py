@@ -1,8 +1,10 @@
-import pygame
 from .GameObjectBase import GameObject
+from .Renderer import Renderer
 
 class Wall(GameObject):
     """The Wall that on top and bottom of the game."""
+    
+    __slots__ = ('color',)
 
     def __init__(self, x: float, y: float, width: float, height: float, color: str = "white"):
         # Walls are very heavy (effectively immovable)
@@ -13,9 +15,9 @@ class Wall(GameObject):
         """Update of the Wall - walls are static so nothing to update"""
         pass
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, renderer: Renderer):
         """Draw the wall"""
-        pygame.draw.rect(screen, self.color, self.get_rect())
+        renderer.fill(self.color, self.get_rect())
 
     def collide(self, other: 'GameObject'):
         """Handle collision - walls are static, collision response is handled by the other object"""
@@ -1 +1,2 @@
-from .game import Game
\ No newline at end of file
+from .game import Game, GameState
+from .Controller import Controller, KeyboardController, BotController, ScriptedController
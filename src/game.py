@@ -1,11 +1,22 @@
 import pygame
+import time
 from .Wall import Wall
 from .Player import Player
 from .Bot import Bot
 from .Ball import Ball
 from .GameUI import GameUI
+from .DirtyRectRenderer import DirtyRectRenderer
+from .PlayfieldLayer import PlayfieldLayer
+from .BallSpriteAtlas import BallSpriteAtlas
+from .FrameProfiler import FrameProfiler
+from .EntityRegistry import EntityRegistry
+from .MatchRandom import MatchRandom
+from .SimulationThread import SimulationThread, GameSnapshot
+from .Renderer import NULL_RENDERER, SurfaceRenderer, create_renderer
+from .Controller import Controller, KeyboardController, BotController
 from .Config import Config
 from enum import Enum
+from typing import Tuple
 
 class GameState(Enum):
     START_SCREEN = "start"
@@ -15,21 +26,74 @@ class GameState(Enum):
 
 class Game:
     """Main game class focused on game logic only"""
+    
+    # Slotted so thousands of concurrent headless matches stay compact
+    __slots__ = ('headless', 'width', 'height', 'renderer', 'clock', 'fps',
+                 'physics_rate', 'physics_dt', '_previous_positions', 'running', 'state',
+                 'is_single_player', 'bot', 'left_controller', 'right_controller',
+                 'dark_grey', 'white', 'scores', 'paddle_hits', 'rally_lengths', 'current_rally',
+                 'winning_score', 'winner', 'difficulty_levels', 'difficulty_names',
+                 'selected_difficulty', 'speed_increase_factor', 'ui', 'playfield',
+                 'dirty_renderer', 'ball_sprite_atlas', 'topWall', 'bottomWall',
+                 'playerLeft', 'playerRight', 'ball', 'recorder', 'profiler', 'profile_output', 'entities',
+                 'seed', 'rng', '_drawn_menu', '_warm_up', 'threaded')
 
-    def __init__(self, width: int = None, height: int = None, fps: int = 120):
-        """Game initialization"""
+    def __init__(self, width: int = None, height: int = None, fps: int = 120, headless: bool = False,
+                 physics_rate: int = None, dirty_rects: bool = False, ball_sprites: bool = False,
+                 profile_output: str = None, threaded: bool = False, render_scale: float = None,
+                 render_backend: str = None):
+        """Game initialization
+        
+        Args:
+            width: Screen width, defaults to Config.SCREEN_WIDTH
+            height: Screen height, defaults to Config.SCREEN_HEIGHT
+            fps: Frame rate cap for the windowed loop
+            headless: Build the game objects without opening a window; the
+                game is then stepped with run_headless() as fast as possible
+            physics_rate: Fixed physics steps per second, defaults to Config.PHYSICS_RATE
+            dirty_rects: During gameplay, redraw and update only the screen
+                areas that changed instead of filling and flipping every frame
+            ball_sprites: Draw the ball from a pre-rendered sprite atlas
+            profile_output: Profile every frame from the start and export the
+                phase timings to this .csv or .json path when the game exits
+            threaded: Run the physics on a SimulationThread and render its
+                snapshots, so slow frames don't delay physics steps (the
+                profiler then only times the render thread)
+            render_scale: Internal render resolution as a fraction of the
+                window, defaults to Config.RENDER_SCALE. Below 1.0 every
+                frame is drawn to a smaller off-screen surface and upscaled
+                to the window once; gameplay stays in logical units.
+            render_backend: "surface", "texture" or "texture_software" (see create_renderer),
+                defaults to Config.RENDER_BACKEND. Headless games always
+                draw with the shared NULL_RENDERER.
+        """
         # Use config values as defaults
         width = width or Config.SCREEN_WIDTH
         height = height or Config.SCREEN_HEIGHT
         
-        pygame.init()
-        self.screen = pygame.display.set_mode((width, height))
+        self.headless = headless
         self.width = width
         self.height = height
-        pygame.display.set_caption("Pong")
+        if headless:
+            # No display, fonts or event queue - simulation only
+            self.renderer = NULL_RENDERER
+        else:
+            # Only the subsystems the game uses; audio and joystick init is slow
+            pygame.display.init()
+            pygame.font.init()
+            self.renderer = create_renderer(render_backend or Config.RENDER_BACKEND, (width, height),
+                                            render_scale or Config.RENDER_SCALE)
         self.clock = pygame.time.Clock()
         self.fps = fps
+        
+        # Fixed timestep - physics runs at its own rate, draw interpolates between steps
+        self.physics_rate = physics_rate or Config.PHYSICS_RATE
+        self.physics_dt = 1.0 / self.physics_rate
+        self.threaded = threaded
+        self._previous_positions = []
         self.running = True
+        # What the menu on screen shows, so idle menus only redraw on changes
+        self._drawn_menu = None
         
         # Game state management
         self.state = GameState.START_SCREEN
@@ -38,10 +102,15 @@ class Game:
         self.is_single_player = False
         self.bot = None
         
+        # Input sources for each paddle (keyboard by default, see start_match)
+        self.left_controller: Controller = KeyboardController()
+        self.right_controller: Controller = KeyboardController()
+        
         # Game configuration from Config
         self.dark_grey = (64, 64, 64)
         self.white = (255, 255, 255)
         self.scores = [0, 0]  # [left_player_score, right_player_score]
+        self._reset_match_stats()
         self.winning_score = Config.WINNING_SCORE
         self.winner = None
         
@@ -52,7 +121,22 @@ class Game:
         self.speed_increase_factor = self.difficulty_levels[self.selected_difficulty]
         
         # Initialize UI and game objects
-        self.ui = GameUI(width, height)
+        self.ui = None if headless else GameUI(*self.renderer.get_size(), scale=self.renderer.scale)
+        self.playfield = None if headless else PlayfieldLayer(self.ui)
+        if dirty_rects and not headless and not isinstance(self.renderer, SurfaceRenderer):
+            raise ValueError("dirty_rects needs the 'surface' render backend")
+        self.dirty_renderer = DirtyRectRenderer() if dirty_rects and not headless else None
+        self.ball_sprite_atlas = BallSpriteAtlas() if ball_sprites and not headless else None
+        # Optional ReplayRecorder, attach before start_match to record matches
+        self.recorder = None
+        # Frame profiler, otherwise created the first time F3 shows the HUD
+        self.profile_output = profile_output
+        self.profiler = FrameProfiler(fps) if profile_output else None
+        # Screen preparation left for idle time once the first frame is up
+        self._warm_up = None if headless else self._warm_up_steps()
+        # Per-match randomness: the seed alone determines a match (see start_match)
+        self.seed = None
+        self.rng = MatchRandom()
         self._initialize_game_objects()
 
     def _initialize_game_objects(self):
@@ -66,16 +150,42 @@ class Game:
         # Initialize bot as None - will be created when single-player mode is selected
         self.bot = None
         
-        self.ball = Ball(self.width // 2, self.height // 2)
+        self.ball = Ball(self.width // 2, self.height // 2, rng=self.rng)
+        self.ball.sprite_atlas = self.ball_sprite_atlas
         
+        # Everything that moves or collides; arenas can add balls and obstacles to it
+        self.entities = EntityRegistry()
+        self.entities.add_ball(self.ball)
+        self.entities.set_paddles(self.playerLeft, self.playerRight)
 
     def handle_events(self) -> None:
         """Handle pygame events"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
+            self._handle_event(event)
+
+    def _handle_event(self, event: pygame.event.Event):
+        """Handle a single pygame event"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                self._toggle_profiler_hud()
+            else:
                 self._handle_keydown(event.key)
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            # Window contents were lost, idle menus must repaint
+            self._drawn_menu = None
+
+    def _toggle_profiler_hud(self):
+        """Show or hide the frame profiler overlay, starting the profiler if needed"""
+        if self.profiler is None:
+            self.profiler = FrameProfiler(self.fps)
+            # Time the rest of the current frame too
+            self.profiler.begin_frame()
+        self.profiler.hud_visible = not self.profiler.hud_visible
+        if self.dirty_renderer:
+            # The overlay area is only restored by a full redraw
+            self.dirty_renderer.invalidate()
 
     def _handle_keydown(self, key: int):
         """Handle keyboard input based on game state"""
@@ -123,23 +233,80 @@ class Game:
                 self.selected_difficulty = 2
                 self._update_speed_factor()
 
+    def _reset_match_stats(self):
+        """Reset per-match rally statistics"""
+        self.paddle_hits = [0, 0]  # Successful returns by [left, right]
+        self.rally_lengths = []  # Paddle hits in each finished point
+        self.current_rally = 0
+
     def _update_speed_factor(self):
         """Update speed increase factor based on selected difficulty"""
         self.speed_increase_factor = self.difficulty_levels[self.selected_difficulty]
 
     def _start_game(self):
         """Start a new game"""
-        self.state = GameState.PLAYING
-        self.scores = [0, 0]
-        self.winner = None
-        self.ball.reset_ball()
-        
         # Create bot if in single-player mode
         if self.is_single_player:
             difficulty_name = self.difficulty_names[self.selected_difficulty]
-            self.bot = Bot("right", self.width, self.height, difficulty=difficulty_name, color=Config.PADDLE_COLOR)
+            right_controller = BotController(difficulty_name)
+        else:
+            right_controller = KeyboardController()
+        self.start_match(KeyboardController(), right_controller)
+
+    def start_match(self, left_controller: Controller, right_controller: Controller, selected_difficulty: int = None,
+                    seed: int = None):
+        """Start a new game with the given input source for each paddle
+        
+        Args:
+            left_controller: Controller driving the left paddle
+            right_controller: Controller driving the right paddle
+            selected_difficulty: Optional index into difficulty_levels for the ball speed boost
+            seed: Optional 64-bit seed for the match randomness (ball
+                serves and bot errors), a random one is picked if omitted.
+                The seed used is kept in self.seed.
+        """
+        if seed is None:
+            seed = MatchRandom().next64()
+        self.seed = seed
+        # Serves use the main stream, each bot its own so replays (which
+        # don't run the bot AI) still draw the same serves
+        self.rng.seed(seed)
+        
+        if selected_difficulty is not None:
+            self.selected_difficulty = selected_difficulty
+            self._update_speed_factor()
+        
+        self.left_controller = left_controller
+        self.right_controller = right_controller
+        self.playerLeft = left_controller.create_paddle("left", self.width, self.height)
+        right_paddle = right_controller.create_paddle("right", self.width, self.height)
+        for stream, paddle in enumerate((self.playerLeft, right_paddle), start=1):
+            if isinstance(paddle, Bot):
+                paddle.rng.seed(seed, stream)
+                if paddle.predictor:
+                    # Simulate the ball exactly as update() will move it
+                    paddle.predictor.step = self.physics_dt
+                    paddle.predictor.speed_increase_factor = self.speed_increase_factor
+        
+        # A bot on the right means single-player rules (labels, winner names)
+        if isinstance(right_paddle, Bot):
+            self.is_single_player = True
+            self.bot = right_paddle
         else:
+            self.is_single_player = False
             self.bot = None
+            self.playerRight = right_paddle
+        self.entities.set_paddles(self.playerLeft, right_paddle)
+        
+        self.state = GameState.PLAYING
+        self.scores = [0, 0]
+        self._reset_match_stats()
+        self.winner = None
+        self.ball.reset_ball()
+        self._previous_positions = []
+        
+        if self.recorder is not None:
+            self.recorder.begin_match(self, seed)
 
     def _restart_game(self):
         """Restart the game from finish screen"""
@@ -153,108 +320,361 @@ class Game:
         """Update game logic"""
         if self.state != GameState.PLAYING:
             return
-            
-        keys = pygame.key.get_pressed()
         
+        # Each phase is charged to the frame profiler when one is running,
+        # unless physics runs on its own thread and frames are render only
+        profiler = None if self.threaded else self.profiler
+        if profiler is not None:
+            profiler.restart()
+            
         # Update game objects
         self.topWall.update(dt)
         self.bottomWall.update(dt)
+        if profiler is not None:
+            profiler.lap(FrameProfiler.WALLS)
         
-        # Update left player (always human)
-        self.playerLeft.keyListen(keys, dt)
-        
-        # Update right player or bot
-        if self.is_single_player and self.bot:
-            # Update bot AI
-            self.bot.update_ai(dt, self.ball)
-        else:
-            # Update human right player
-            self.playerRight.keyListen(keys, dt)
+        # Update paddles from their input sources (keyboard, bot AI or script)
+        self.left_controller.control(self.playerLeft, self.ball, dt)
+        if profiler is not None:
+            profiler.lap(FrameProfiler.LEFT_PADDLE)
+        self.right_controller.control(self.right_paddle, self.ball, dt)
+        if profiler is not None:
+            profiler.lap(FrameProfiler.RIGHT_PADDLE)
         
-        # Update ball and check for wall collisions
-        wall_hit = self.ball.update(dt, screen_height=self.height, wall_thickness=Config.WALL_THICKNESS)
-        if wall_hit:
-            self.ball.increase_speed(self.speed_increase_factor)
+        # Update balls and check for wall collisions
+        for ball in self.entities.balls:
+            wall_hit = ball.update(dt, screen_height=self.height, wall_thickness=Config.WALL_THICKNESS)
+            if wall_hit:
+                ball.increase_speed(self.speed_increase_factor)
+        if profiler is not None:
+            profiler.lap(FrameProfiler.BALL)
         
         # Handle game events
         self._handle_ball_collisions()
+        if profiler is not None:
+            profiler.lap(FrameProfiler.COLLISIONS)
         self._check_ball_off_screen()
+        if profiler is not None:
+            profiler.lap(FrameProfiler.SCORING)
+        
+        if self.recorder is not None:
+            self.recorder.record_tick(self, dt)
+            if profiler is not None:
+                profiler.lap(FrameProfiler.RECORDING)
 
     def _handle_ball_collisions(self):
-        """Handle collisions between ball and paddles"""
-        # Check collision with left player
-        if self.ball.collide(self.playerLeft):
-            self.ball.increase_speed(self.speed_increase_factor)
-        
-        # Check collision with right player or bot
-        if self.is_single_player and self.bot:
-            if self.ball.collide(self.bot):
-                self.ball.increase_speed(self.speed_increase_factor)
-        else:
-            if self.ball.collide(self.playerRight):
-                self.ball.increase_speed(self.speed_increase_factor)
+        """Handle collisions between balls and paddles (and any obstacles)"""
+        entities = self.entities
+        entities.update_broad_phase()
+        for ball in entities.balls:
+            # Left paddle, right paddle or bot, then extra colliders
+            for _, side in entities.collisions(ball):
+                if side is not None:
+                    # Paddle returns speed the ball up
+                    ball.increase_speed(self.speed_increase_factor)
+                    self._record_hit(side)
+
+    def _record_hit(self, side: int):
+        """Count a successful return by the given side (0 = left, 1 = right)"""
+        self.paddle_hits[side] += 1
+        self.current_rally += 1
 
     def _check_ball_off_screen(self):
-        """Check if ball went off screen and handle scoring"""
-        side = self.ball.is_off_screen(self.width)
-        if not side:
-            return
+        """Check if a ball went off screen and handle scoring"""
+        for ball in self.entities.balls:
+            side = ball.is_off_screen(self.width)
+            if not side:
+                continue
+                
+            self.rally_lengths.append(self.current_rally)
+            self.current_rally = 0
             
-        # Update scores
-        if side == "left":
-            self.scores[1] += 1  # Right player scores
-        elif side == "right":
-            self.scores[0] += 1  # Left player scores
-        
-        # Check for winner
-        if self.scores[0] >= self.winning_score:
-            self.winner = "Player" if self.is_single_player else "Left Player"
-            self.state = GameState.FINISH_SCREEN
-        elif self.scores[1] >= self.winning_score:
-            self.winner = "Bot" if self.is_single_player else "Right Player"
-            self.state = GameState.FINISH_SCREEN
-        else:
-            self.ball.reset_ball()
+            # Update scores
+            if side == "left":
+                self.scores[1] += 1  # Right player scores
+            elif side == "right":
+                self.scores[0] += 1  # Left player scores
+            
+            # Check for winner
+            if self.scores[0] >= self.winning_score:
+                self.winner = "Player" if self.is_single_player else "Left Player"
+                self.state = GameState.FINISH_SCREEN
+                return
+            elif self.scores[1] >= self.winning_score:
+                self.winner = "Bot" if self.is_single_player else "Right Player"
+                self.state = GameState.FINISH_SCREEN
+                return
+            
+            ball.reset_ball()
+            # Don't interpolate across the serve teleport
+            self._previous_positions = []
 
-    def draw(self) -> None:
-        """Draw based on current game state"""
+    @property
+    def right_paddle(self):
+        """The paddle currently playing on the right - the bot in single-player mode"""
+        if self.is_single_player and self.bot:
+            return self.bot
+        return self.playerRight
+
+    def _save_interpolation_state(self):
+        """Remember positions of moving objects before a physics step"""
+        self._previous_positions = [(obj, obj.position.copy()) for obj in self.entities.objects()]
+
+    def draw(self, alpha: float = 1.0, snapshots: Tuple[GameSnapshot, GameSnapshot] = None) -> None:
+        """Draw based on current game state
+        
+        Args:
+            alpha: Fraction of a physics step elapsed since the last update,
+                used to interpolate moving objects between their previous and
+                current positions (1.0 draws the current state)
+            snapshots: (previous, latest) GameSnapshots to draw gameplay from
+                instead of the live objects (threaded mode)
+        """
+        if self.headless:
+            return
+        
+        dirty_rects = None
+        if self.state != GameState.PLAYING and self.dirty_renderer:
+            # Menus repaint the whole screen, so gameplay must start from scratch
+            self.dirty_renderer.invalidate()
+        
         if self.state == GameState.START_SCREEN:
-            self.ui.draw_start_screen(self.screen, self.winning_score)
+            self.ui.draw_start_screen(self.renderer, self.winning_score)
         elif self.state == GameState.MODE_SELECTION:
-            self.ui.draw_mode_selection_screen(self.screen, self.is_single_player, self.selected_difficulty)
+            self.ui.draw_mode_selection_screen(self.renderer, self.is_single_player, self.selected_difficulty)
         elif self.state == GameState.PLAYING:
-            self._draw_game()
+            if snapshots is not None:
+                dirty_rects = self._draw_snapshots(snapshots, alpha)
+            else:
+                dirty_rects = self._draw_interpolated(alpha)
         elif self.state == GameState.FINISH_SCREEN:
-            self.ui.draw_finish_screen(self.screen, self.winner, self.scores, self.selected_difficulty, self.is_single_player)
+            self.ui.draw_finish_screen(self.renderer, self.winner, self.scores, self.selected_difficulty, self.is_single_player)
+        
+        profiler = self.profiler
+        if profiler is not None:
+            if profiler.hud_visible:
+                hud_rect = profiler.draw_hud(self.renderer)
+                if dirty_rects is not None:
+                    dirty_rects.append(hud_rect)
+            profiler.lap(FrameProfiler.DRAW)
+        
+        self.renderer.present(dirty_rects)
+        if profiler is not None:
+            profiler.lap(FrameProfiler.PRESENT)
+
+    def _draw_interpolated(self, alpha: float):
+        """Draw the game with moving objects blended between physics steps
         
-        pygame.display.flip()
+        Returns:
+            Changed screen areas from _draw_game, or None for a full redraw
+        """
+        current_positions = []
+        for obj, previous in self._previous_positions:
+            current_positions.append((obj, obj.position))
+            obj.position = previous.lerp(obj.position, alpha)
+        try:
+            return self._draw_game()
+        finally:
+            # Restore the simulated positions
+            for obj, position in current_positions:
+                obj.position = position
 
-    def _draw_game(self):
-        """Draw the main game screen"""
-        self.screen.fill(Config.BACKGROUND_COLOR)
+    def _draw_snapshots(self, snapshots: Tuple[GameSnapshot, GameSnapshot], alpha: float):
+        """Draw published snapshots with objects blended between the last two
+        
+        Returns:
+            Changed screen areas from _draw_game, or None for a full redraw
+        """
+        previous, latest = snapshots
+        objects = latest.objects
+        # Not across a serve teleport or a change of objects
+        if previous.scores == latest.scores and len(previous.objects) == len(objects):
+            objects = tuple(obj.detached_copy(before.position.lerp(obj.position, alpha))
+                            for before, obj in zip(previous.objects, objects))
+        return self._draw_game(objects, latest.scores, latest.is_single_player)
+
+    def _draw_game(self, objects=None, scores=None, is_single_player: bool = None):
+        """Draw the main game screen
+        
+        Args:
+            objects, scores, is_single_player: What to draw, defaults to
+                the live game (threaded mode passes a snapshot's)
+        
+        Returns:
+            Changed screen areas when the dirty rect renderer is active,
+            otherwise None (the whole screen was redrawn)
+        """
+        if objects is None:
+            objects = self.entities.objects()
+            scores = self.scores
+            is_single_player = self.is_single_player
+        renderer = self.renderer
+        if renderer.scale != 1.0:
+            objects = [obj.scaled_copy(renderer.scale) for obj in objects]
+        
+        if self.dirty_renderer:
+            return self.dirty_renderer.draw_game(self, objects, scores, is_single_player)
+        
+        # Static background, net and walls in one blit
+        self.playfield.draw(renderer, self.render_walls())
         
         # Draw UI elements
-        self.ui.draw_net(self.screen)
-        self.ui.draw_scores(self.screen, self.scores, self.is_single_player)
+        self.ui.draw_scores(renderer, scores, is_single_player)
         
-        # Draw game objects
-        self.topWall.draw(self.screen)
-        self.bottomWall.draw(self.screen)
-        self.playerLeft.draw(self.screen)
+        # Draw game objects: paddles (right player or bot), obstacles, then balls
+        for obj in objects:
+            obj.draw(renderer)
+
+    def render_walls(self) -> Tuple[Wall, Wall]:
+        """The walls as drawn by the renderer, scaled to the render resolution"""
+        scale = self.renderer.scale
+        if scale != 1.0:
+            return self.topWall.scaled_copy(scale), self.bottomWall.scaled_copy(scale)
+        return self.topWall, self.bottomWall
+
+    def run_headless(self, dt: float = None, max_ticks: int = None) -> str:
+        """Step the current match without a window or frame cap until it finishes
         
-        # Draw right player or bot
-        if self.is_single_player and self.bot:
-            self.bot.draw(self.screen)
-        else:
-            self.playerRight.draw(self.screen)
+        Args:
+            dt: Fixed simulation step in seconds, defaults to 1 / physics_rate
+            max_ticks: Optional safety limit on the number of steps
             
-        self.ball.draw(self.screen)
+        Returns:
+            The winner name, or None if max_ticks was reached first
+        """
+        dt = dt or self.physics_dt
+        ticks = 0
+        while self.state == GameState.PLAYING:
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            self.update(dt)
+            ticks += 1
+        return self.winner
 
     def run(self) -> None:
         """Main game loop"""
+        if self.headless:
+            self.run_headless()
+            return
+        if self.threaded:
+            self._run_threaded()
+            self._shut_down()
+            return
+        
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(self.fps) / 1000.0
+            if self.state != GameState.PLAYING:
+                self._run_idle_menu()
+                accumulator = 0.0
+                continue
+            # Anything drawn now covers the menu
+            self._drawn_menu = None
+            
+            # Cap long frames so a hitch doesn't trigger a burst of catch-up steps
+            frame_time = min(self.clock.tick(self.fps) / 1000.0, Config.MAX_FRAME_TIME)
+            accumulator += frame_time
+            profiler = self.profiler
+            if profiler is not None:
+                profiler.begin_frame()
             self.handle_events()
-            self.update(dt)
+            profiler = self.profiler  # F3 may have just started it
+            if profiler is not None:
+                profiler.lap(FrameProfiler.EVENTS)
+            
+            # Advance physics in fixed steps, carrying the remainder to the next frame
+            while accumulator >= self.physics_dt:
+                self._save_interpolation_state()
+                self.update(self.physics_dt)
+                accumulator -= self.physics_dt
+            
+            if profiler is not None:
+                profiler.restart()
+            self.draw(accumulator / self.physics_dt)
+            if profiler is not None:
+                profiler.end_frame()
+        
+        self._shut_down()
+
+    def _run_threaded(self):
+        """Main loop with physics on a SimulationThread
+        
+        This thread handles input and draws the latest published snapshot,
+        blended with the one before it by the time elapsed since it was taken.
+        """
+        simulation = SimulationThread(self)
+        simulation.start()
+        try:
+            while self.running:
+                if self.state != GameState.PLAYING:
+                    with simulation.lock:
+                        self._run_idle_menu()
+                        if self.state == GameState.PLAYING:
+                            # Don't show the last match's final snapshot
+                            simulation.reset()
+                    simulation.wake()
+                    continue
+                self._drawn_menu = None
+                
+                self.clock.tick(self.fps)
+                profiler = self.profiler
+                if profiler is not None:
+                    profiler.begin_frame()
+                with simulation.lock:
+                    self.handle_events()
+                profiler = self.profiler  # F3 may have just started it
+                if profiler is not None:
+                    profiler.lap(FrameProfiler.EVENTS)
+                
+                snapshots = simulation.buffer.read()
+                if snapshots is None:
+                    continue
+                alpha = min(1.0, (time.perf_counter() - snapshots[1].time) / self.physics_dt)
+                self.draw(alpha, snapshots)
+                if profiler is not None:
+                    profiler.end_frame()
+        finally:
+            simulation.stop()
+
+    def _shut_down(self):
+        """Export the frame profile if one was requested and close pygame"""
+        if self.profiler is not None and self.profile_output:
+            self.profiler.export(self.profile_output)
+        pygame.quit()
+
+    def _warm_up_steps(self):
+        """Render menu text, scores and the playfield ahead of use, one step at a time"""
+        yield from self.ui.warm_up(self.winning_score, ("Player", "Bot", "Left Player", "Right Player"))
+        self.playfield.get_surface(self.renderer, self.render_walls())
+        yield
+
+    def _run_idle_menu(self):
+        """One wake-up of the start, mode selection or finish screen
+        
+        Menus only change on input, so instead of drawing at the frame
+        rate this redraws when what the menu shows has changed and then
+        blocks until the next event (or Config.MENU_IDLE_TIMEOUT).
+        """
+        profiler = self.profiler
+        menu = (self.state, self.is_single_player, self.selected_difficulty,
+                profiler is not None and profiler.hud_visible)
+        if menu != self._drawn_menu:
             self.draw()
-        pygame.quit()
\ No newline at end of file
+            self._drawn_menu = menu
+        if profiler is not None:
+            # Menus aren't timed as frames
+            profiler.discard_frame()
+        
+        # Prepare later screens while nobody is pressing keys
+        if self._warm_up is not None:
+            for _ in self._warm_up:
+                if pygame.event.peek():
+                    break
+            else:
+                self._warm_up = None
+        
+        event = pygame.event.wait(int(Config.MENU_IDLE_TIMEOUT * 1000))
+        if event.type != pygame.NOEVENT:
+            self._handle_event(event)
+            self.handle_events()
+        # Restart frame timing so leaving the menu doesn't count the idle time as a frame
+        self.clock.tick()
\ No newline at end of file
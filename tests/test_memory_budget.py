@@ -0,0 +1,22 @@
+"""Per-match memory stays within Config.MATCH_MEMORY_BUDGET"""
+
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.MemoryBudget import TOLERANCE, measure_match_memory
+from src.Config import Config
+
+
+class MemoryBudgetTest(unittest.TestCase):
+    def test_match_within_budget(self):
+        # Smaller batches than the CLI default; fixed seeds keep the result the same every run
+        first, second = measure_match_memory(matches=50)
+        per_match = max(first, second)
+        self.assertLessEqual(abs(first - second) / per_match, TOLERANCE)
+        self.assertLessEqual(per_match * (1 + TOLERANCE), Config.MATCH_MEMORY_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Online mode over loopback with simulated latency, jitter and loss"""
+
+import asyncio
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.Online import NO_ACK, NetworkConditions, connect, serve
+from src.game import GameState
+from src.Controller import Controller
+from src.Paddle import Paddle
+from src.Player import Player
+from src.Config import Config
+
+MATCH_ID = 7
+MOVING_TICKS = 240  # Ticks of scripted up/down input, then the paddles come to rest
+CLIENT_TICKS = 360
+
+
+class ScriptedController(Controller):
+    """Holds up and down in turns, then lets go"""
+
+    def __init__(self, period: int = 30):
+        self.period = period
+        self.ticks = 0
+
+    def create_paddle(self, side: str, screen_width: int, screen_height: int) -> Paddle:
+        return Player(side, screen_width, screen_height, color=Config.PADDLE_COLOR)
+
+    def control(self, paddle: Paddle, ball, dt: float):
+        if self.ticks >= MOVING_TICKS:
+            code = Paddle.INPUT_NONE
+        elif (self.ticks // self.period) % 2:
+            code = Paddle.INPUT_DOWN
+        else:
+            code = Paddle.INPUT_UP
+        paddle.apply_input(dt, code)
+        self.ticks += 1
+
+
+def bad_network(seed: int) -> NetworkConditions:
+    """50-70 ms one way and 10% loss, seeded so every run drops the same packets"""
+    return NetworkConditions(latency=0.05, jitter=0.02, loss=0.1, seed=seed)
+
+
+class OnlineLoopbackTest(unittest.IsolatedAsyncioTestCase):
+    async def test_match_over_bad_network(self):
+        server = await serve("127.0.0.1", 0, bad_network(1))
+        port = server.transport.get_extra_info("sockname")[1]
+        clients = [await connect("127.0.0.1", port, MATCH_ID, ScriptedController(period), headless=True,
+                                 conditions=bad_network(2 + side))
+                   for side, period in enumerate((30, 45))]
+        try:
+            await asyncio.wait_for(asyncio.gather(*(client.run(max_ticks=CLIENT_TICKS) for client in clients)), 30)
+            # Let the last inputs and states cross the simulated network
+            await asyncio.sleep(0.5)
+
+            match = server.matches[MATCH_ID]
+            self.assertTrue(match.started)
+            # The server simulates the match and the clients follow it
+            self.assertGreater(match.tick, CLIENT_TICKS // 2)
+            for client in clients:
+                self.assertTrue(client.started)
+                self.assertGreater(client.last_state_tick, CLIENT_TICKS // 2)
+            self.assertEqual(match.game.state, GameState.PLAYING)
+
+            for client in clients:
+                controller = match.controllers[client.side]
+                server_paddle = match.game.playerLeft if client.side == 0 else match.game.playerRight
+                # Every input sent was acknowledged despite the losses (inputs
+                # go out every input_interval ticks, the last few may be unsent)
+                self.assertNotEqual(controller.applied, NO_ACK)
+                self.assertGreaterEqual(controller.applied, client.seq - client.input_interval)
+                self.assertLessEqual(len(client.pending), client.input_interval)
+                # The predicted paddle ends where the server has it
+                self.assertAlmostEqual(client.local_paddle.position.y, server_paddle.position.y, delta=1.0)
+                self.assertNotEqual(server_paddle.position.y, (Config.SCREEN_HEIGHT - server_paddle.height) / 2)
+        finally:
+            server.tick_task.cancel()
+            server.transport.close()
+            for client in clients:
+                client.transport.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+"""Process startup stays within Config.STARTUP_BUDGET"""
+
+import statistics
+import unittest
+
+from src.StartupTime import measure_startup
+from src.Config import Config
+
+RUNS = 3
+
+
+class StartupTimeTest(unittest.TestCase):
+    def _median_total(self, headless: bool) -> float:
+        return statistics.median(measure_startup(headless)["total"] for _ in range(RUNS))
+
+    def test_first_frame_within_budget(self):
+        self.assertLessEqual(self._median_total(headless=False), Config.STARTUP_BUDGET)
+
+    def test_first_headless_tick_within_budget(self):
+        self.assertLessEqual(self._median_total(headless=True), Config.STARTUP_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()